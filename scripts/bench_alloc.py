@@ -0,0 +1,71 @@
+# Allocation check for the frame loop: buffers allocated and transient bytes per KioskApp.step().
+#
+#   python scripts/bench_alloc.py
+#   python scripts/bench_alloc.py --frames 300 --render 1280x720
+import argparse
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)  # assets are loaded with relative paths
+
+from src.core import clock
+from src.core.buffers import get_buffers
+from src.main import KioskApp
+
+# (state, game mode): the screens a visitor walks through
+SCREENS = [("SAVER", None), ("MENU", None), ("INFO", None), ("GAME", None), ("GAME", "ARCADE"), ("GAME", "MAZE")]
+
+
+def _measure(app, camera_frame, vision, frames, sim_clock):
+    """(buffer allocations, mean / max transient KB) over `frames` steps."""
+    pool = get_buffers()
+    allocations = pool.stats["allocations"]
+    peaks = []
+    for _ in range(frames):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        app.step(camera_frame, vision)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        sim_clock.advance(1.0 / 30)
+    return pool.stats["allocations"] - allocations, sum(peaks) / len(peaks) / 1024.0, max(peaks) / 1024.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Allocations per frame in the render loop")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--camera", default="1280x720", help="camera frame size")
+    parser.add_argument("--render", help="internal render size (default: window size)")
+    args = parser.parse_args()
+
+    sim_clock = clock.ManualClock(start=1_000_000.0)
+    clock.set_clock(sim_clock)
+
+    cam_w, cam_h = (int(v) for v in args.camera.lower().split("x"))
+    render = tuple(int(v) for v in args.render.lower().split("x")) if args.render else None
+    app = KioskApp(screen_size=(1920, 1080), render_size=render)
+    camera_frame = np.random.RandomState(0).randint(0, 255, (cam_h, cam_w, 3), dtype=np.uint8)
+    vision = {
+        "gesture_data": {"cursor_detected": True, "x": 0.5, "y": 0.5, "gesture": None, "landmarks": None},
+        "face_present": True,
+        "is_new": False  # screens only draw: no transitions in the middle of a measurement
+    }
+
+    tracemalloc.start()
+    print(f"{'SCREEN':<14}{'NEW BUFFERS':>12}{'TRANSIENT KB/FRAME':>20}{'MAX KB':>10}")
+    for state, mode in SCREENS:
+        app.force_state(state, mode)
+        _measure(app, camera_frame, vision, 10, sim_clock)  # caches + buffers of this screen
+        allocations, mean_kb, max_kb = _measure(app, camera_frame, vision, args.frames, sim_clock)
+        print(f"{app.screen_name():<14}{allocations:>12}{mean_kb:>20.1f}{max_kb:>10.1f}")
+    tracemalloc.stop()
+
+    print("buffers:", {k: round(v, 1) if isinstance(v, float) else v for k, v in get_buffers().get_stats().items()})
+
+
+if __name__ == "__main__":
+    main()
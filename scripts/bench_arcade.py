@@ -0,0 +1,99 @@
+# Microbenchmark Arcade items: FallingItem objects in a list vs FallingItems (NumPy arrays, cached sprites).
+#
+#   python scripts/bench_arcade.py
+#   python scripts/bench_arcade.py --counts 10 200 1000 --frames 50
+import argparse
+import os
+import random
+import sys
+import time
+
+import cv2
+import numpy as np
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)  # assets are loaded with relative paths
+
+from src.ui.screens.arcade import ArcadeComponent, ITEM_STYLES, GOOD, TROLL, REFERENCE_HZ
+from src.ui.viewport import viewport, DESIGN_W, DESIGN_H
+
+
+class _ListItem:
+    """The old FallingItem: one object per item, two circles + putText per draw."""
+
+    def __init__(self, x, y, kind, text):
+        self.color, self.border, self.text_color, self.font_scale, self.radius, _ = ITEM_STYLES[kind]
+        self.x, self.y, self.kind, self.text = x, y, kind, text
+        self.speed = 0.5
+        self.collected = False
+
+    def draw(self, frame, vp):
+        draw_x, draw_y = int(self.x * vp.sx), int(self.y * vp.sy)
+        radius = int(self.radius * vp.s)
+        cv2.circle(frame, (draw_x, draw_y), radius, self.color, -1)
+        cv2.circle(frame, (draw_x, draw_y), radius, self.border, vp.thick(3))
+        font_scale, thickness = vp.font(self.font_scale), vp.thick(2)
+        ts = cv2.getTextSize(self.text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)[0]
+        cv2.putText(frame, self.text, (draw_x - ts[0] // 2, draw_y + ts[1] // 2),
+                    cv2.FONT_HERSHEY_SIMPLEX, font_scale, self.text_color, thickness)
+
+
+def _list_step(items, frame, vp, basket_px, basket_py):
+    for item in items:
+        item.y += item.speed
+        in_y_range = (item.y + item.radius >= basket_py - 20) and (item.y - item.radius <= basket_py + 40)
+        in_x_range = abs(item.x - basket_px) < (75 + item.radius)
+        if in_y_range and in_x_range and not item.collected:
+            item.collected = True
+    items[:] = [i for i in items if not i.collected and i.y < DESIGN_H + 100]
+    for item in items:
+        item.draw(frame, vp)
+
+
+def _spawn(count, arcade):
+    """Same random items for both versions, spread over the upper screen."""
+    rng = random.Random(0)
+    out = []
+    for _ in range(count):
+        kind = TROLL if rng.random() < 0.15 else GOOD
+        label = rng.randrange(len(arcade.labels[kind]))
+        out.append((rng.randint(70, DESIGN_W - 70), rng.uniform(0, DESIGN_H - 300), kind, label))
+    return out
+
+
+def _timed(step, frames):
+    step()  # first frame: sprite caches
+    start = time.perf_counter()
+    for _ in range(frames):
+        step()
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Arcade items: motion + hit test + draw per frame")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 500, 2000])
+    parser.add_argument("--frames", type=int, default=50)
+    args = parser.parse_args()
+
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    vp = viewport(frame)
+    arcade = ArcadeComponent()
+    cx = -1.0  # basket off screen: every item stays alive for the whole run
+
+    print(f"{'ITEMS':>8}{'LIST (ms)':>12}{'ARRAYS (ms)':>13}")
+    for count in args.counts:
+        spawned = _spawn(count, arcade)
+        items = [_ListItem(x, y, kind, arcade.labels[kind][label]) for x, y, kind, label in spawned]
+        list_ms = _timed(lambda: _list_step(items, frame, vp, int(cx * DESIGN_W), DESIGN_H - 100), args.frames)
+
+        arcade.items.clear()
+        for x, y, kind, label in spawned:
+            arcade.items.add(x, y, 0.5 * REFERENCE_HZ, ITEM_STYLES[kind][4], kind, label)
+        array_ms = _timed(lambda: (arcade._update_items(cx, 1.0 / REFERENCE_HZ), arcade._draw_items(frame, vp)),
+                          args.frames)
+        print(f"{count:>8}{list_ms:>12.2f}{array_ms:>13.2f}   ({list_ms / array_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
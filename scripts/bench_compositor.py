@@ -0,0 +1,83 @@
+# Microbenchmark compositor: per-channel float blend (old overlay helpers) vs premultiplied blit.
+#
+#   python scripts/bench_compositor.py
+#   python scripts/bench_compositor.py --frames 300 --particles 65
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from src.ui.compositor import blit_image
+
+
+def _overlay_float(bg, overlay, x, y):
+    """The old per-screen helper (menu / game / screensaver), kept here as the reference."""
+    bg_h, bg_w = bg.shape[:2]
+    ov_h, ov_w = overlay.shape[:2]
+    x1, y1 = max(0, x), max(0, y)
+    x2, y2 = min(bg_w, x + ov_w), min(bg_h, y + ov_h)
+    if x1 >= x2 or y1 >= y2: return
+    bg_crop = bg[y1:y2, x1:x2]
+    ov_crop = overlay[y1 - y:y2 - y, x1 - x:x2 - x]
+    alpha = ov_crop[:, :, 3] / 255.0
+    for c in range(3):
+        bg_crop[:, :, c] = alpha * ov_crop[:, :, c] + (1.0 - alpha) * bg_crop[:, :, c]
+
+
+def _sprite(size, rng):
+    """Random BGRA sprite with a soft round alpha (like the bubble / particle PNGs)."""
+    img = rng.integers(0, 256, (size, size, 4), dtype=np.uint8)
+    yy, xx = np.mgrid[:size, :size]
+    dist = np.hypot(xx - size / 2, yy - size / 2) / (size / 2)
+    img[:, :, 3] = (np.clip(1.0 - dist, 0.0, 1.0) * 255).astype(np.uint8)
+    return img
+
+
+def _scene(blend, frame, items):
+    for img, x, y in items:
+        blend(frame, img, x, y)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sprite compositing cost per frame")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--particles", type=int, default=65)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+    bubble, particle, logo = _sprite(460, rng), _sprite(30, rng), _sprite(300, rng)
+
+    scenes = {
+        "bubble x3 (menu)": [(bubble, 150 + i * 600, 100) for i in range(3)],
+        f"particles x{args.particles} (saver)": [(particle, int(x), int(y)) for x, y in
+                                                 zip(rng.integers(-15, 1920, args.particles),
+                                                     rng.integers(-15, 1080, args.particles))],
+        "logo (saver / info)": [(logo, 810, 50)],
+    }
+
+    print(f"{'scene':<26}{'float ms':>10}{'blit ms':>10}{'speedup':>9}{'max diff':>10}")
+    for name, items in scenes.items():
+        ref, out = base.copy(), base.copy()
+        _scene(_overlay_float, ref, items)
+        _scene(blit_image, out, items)
+        max_diff = int(np.abs(ref.astype(np.int16) - out).max())
+
+        timings = []
+        for blend in (_overlay_float, blit_image):
+            frame = base.copy()
+            start = time.perf_counter()
+            for _ in range(args.frames):
+                _scene(blend, frame, items)
+            timings.append((time.perf_counter() - start) * 1000.0 / args.frames)
+        print(f"{name:<26}{timings[0]:>10.3f}{timings[1]:>10.3f}{timings[0] / timings[1]:>8.1f}x{max_diff:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# Microbenchmark EventBus: cost of publish + dispatch per event and of an empty dispatch per frame.
+#
+#   python scripts/bench_event_bus.py
+#   python scripts/bench_event_bus.py --events 200000 --handlers 4
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from src.core.event_bus import EventBus, TransitionEvent, GameFinished
+
+
+class _Listener:
+    def __init__(self):
+        self.count = 0
+
+    def on_event(self, event):
+        self.count += 1
+
+
+def _timed(fn, n):
+    start = time.perf_counter()
+    fn(n)
+    return (time.perf_counter() - start) * 1e9 / n  # ns / op
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EventBus dispatch cost")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--handlers", type=int, default=2, help="subscribers per event type")
+    args = parser.parse_args()
+
+    bus = EventBus()
+    listeners = [_Listener() for _ in range(args.handlers)]
+    for listener in listeners:
+        bus.subscribe(GameFinished, listener.on_event)
+    event = GameFinished("ARCADE", 10)
+
+    def publish_only(n):
+        for _ in range(n):
+            bus.publish(event)
+        bus.clear()
+
+    def publish_dispatch(n):
+        for _ in range(n):
+            bus.publish(event)
+        bus.dispatch()
+
+    def empty_dispatch(n):
+        # The common frame: nothing happened
+        for _ in range(n):
+            bus.dispatch()
+
+    def create_event(n):
+        for _ in range(n):
+            TransitionEvent("MENU")
+
+    # Baseline: what the main loop did before (poll a flag every frame)
+    class _Game:
+        active = True
+    game = _Game()
+
+    def poll_flag(n):
+        for _ in range(n):
+            if not game.active:
+                pass
+
+    n = args.events
+    results = [
+        ("create event (__slots__)", _timed(create_event, n)),
+        ("publish", _timed(publish_only, n)),
+        (f"publish + dispatch ({args.handlers} handlers)", _timed(publish_dispatch, n)),
+        ("empty dispatch (per frame)", _timed(empty_dispatch, n)),
+        ("poll attribute (old per-frame check)", _timed(poll_flag, n)),
+    ]
+    for name, ns in results:
+        print(f"{name:<40}{ns:10.1f} ns")
+    print(f"Delivered: {sum(l.count for l in listeners)}  stats: {bus.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
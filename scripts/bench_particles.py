@@ -0,0 +1,69 @@
+# Microbenchmark screensaver particles: per-particle lists + blit vs ParticleField (NumPy arrays, batched blit).
+#
+#   python scripts/bench_particles.py
+#   python scripts/bench_particles.py --counts 65 1000 5000 --frames 50
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)  # assets are loaded with relative paths
+
+from src.core.assets import get_assets
+from src.ui.compositor import blit_image, sprite_of
+from src.ui.particles import ParticleField
+
+
+def _list_particles(count):
+    """The old screensaver state: [x, y, speed] per particle."""
+    return [[random.random(), random.random(), random.uniform(0.003, 0.01)] for _ in range(count)]
+
+
+def _list_step(particles, frame, img):
+    h, w = frame.shape[:2]
+    for p in particles:
+        p[1] += p[2]
+        if p[1] > 1.05:
+            p[1] = -0.05
+            p[0] = random.random()
+    for nx, ny, _ in particles:
+        blit_image(frame, img, int(nx * w), int(ny * h))
+
+
+def _timed(step, frames):
+    step()  # first frame: sprite / tile caches
+    start = time.perf_counter()
+    for _ in range(frames):
+        step()
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Screensaver particles: update + draw per frame")
+    parser.add_argument("--counts", type=int, nargs="+", default=[65, 500, 2000, 5000])
+    parser.add_argument("--frames", type=int, default=50)
+    args = parser.parse_args()
+
+    img = get_assets().variant("aciee_logo.jpeg", (30, 30))
+    if img is None:
+        img = np.random.default_rng(0).integers(0, 256, (30, 30, 3), dtype=np.uint8)
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+    print(f"{'PARTICLES':>10}{'LISTS (ms)':>12}{'ARRAYS (ms)':>13}")
+    for count in args.counts:
+        particles = _list_particles(count)
+        list_ms = _timed(lambda: _list_step(particles, frame, img), args.frames)
+
+        field = ParticleField(count)
+        sprites = [sprite_of(img)]
+        array_ms = _timed(lambda: (field.update(), field.draw(frame, sprites)), args.frames)
+        print(f"{count:>10}{list_ms:>12.2f}{array_ms:>13.2f}   ({list_ms / array_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
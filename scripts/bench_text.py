@@ -0,0 +1,74 @@
+# Microbenchmark text cache: InfoHub detail pages drawn with cv2.putText vs the cached text masks.
+# The text cost is the frame time minus a run with the text calls skipped.
+#
+#   python scripts/bench_text.py
+#   python scripts/bench_text.py --frames 100
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from src.ui.screens import info_hub
+from src.ui.screens.info_hub import InfoHub
+from src.ui.text_cache import get_text_cache
+
+
+def _plain_put_text(frame, text, org, font, scale, color, thickness=1, line_type=cv2.LINE_8, shadow=None):
+    """What the screens did before the cache: one putText per layer, every frame."""
+    if shadow is not None:
+        s_thickness = shadow[3] if len(shadow) > 3 else thickness
+        cv2.putText(frame, text, (org[0] + shadow[0], org[1] + shadow[1]), font, scale, shadow[2], s_thickness, line_type)
+    cv2.putText(frame, text, org, font, scale, color, thickness, line_type)
+    return frame
+
+
+def _no_text(frame, *args, **kwargs):
+    return frame
+
+
+def _draw_pages(hub, frame, frames):
+    """ms per frame, averaged over every detail page."""
+    total, count = 0.0, 0
+    for spec, info in hub.specializations.items():
+        for page in range(info["pages"]):
+            hub.active_spec, hub.current_page = spec, page
+            hub.draw(frame)  # first frame of a page: cache misses, not timed
+            start = time.perf_counter()
+            for _ in range(frames):
+                hub.draw(frame)
+            total += time.perf_counter() - start
+            count += frames
+    return total * 1000.0 / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-frame text cost on the INFO detail pages")
+    parser.add_argument("--frames", type=int, default=50)
+    args = parser.parse_args()
+
+    hub = InfoHub()
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+    cached = info_hub.put_text
+    info_hub.put_text = _no_text
+    base_ms = _draw_pages(hub, frame, args.frames)
+    info_hub.put_text = _plain_put_text
+    plain_ms = _draw_pages(hub, frame, args.frames)
+    info_hub.put_text = cached
+    cached_ms = _draw_pages(hub, frame, args.frames)
+
+    plain_text, cached_text = plain_ms - base_ms, cached_ms - base_ms
+    print(f"INFO detail frame: putText {plain_ms:.2f} ms   text cache {cached_ms:.2f} ms   ({plain_ms / cached_ms:.2f}x)")
+    print(f"  text only:       putText {plain_text:.2f} ms   text cache {cached_text:.2f} ms   "
+          f"({plain_text / max(cached_text, 1e-6):.1f}x; rest of the frame {base_ms:.2f} ms)")
+    print("text cache:", {k: round(v, 3) if isinstance(v, float) else v for k, v in get_text_cache().get_stats().items()})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# Headless benchmark: ruleaza kiosk-ul pe un video / folder de imagini, fara fereastra.
+#
+#   python scripts/benchmark.py --source recording.mp4
+#   python scripts/benchmark.py --source frames/ --scenario flow.json --out report.json
+import argparse
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)  # assets are loaded with relative paths
+
+from src.core.benchmark import HeadlessBenchmark
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless kiosk benchmark")
+    parser.add_argument("--source", required=True, help="video file, image folder or glob")
+    parser.add_argument("--scenario", help="JSON file with the scripted flow (default: SAVER->MENU->INFO->GAME)")
+    parser.add_argument("--fps", type=float, default=30.0, help="simulated camera FPS (app clock step)")
+    parser.add_argument("--size", default="1920x1080", help="window size, ex: 1280x720")
+    parser.add_argument("--render", help="internal render size, ex: 1280x720 (default: window size)")
+    parser.add_argument("--out", help="save the report as JSON")
+    args = parser.parse_args()
+
+    scenario = None
+    if args.scenario:
+        with open(args.scenario) as f:
+            scenario = json.load(f)
+
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    render = tuple(int(v) for v in args.render.lower().split("x")) if args.render else None
+    bench = HeadlessBenchmark(args.source, scenario=scenario, fps=args.fps, screen_size=size, render_size=render)
+    report = bench.run()
+
+    HeadlessBenchmark.print_report(report)
+    if args.out:
+        HeadlessBenchmark.save_report(report, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Reda un trace de gesturi prin ecranele UI (fara camera / MediaPipe).
+#
+# Inregistrare trace (kiosk live):  KIOSK_TRACE_RECORD=trace.jsonl python main_app.py
+#   python scripts/replay_trace.py --trace trace.jsonl --screen all --out ui.json
+#   python scripts/replay_trace.py --trace trace.jsonl --screen ARCADE --baseline ui.json
+import argparse
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)  # assets are loaded with relative paths
+
+# Replays must not depend on Gemini answers -> always the offline fallbacks
+# (empty, not removed: load_dotenv never overrides an existing variable)
+os.environ["GEMINI_API_KEY"] = ""
+
+from src.core.trace_replay import TraceReplay, REPLAY_SCREENS, compare_reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UI-only replay of a gesture trace")
+    parser.add_argument("--trace", required=True)
+    parser.add_argument("--screen", default="all", choices=["all"] + list(REPLAY_SCREENS.keys()))
+    parser.add_argument("--speed", type=float, default=0.0, help="0 = as fast as possible, N = N x real time")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--size", default="1920x1080", help="render size, ex: 1280x720")
+    parser.add_argument("--out", help="save the reports as JSON")
+    parser.add_argument("--baseline", help="compare against a saved JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed p95 slowdown vs baseline (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    names = list(REPLAY_SCREENS.keys()) if args.screen == "all" else [args.screen]
+    reports = {}
+    for name in names:
+        report = TraceReplay(args.trace, name, speed=args.speed, seed=args.seed, frame_size=size).run()
+        reports[name] = report
+        draw = report["stages"].get("draw", {})
+        update = report["stages"].get("update", {})
+        print(f"{name:<8} frames={report['frames']:<6} x{report['speedup']:.1f} real time  "
+              f"update p95={update.get('p95', 0):.2f} ms  draw p50={draw.get('p50', 0):.2f} "
+              f"p95={draw.get('p95', 0):.2f} ms  checksum={report['checksum']}")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(reports, f, indent=2)
+        print(f"Saved to {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        problems = []
+        for name, report in reports.items():
+            if name in baseline:
+                problems += compare_reports(report, baseline[name], args.tolerance)
+        for p in problems:
+            print("REGRESSION:", p)
+        if problems:
+            sys.exit(1)
+        print("No regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# src/config.py
+# Setari comune pentru pipeline-ul de viziune / randare
+import os
+
+# --- VISION ---
+# Size (w, h) of the single RGB buffer shared by every vision model.
+# Camera frames are mirrored and stretched to this size exactly like the
+# display frame, so normalized (0.0 - 1.0) results map 1:1 onto the screen.
+INFERENCE_SIZE = (640, 360)
+
+# Face detection cadence: "always", "every_n" or "no_hand".
+# Between MediaPipe passes the face box is followed by a cheap OpenCV tracker.
+FACE_DETECT_MODE = "every_n"
+FACE_DETECT_STRIDE = 5
+
+# CPU budget (ms) for all vision models on one inference frame.
+# When exceeded, the least needed model is deferred to the next frame.
+VISION_BUDGET_MS = 30.0
+
+# The Full Hands model (quality tier ULTRA) costs about this many times the Lite
+# one; it is only switched on while that estimate, plus face detection, fits
+# VISION_BUDGET_MS (measured on the vision worker, not on the render loop).
+HANDS_FULL_COST_RATIO = 2.0
+
+# --- DISPLAY ---
+def _size(value, default):
+    """'1280x720' -> (1280, 720); default when unset."""
+    if not value:
+        return default
+    w, h = value.lower().split("x")
+    return int(w), int(h)
+
+# Layout space every screen is written in (src/ui/viewport.py maps it to pixels)
+DESIGN_SIZE = (1920, 1080)
+# Window / panel size; the final frame is presented at this size (4K: "3840x2160")
+WINDOW_SIZE = _size(os.getenv("KIOSK_WINDOW"), (1920, 1080))
+# Internal render resolution, None = native (window size). Weak kiosks: "1280x720".
+# The QualityGovernor's render_scale is applied on top of it.
+RENDER_SIZE = _size(os.getenv("KIOSK_RENDER"), None)
+
+# --- PERFORMANCE INSTRUMENTATION ---
+# Rolling window (frames) for the p50/p95/p99 stage timers. Toggle the HUD with 'p'.
+PERF_WINDOW = 300
+# If set, per-stage stats are written to this JSON file on exit.
+PERF_DUMP_PATH = os.getenv("KIOSK_PERF_DUMP")
+
+# --- GESTURE TRACE ---
+# Records every new gesture result to a JSON-lines trace (replay: scripts/replay_trace.py)
+TRACE_RECORD_PATH = os.getenv("KIOSK_TRACE_RECORD")
+TRACE_RECORD_LANDMARKS = False  # landmarks make the trace ~20x bigger
+
+# --- ASSETS ---
+# Memory budget for resized image variants (LRU eviction beyond it)
+ASSET_CACHE_MB = 64
+# Animated scales (pulsing bubbles) are rounded to this step -> few cached sizes
+ASSET_SCALE_STEP = 0.02
+# Rendered text masks kept by src/ui/text_cache.py (LRU, 1 byte per pixel and color)
+TEXT_CACHE_MB = 4
+# Memoized cv2.getTextSize results (src/ui/text_cache.py)
+TEXT_SIZE_ENTRIES = 1024
+# Memoized line breaks / fitted font scales (src/ui/text_layout.py)
+TEXT_LAYOUT_ENTRIES = 256
+# Gradient tiles for panels / buttons (src/ui/gradients.py)
+GRADIENT_CACHE_ENTRIES = 64
+
+# --- SCREENSAVER ---
+# Falling ACIEE-logo particles (NumPy arrays + batched compositing, thousands are fine)
+SAVER_PARTICLES = 65
+
+# --- ARCADE ---
+# Difficulty (KIOSK_ARCADE_LEVEL): spawn delay at score 0 and its floor (s),
+# items per spawn, troll chance. Items are NumPy arrays drawn from cached
+# sprites, so the dense levels stay at 60 FPS.
+ARCADE_LEVELS = {
+    "normal": {"spawn_delay": 0.9, "min_delay": 0.4, "burst": 1, "troll_chance": 0.15},
+    "hard":   {"spawn_delay": 0.6, "min_delay": 0.2, "burst": 2, "troll_chance": 0.2},
+    "insane": {"spawn_delay": 0.35, "min_delay": 0.1, "burst": 4, "troll_chance": 0.25},
+}
+ARCADE_LEVEL = os.getenv("KIOSK_ARCADE_LEVEL", "normal")
+# Arcade simulation steps per second, independent of the render FPS, and the
+# most steps run in one frame to catch up after a stall (the rest is dropped)
+ARCADE_TICK_HZ = 60
+ARCADE_MAX_TICKS = 8
@@ -1,7 +1,6 @@
 import os
 import json
-import google.generativeai as genai
-from dotenv import load_dotenv
+import threading
 from pathlib import Path
 import time
 
@@ -9,11 +8,39 @@ import time
 CURRENT_DIR = Path(__file__).resolve().parent
 ROOT_DIR = CURRENT_DIR.parent.parent
 ENV_PATH = ROOT_DIR / ".env"
-loaded = load_dotenv(ENV_PATH)
+
+# dotenv / google.generativeai se importa la prima folosire (pornire rapida):
+# genai doar cand chiar trimitem un request, pe thread-ul de incarcare
+_env_loaded = False
+_genai = None
+_genai_lock = threading.Lock()
+
+
+def _load_env():
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv(ENV_PATH)
+        _env_loaded = True
+
+
+def _get_genai(api_key):
+    global _genai
+    with _genai_lock:
+        if _genai is None:
+            import google.generativeai as genai
+            try:
+                genai.configure(api_key=api_key)
+            except Exception as e:
+                print(f"❌ Eroare configurare genai: {e}")
+            _genai = genai
+    return _genai
+
 
 class AIGenerator:
     def __init__(self):
-        self.api_key = os.getenv("GEMINI_API_KEY")
+        # Cheia se citeste din .env la primul request (_call_gemini), nu la pornire
+        self.api_key = None
         
         # Modele candidate
         self.candidate_models = [
@@ -24,12 +51,6 @@ class AIGenerator:
             "gemini-pro"
         ]
 
-        if self.api_key:
-            try:
-                genai.configure(api_key=self.api_key)
-            except Exception as e:
-                print(f"❌ Eroare configurare genai: {e}")
-
     def get_fallback_questions(self):
         # ... (păstrează codul existent pentru quiz) ...
         return [
@@ -87,6 +108,9 @@ class AIGenerator:
         return self._call_gemini(prompt, self.get_fallback_maze, min_items=11)
 
     def _call_gemini(self, prompt, fallback_func, min_items=1):
+        _load_env()
+        self.api_key = os.getenv("GEMINI_API_KEY")
+        genai = _get_genai(self.api_key)
         for model_name in self.candidate_models:
             try:
                 config = {}
@@ -0,0 +1,80 @@
+# src/core/app_state.py
+import threading
+
+from src.core.ai_generator import AIGenerator
+from src.ui.screens.screensaver import Screensaver
+from src.ui.screens.menu import MenuController
+from src.ui.screens.game import QuizGame
+from src.ui.screens.info_hub import InfoHub
+
+
+class AppState:
+    """
+    Pool of kiosk screens: every screen is built ONCE (images read from disk,
+    AI generator configured) and reset() on re-entry.
+    Heavy screens are built in the background while the screensaver is up,
+    so the first menu transition doesn't hitch.
+    One AIGenerator is shared by all games.
+    """
+
+    def __init__(self, face_detector):
+        self.ai_generator = AIGenerator()
+
+        # Needed from the first frame
+        self.saver = Screensaver(face_detector)
+        self.menu = MenuController()
+
+        # Built lazily / by prewarm()
+        self._builders = {
+            "INFO": InfoHub,
+            "GAME": lambda: QuizGame(self.ai_generator)
+        }
+        self._screens = {}
+        self._build_lock = threading.Lock()
+        self.warm_thread = None
+        self.stats = {"built": 0, "built_on_demand": 0, "resets": 0}
+
+    def is_ready(self, name):
+        return name in self._screens
+
+    def get(self, name):
+        """The pooled screen (built now if the warm-up didn't get to it yet)."""
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = self._build(name, on_demand=True)
+        return screen
+
+    def enter(self, name):
+        """Screen for a new visit: same instance, fresh state."""
+        screen = self.get(name)
+        screen.reset()
+        self.stats["resets"] += 1
+        return screen
+
+    def prewarm(self):
+        """Builds the missing screens on a background thread (no-op once everything is built)."""
+        if len(self._screens) == len(self._builders):
+            return
+        if self.warm_thread is not None and self.warm_thread.is_alive():
+            return
+        self.warm_thread = threading.Thread(target=self._prewarm_task)
+        self.warm_thread.daemon = True
+        self.warm_thread.start()
+
+    def _prewarm_task(self):
+        for name in self._builders:
+            self._build(name)
+
+    def _build(self, name, on_demand=False):
+        with self._build_lock:
+            screen = self._screens.get(name)
+            if screen is None:
+                screen = self._builders[name]()
+                self._screens[name] = screen
+                self.stats["built"] += 1
+                if on_demand:
+                    self.stats["built_on_demand"] += 1
+            return screen
+
+    def get_stats(self):
+        return dict(self.stats, ready=sorted(self._screens.keys()))
@@ -0,0 +1,218 @@
+# src/core/assets.py
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+
+import cv2
+
+from src import config
+
+ASSETS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "assets", "images"))
+
+# IMREAD_REDUCED_* decode directly at 1/2, 1/4, 1/8 (JPEG: DCT scaling, much cheaper)
+_REDUCED_FLAGS = {
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+def _probe(path):
+    """(width, height, has_alpha) from the PNG / JPEG header, None if unknown. Reads a few bytes."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(32)
+            if head[:8] == b"\x89PNG\r\n\x1a\n":
+                w, h = struct.unpack(">II", head[16:24])
+                color_type = head[25]
+                # 4/6 = gray/RGB + alpha, 3 = palette (may carry tRNS)
+                return w, h, color_type in (3, 4, 6)
+            if head[:2] == b"\xff\xd8":
+                f.seek(2)
+                while True:
+                    marker = f.read(2)
+                    if len(marker) < 2 or marker[0] != 0xFF:
+                        return None
+                    length = struct.unpack(">H", f.read(2))[0]
+                    # SOFn (without DHT / JPG / DAC markers) holds the size
+                    if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                        h, w = struct.unpack(">xHH", f.read(5))
+                        return w, h, False
+                    f.seek(length - 2, 1)
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+class AssetManager:
+    """
+    Central image loading.
+    - Every file is decoded ONCE. Opaque images that are only needed small are
+      decoded straight at 1/2, 1/4 or 1/8 size (IMREAD_REDUCED_*).
+    - Resized variants are cached by (name, size, interpolation) under a
+      memory budget with LRU eviction. Callers ask for the size they draw,
+      every frame, and get the same array back.
+    Returned arrays are shared and read-only.
+    """
+
+    def __init__(self, root=ASSETS_DIR, budget_mb=None):
+        self.root = root
+        self.budget_bytes = int((budget_mb if budget_mb is not None else config.ASSET_CACHE_MB) * 1024 * 1024)
+
+        self._sources = {}             # (name, reduce) -> decoded image (pinned)
+        self._probes = {}
+        self._variants = OrderedDict()  # (name, size, interpolation) -> image, LRU order
+        self._variant_bytes = 0
+        self._lock = threading.RLock()  # screens are also built on the warm-up thread
+
+        self.stats = {"decodes": 0, "decode_ms": 0.0, "hits": 0, "misses": 0, "evictions": 0}
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def exists(self, name):
+        return os.path.exists(self.path(name))
+
+    def size(self, name):
+        """(w, h) of the file on disk (header only), None if missing / unknown format."""
+        info = self._probe(name)
+        return info[:2] if info else None
+
+    def _probe(self, name):
+        if name not in self._probes:
+            self._probes[name] = _probe(self.path(name))
+        return self._probes[name]
+
+    def image(self, name, reduce=1):
+        """Decoded image (BGR / BGRA as stored), None if the file is missing or unreadable."""
+        key = (name, reduce)
+        with self._lock:
+            if key in self._sources:
+                return self._sources[key]
+
+            start = time.perf_counter()
+            flags = _REDUCED_FLAGS[reduce] if reduce > 1 else cv2.IMREAD_UNCHANGED
+            img = cv2.imread(self.path(name), flags) if self.exists(name) else None
+            if img is not None:
+                img.flags.writeable = False
+                self.stats["decodes"] += 1
+                self.stats["decode_ms"] += (time.perf_counter() - start) * 1000.0
+            self._sources[key] = img
+            return img
+
+    def register(self, name, img):
+        """Placeholder for a missing file: variants of `name` are then made from `img`."""
+        with self._lock:
+            img.flags.writeable = False
+            self._sources[(name, 1)] = img
+            self._probes[name] = (img.shape[1], img.shape[0], True)
+            for key in [k for k in self._variants if k[0] == name]:
+                self._variant_bytes -= self._variants.pop(key).nbytes
+        return img
+
+    def _best_source(self, name, size):
+        """Smallest decode that still has at least `size` pixels (reduced only for opaque files)."""
+        info = self._probe(name)
+        reduce = 1
+        if info is not None and not info[2]:
+            src_w, src_h = info[0], info[1]
+            for factor in (8, 4, 2):
+                if src_w // factor >= size[0] and src_h // factor >= size[1]:
+                    reduce = factor
+                    break
+        # A full decode already in memory beats a second (reduced) decode
+        if reduce > 1 and (name, 1) in self._sources:
+            reduce = 1
+        return self.image(name, reduce)
+
+    def variant(self, name, size, interpolation=cv2.INTER_LINEAR):
+        """Image resized to size=(w, h), cached. None if the file is missing."""
+        size = (int(size[0]), int(size[1]))
+        if size[0] <= 0 or size[1] <= 0:
+            return None
+        key = (name, size, interpolation)
+        with self._lock:
+            img = self._variants.get(key)
+            if img is not None:
+                self._variants.move_to_end(key)
+                self.stats["hits"] += 1
+                return img
+
+            self.stats["misses"] += 1
+            src = self._best_source(name, size)
+            if src is None:
+                return None
+            if (src.shape[1], src.shape[0]) == size:
+                img = src  # already the right size (counted in the budget anyway)
+            else:
+                img = cv2.resize(src, size, interpolation=interpolation)
+                img.flags.writeable = False
+            self._store(key, img)
+            return img
+
+    def fit_width(self, name, width, interpolation=cv2.INTER_LINEAR):
+        """Variant `width` pixels wide, aspect ratio kept."""
+        dims = self._dims(name)
+        if dims is None: return None
+        return self.variant(name, (width, int(width * dims[1] / dims[0])), interpolation)
+
+    def fit_height(self, name, height, interpolation=cv2.INTER_LINEAR):
+        """Variant `height` pixels tall, aspect ratio kept."""
+        dims = self._dims(name)
+        if dims is None: return None
+        return self.variant(name, (int(height * dims[0] / dims[1]), height), interpolation)
+
+    def scaled(self, name, base_size, scale, interpolation=cv2.INTER_LINEAR, step=None):
+        """
+        Variant for animated scaling (pulsing bubbles): the scale is quantized
+        to `step`, so a smooth animation reuses a handful of cached sizes.
+        """
+        step = step if step is not None else config.ASSET_SCALE_STEP
+        q = round(scale / step) * step
+        return self.variant(name, (int(base_size[0] * q), int(base_size[1] * q)), interpolation)
+
+    def _dims(self, name):
+        dims = self.size(name)
+        if dims is None:
+            # Unknown header: fall back to a full decode
+            img = self.image(name)
+            dims = (img.shape[1], img.shape[0]) if img is not None else None
+        return dims
+
+    def _store(self, key, img):
+        if img.nbytes > self.budget_bytes:
+            return  # bigger than the whole budget: use it, don't keep it
+        self._variants[key] = img
+        self._variant_bytes += img.nbytes
+        while self._variant_bytes > self.budget_bytes:
+            _, old = self._variants.popitem(last=False)
+            self._variant_bytes -= old.nbytes
+            self.stats["evictions"] += 1
+
+    def get_stats(self):
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return dict(
+                self.stats,
+                hit_rate=self.stats["hits"] / lookups if lookups else 0.0,
+                sources=len(self._sources),
+                source_mb=sum(img.nbytes for img in self._sources.values() if img is not None) / 1048576.0,
+                variants=len(self._variants),
+                variant_mb=self._variant_bytes / 1048576.0,
+                budget_mb=self.budget_bytes / 1048576.0
+            )
+
+
+# Cache-ul comun tuturor ecranelor
+_assets = None
+_assets_lock = threading.Lock()
+
+
+def get_assets():
+    global _assets
+    with _assets_lock:
+        if _assets is None:
+            _assets = AssetManager()
+        return _assets
@@ -0,0 +1,142 @@
+# src/core/benchmark.py
+import json
+import math
+import time
+
+from src.core import clock
+from src.core.perf import PerfMonitor
+from src.main import KioskApp
+from src.vision.frame_source import open_source
+from src.vision.vision_worker import VisionWorker
+
+
+# Scripted flow: every step forces a screen and runs it for N frames.
+#   cursor: None    -> whatever the vision models see in the recording
+#           (x, y)  -> hand held still at that normalized position
+#           "sweep" -> hand moving left/right across the screen
+DEFAULT_SCENARIO = [
+    {"state": "SAVER", "frames": 150},
+    {"state": "MENU", "frames": 150, "cursor": "sweep"},
+    {"state": "INFO", "frames": 90, "cursor": (0.25, 0.35)},   # dwell on AIA -> detail page
+    {"state": "INFO", "frames": 60, "cursor": "sweep"},
+    {"state": "GAME", "frames": 120, "cursor": "sweep"},
+    {"state": "GAME", "game_mode": "QUIZ", "frames": 150, "cursor": "sweep"},
+    {"state": "GAME", "game_mode": "ARCADE", "frames": 300, "cursor": "sweep"},
+    {"state": "GAME", "game_mode": "MAZE", "frames": 300, "cursor": (0.5, 0.5)},
+]
+
+
+class HeadlessBenchmark:
+    """
+    Runs the full kiosk state machine on a recorded video / image sequence,
+    without a window and as fast as possible.
+    Vision runs inline (same frame -> same result), the app clock is a
+    ManualClock advanced by 1/fps per frame, so timers behave like real time
+    and numbers are reproducible. Stats are collected per screen.
+    """
+
+    def __init__(self, source, scenario=None, fps=30.0, screen_size=(1920, 1080), loop_source=True, render_size=None):
+        # Injected clock BEFORE the app is built (idle timer starts in __init__)
+        self.clock = clock.ManualClock(start=time.time())
+        clock.set_clock(self.clock)
+
+        self.source = source
+        self.loop_source = loop_source
+        self.capture = open_source(source)
+        self.scenario = scenario if scenario is not None else DEFAULT_SCENARIO
+        self.frame_dt = 1.0 / fps
+
+        self.monitors = {}
+        self.app = KioskApp(screen_size=screen_size, perf=self._monitor("SETUP"), render_size=render_size)
+        self.app.warm_up()  # first MediaPipe pass is not part of any screen
+        self.worker = VisionWorker(None, self.app.engine, self.app.face_detector, self.app.scheduler, self.app.perf)
+        self.seq = 0
+
+    def _monitor(self, screen):
+        monitor = self.monitors.get(screen)
+        if monitor is None:
+            monitor = self.monitors[screen] = PerfMonitor(window=100000, enabled=True)
+        return monitor
+
+    def _read_frame(self):
+        success, frame = self.capture.read()
+        if not success and self.loop_source:
+            self.capture.release()
+            self.capture = open_source(self.source)
+            success, frame = self.capture.read()
+        return success, frame
+
+    @staticmethod
+    def _scripted_cursor(cursor, i):
+        if cursor == "sweep":
+            return 0.5 + 0.4 * math.sin(i * 0.05), 0.5 + 0.2 * math.sin(i * 0.03)
+        return cursor
+
+    def run(self):
+        for step in self.scenario:
+            self.app.force_state(step["state"], step.get("game_mode"))
+            cursor = step.get("cursor")
+
+            for i in range(step["frames"]):
+                success, frame = self._read_frame()
+                if not success:
+                    print("Benchmark: source ended")
+                    return self.report()
+
+                # Per-screen stats: route every timer to the active screen
+                perf = self._monitor(self.app.screen_name())
+                self.app.perf = perf
+                self.worker.perf = perf
+
+                self.seq += 1
+                start = time.perf_counter()
+
+                with perf.stage("vision"):
+                    self.worker.process(frame, self.seq, self.clock.time())
+                vision = self.worker.get_latest()
+
+                if cursor is not None:
+                    x, y = self._scripted_cursor(cursor, i)
+                    vision["gesture_data"] = dict(vision["gesture_data"], cursor_detected=True, x=x, y=y)
+
+                render_start = time.perf_counter()
+                self.app.step(frame, vision)
+                end = time.perf_counter()
+
+                perf.record("frame", (end - render_start) * 1000.0)
+                perf.record("total", (end - start) * 1000.0)
+                self.clock.advance(self.frame_dt)
+
+        return self.report()
+
+    def report(self):
+        """{screen: {"frames", "render_fps", "total_fps", "stages"}}"""
+        report = {}
+        for screen, monitor in self.monitors.items():
+            stages = monitor.summary()
+            if "frame" not in stages:
+                continue
+            frames = stages["frame"]["count"]
+            render_ms = stages["frame"]["mean"]
+            total_ms = stages["total"]["mean"]
+            report[screen] = {
+                "frames": frames,
+                "render_fps": 1000.0 / render_ms if render_ms > 0 else 0.0,
+                "total_fps": 1000.0 / total_ms if total_ms > 0 else 0.0,
+                "stages": stages
+            }
+        return report
+
+    @staticmethod
+    def print_report(report):
+        print(f"{'SCREEN':<14}{'FRAMES':>8}{'RENDER FPS':>12}{'TOTAL FPS':>11}   stage p50/p95/p99 (ms)")
+        for screen, data in report.items():
+            print(f"{screen:<14}{data['frames']:>8}{data['render_fps']:>12.1f}{data['total_fps']:>11.1f}")
+            for name, st in data["stages"].items():
+                print(f"{'':<14}  {name:<12}{st['p50']:8.2f}{st['p95']:8.2f}{st['p99']:8.2f}")
+
+    @staticmethod
+    def save_report(report, path):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Benchmark: report saved to {path}")
@@ -0,0 +1,70 @@
+# src/core/buffers.py
+# Buffere de imagine prealocate, refolosite de la un frame la altul.
+import threading
+
+import numpy as np
+
+
+class BufferPool:
+    """
+    Named scratch / destination arrays for the per-frame OpenCV calls
+    (dst= parameter). A buffer is allocated the first time a name is asked
+    for and again only when its shape or dtype changes (new render
+    resolution), so a steady frame loop allocates nothing.
+    The allocation counter is what proves it: stats["allocations"] stays
+    flat while stats["reuses"] grows by a few per frame.
+    """
+
+    def __init__(self):
+        self._buffers = {}
+        self._lock = threading.Lock()  # the vision worker thread has its own names
+        self.stats = {"allocations": 0, "reuses": 0, "allocated_kb": 0.0}
+
+    def get(self, name, shape, dtype=np.uint8):
+        """Array `shape` for `name`; contents are whatever the previous frame left."""
+        buf = self._buffers.get(name)
+        if buf is not None and buf.shape == shape and buf.dtype == dtype:
+            self.stats["reuses"] += 1
+            return buf
+        with self._lock:
+            buf = self._buffers[name] = np.empty(shape, dtype=dtype)
+            self.stats["allocations"] += 1
+            self.stats["allocated_kb"] += buf.nbytes / 1024.0
+        return buf
+
+    def scratch(self, name, shape, dtype=np.uint8):
+        """
+        View of `shape` into a buffer that only grows (text boxes, panel ROIs:
+        a different size every call, one allocation for the largest).
+        """
+        buf = self._buffers.get(name)
+        if buf is None or buf.dtype != dtype or len(buf.shape) != len(shape) or \
+                any(have < need for have, need in zip(buf.shape, shape)):
+            grown = shape if buf is None or len(buf.shape) != len(shape) else \
+                tuple(max(have, need) for have, need in zip(buf.shape, shape))
+            buf = self.get(name, grown, dtype)
+        else:
+            self.stats["reuses"] += 1
+        return buf[tuple(slice(0, n) for n in shape)]
+
+    def like(self, name, img):
+        """Buffer with the shape / dtype of `img`."""
+        return self.get(name, img.shape, img.dtype)
+
+    def get_stats(self):
+        return dict(
+            self.stats,
+            buffers=len(self._buffers),
+            kb=sum(b.nbytes for b in list(self._buffers.values())) / 1024.0
+        )
+
+
+# Pool-ul comun (render loop + vision worker, fiecare cu numele lui)
+_pool = None
+
+
+def get_buffers():
+    global _pool
+    if _pool is None:
+        _pool = BufferPool()
+    return _pool
@@ -0,0 +1,45 @@
+# src/core/clock.py
+import time
+
+
+class SystemClock:
+    """Wall clock (default)."""
+
+    def time(self):
+        return time.time()
+
+
+class ManualClock:
+    """
+    Clock advanced by hand. Used by the headless benchmark / trace replay so
+    every timer in the app (dwell, animations, spawns) is deterministic and
+    runs as fast as the CPU allows.
+    """
+
+    def __init__(self, start=0.0):
+        self.t = start
+
+    def time(self):
+        return self.t
+
+    def advance(self, dt):
+        self.t += dt
+        return self.t
+
+
+# Ceasul folosit de toate ecranele (injectabil)
+_clock = SystemClock()
+
+
+def now():
+    """Current app time in seconds (replaces time.time() in screens)."""
+    return _clock.time()
+
+
+def set_clock(new_clock):
+    global _clock
+    _clock = new_clock
+
+
+def get_clock():
+    return _clock
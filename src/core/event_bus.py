@@ -0,0 +1,164 @@
+# src/core/event_bus.py
+import threading
+import types
+import weakref
+from collections import deque
+
+
+# --- EVENTS ---
+class Event:
+    """Base class. Events are small __slots__ objects (no per-event dict)."""
+    __slots__ = ("source",)
+
+    def __init__(self, source=None):
+        self.source = source
+
+    def __repr__(self):
+        # Payloads (source object, job result) are left out: repr stays short and stable
+        fields = []
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name not in ("source", "result"):
+                    fields.append(f"{name}={getattr(self, name)!r}")
+        return f"{type(self).__name__}({', '.join(fields)})"
+
+
+class GestureEvent(Event):
+    """Edge gesture from the vision worker (SWIPE_LEFT / SWIPE_RIGHT)."""
+    __slots__ = ("gesture", "x", "y")
+
+    def __init__(self, gesture, x=None, y=None, source=None):
+        super().__init__(source)
+        self.gesture = gesture
+        self.x = x
+        self.y = y
+
+
+class TransitionEvent(Event):
+    """A screen asks the app to switch screen (target: MENU, INFO, JOCURI, ...)."""
+    __slots__ = ("target",)
+
+    def __init__(self, target, source=None):
+        super().__init__(source)
+        self.target = target
+
+
+class GameFinished(Event):
+    """A sub-game (QUIZ / ARCADE / MAZE) is done and returns to the games hub."""
+    __slots__ = ("game", "score")
+
+    def __init__(self, game, score=0, source=None):
+        super().__init__(source)
+        self.game = game
+        self.score = score
+
+
+class JobDone(Event):
+    """Background job finished (AI questions, maze layout). Published from the worker thread."""
+    __slots__ = ("job", "ok", "result")
+
+    def __init__(self, job, ok=True, result=None, source=None):
+        super().__init__(source)
+        self.job = job
+        self.ok = ok
+        self.result = result
+
+
+class EventBus:
+    """
+    Publish/subscribe between screens and the app.
+    - publish() works from ANY thread: it only appends to a queue.
+    - dispatch() runs the handlers on the main thread, once per frame.
+    - Bound methods are held weakly, so a screen that is replaced is
+      unsubscribed automatically when it is garbage collected.
+    Subscribing to Event receives every event.
+    """
+
+    def __init__(self):
+        self._queue = deque()
+        self._handlers = {}
+        self._lock = threading.Lock()  # subscribe/unsubscribe only
+        self.published = 0
+        self.dispatched = 0
+
+    def subscribe(self, event_type, handler):
+        if isinstance(handler, types.MethodType):
+            ref = weakref.WeakMethod(handler)
+        else:
+            ref = lambda handler=handler: handler
+        with self._lock:
+            # Copy-on-write: dispatch iterates the old list without locking
+            self._handlers[event_type] = self._handlers.get(event_type, []) + [ref]
+        return handler
+
+    def unsubscribe(self, event_type, handler):
+        with self._lock:
+            refs = self._handlers.get(event_type, [])
+            self._handlers[event_type] = [r for r in refs if r() is not None and r() != handler]
+
+    def publish(self, event):
+        # deque.append is atomic -> safe from loader threads
+        self._queue.append(event)
+        self.published += 1
+
+    def dispatch(self, max_events=None):
+        """Delivers the queued events. Events published by handlers wait for the next call."""
+        queue = self._queue
+        if not queue:
+            return 0  # the usual frame: nothing happened
+        pending = len(queue)
+        if max_events is not None:
+            pending = min(pending, max_events)
+
+        handlers = self._handlers
+        wildcard = handlers.get(Event, [])
+        dead = False
+        for _ in range(pending):
+            event = queue.popleft()
+            for ref in handlers.get(event.__class__, []) + wildcard:
+                handler = ref()
+                if handler is None:
+                    dead = True
+                    continue
+                handler(event)
+        self.dispatched += pending
+        if dead:
+            self._prune()
+        return pending
+
+    def _prune(self):
+        with self._lock:
+            for event_type, refs in self._handlers.items():
+                self._handlers[event_type] = [r for r in refs if r() is not None]
+
+    def clear(self):
+        self._queue.clear()
+
+    def get_stats(self):
+        return {
+            "published": self.published,
+            "dispatched": self.dispatched,
+            "queued": len(self._queue),
+            "handlers": sum(len(refs) for refs in self._handlers.values())
+        }
+
+
+# Bus-ul folosit de toate ecranele (injectabil, ca src/core/clock.py)
+_bus = EventBus()
+
+
+def publish(event):
+    _bus.publish(event)
+
+
+def subscribe(event_type, handler):
+    return _bus.subscribe(event_type, handler)
+
+
+def get_bus():
+    return _bus
+
+
+def set_bus(new_bus):
+    global _bus
+    _bus = new_bus
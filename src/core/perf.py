@@ -0,0 +1,130 @@
+# src/core/perf.py
+import cv2
+import json
+import time
+from collections import deque
+
+
+class _Stage:
+    """Reusable timing context for one stage (no allocation per frame)."""
+    __slots__ = ("monitor", "name", "start")
+
+    def __init__(self, monitor, name):
+        self.monitor = monitor
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.monitor.record(self.name, (time.perf_counter() - self.start) * 1000.0)
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class PerfMonitor:
+    """
+    Lightweight per-stage timers with rolling percentiles.
+    Every stage keeps the last `window` samples (ms). Percentiles are only
+    computed when somebody asks (HUD / JSON dump). When disabled, stage()
+    returns a shared no-op context and record() returns right away.
+    """
+
+    def __init__(self, window=300, enabled=False):
+        self.window = window
+        self.enabled = enabled
+        self.always_on = enabled  # e.g. stats are dumped on exit
+        self.samples = {}
+        self._stages = {}
+        self.hud_visible = False
+
+    def stage(self, name):
+        if not self.enabled:
+            return _NULL_STAGE
+        stage = self._stages.get(name)
+        if stage is None:
+            stage = self._stages[name] = _Stage(self, name)
+        return stage
+
+    def record(self, name, ms):
+        if not self.enabled:
+            return
+        buf = self.samples.get(name)
+        if buf is None:
+            buf = self.samples[name] = deque(maxlen=self.window)
+        buf.append(ms)
+
+    def toggle_hud(self):
+        self.hud_visible = not self.hud_visible
+        self.enabled = self.hud_visible or self.always_on
+        return self.hud_visible
+
+    @staticmethod
+    def _percentile(sorted_vals, p):
+        if not sorted_vals:
+            return 0.0
+        idx = min(len(sorted_vals) - 1, int(round(p / 100.0 * (len(sorted_vals) - 1))))
+        return sorted_vals[idx]
+
+    def summary(self):
+        """{stage: {"p50", "p95", "p99", "mean", "count"}} over the rolling window."""
+        result = {}
+        for name, buf in list(self.samples.items()):
+            vals = sorted(buf)
+            if not vals:
+                continue
+            result[name] = {
+                "p50": self._percentile(vals, 50),
+                "p95": self._percentile(vals, 95),
+                "p99": self._percentile(vals, 99),
+                "mean": sum(vals) / len(vals),
+                "count": len(vals)
+            }
+        return result
+
+    def dump_json(self, path, extra=None):
+        data = {"window": self.window, "stages": self.summary()}
+        if extra:
+            data.update(extra)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        print(f"PerfMonitor: stats saved to {path}")
+
+    def draw_hud(self, frame, x=None, y=20):
+        """Overlay with p50/p95/p99 per stage (top-right corner)."""
+        stats = self.summary()
+        if not stats:
+            return frame
+
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        line_h = 22
+        panel_w = 360
+        panel_h = line_h * (len(stats) + 1) + 16
+        h, w = frame.shape[:2]
+        if x is None:
+            x = w - panel_w - 20
+        x2, y2 = min(w, x + panel_w), min(h, y + panel_h)
+
+        # Dark panel only on the HUD region
+        roi = frame[y:y2, x:x2]
+        cv2.convertScaleAbs(roi, roi, alpha=0.3)
+
+        cv2.putText(frame, "STAGE        p50    p95    p99 ms", (x + 10, y + line_h), font, 0.5, (0, 255, 255), 1)
+        for i, (name, st) in enumerate(stats.items()):
+            line = f"{name:<10} {st['p50']:6.1f} {st['p95']:6.1f} {st['p99']:6.1f}"
+            cv2.putText(frame, line, (x + 10, y + line_h * (i + 2)), font, 0.5, (255, 255, 255), 1)
+        return frame
@@ -0,0 +1,116 @@
+# src/core/quality_governor.py
+
+
+# Quality tiers, best first.
+#   render_scale     - internal render resolution (fraction of the window size)
+#   model_complexity - MediaPipe Hands model (0 = Lite, 1 = Full); the Full model
+#                      costs the vision worker, so the app only enables it when the
+#                      measured inference time leaves room for it (KioskApp)
+#   inference_stride - multiplier applied to every screen's vision stride
+#   effects          - costly visual effects (see QUALITY in src/ui/shared.py)
+QUALITY_TIERS = [
+    {
+        "name": "ULTRA",
+        "render_scale": 1.0,
+        "model_complexity": 1,
+        "inference_stride": 1,
+        "effects": {"saver_glass": True, "maze_grid": True, "maze_wall_fill": True, "arcade_shake": True}
+    },
+    {
+        "name": "HIGH",
+        "render_scale": 1.0,
+        "model_complexity": 0,
+        "inference_stride": 1,
+        "effects": {"saver_glass": True, "maze_grid": True, "maze_wall_fill": True, "arcade_shake": True}
+    },
+    {
+        "name": "MEDIUM",
+        "render_scale": 0.75,
+        "model_complexity": 0,
+        "inference_stride": 1,
+        "effects": {"saver_glass": False, "maze_grid": False, "maze_wall_fill": True, "arcade_shake": True}
+    },
+    {
+        "name": "LOW",
+        "render_scale": 2 / 3,
+        "model_complexity": 0,
+        "inference_stride": 2,
+        "effects": {"saver_glass": False, "maze_grid": False, "maze_wall_fill": False, "arcade_shake": False}
+    },
+]
+
+
+class QualityGovernor:
+    """
+    Frame-budget governor.
+    Watches the smoothed frame time against the target FPS and steps down one
+    quality tier when the app is over budget for a while, and back up when
+    there is clear headroom again. The two thresholds, the hold times and a
+    cooldown after every change give hysteresis, so tiers do not flap.
+    """
+
+    def __init__(self, target_fps=30, start_tier=1, tiers=QUALITY_TIERS):
+        self.tiers = tiers
+        self.tier_index = max(0, min(start_tier, len(tiers) - 1))
+        self.target_ms = 1000.0 / target_fps
+
+        # Hysteresis
+        self.DOWN_RATIO = 1.15     # over budget above 115% of the target
+        self.UP_RATIO = 0.70       # headroom below 70% of the target
+        self.DOWN_FRAMES = 30      # ~1s over budget -> step down
+        self.UP_FRAMES = 180       # ~6s of headroom -> step up
+        self.COOLDOWN_FRAMES = 90  # no decision right after a change
+
+        self.avg_ms = None
+        self._over = 0
+        self._under = 0
+        self._cooldown = 0
+        self.changes = 0
+        self.last_change = None  # (tier name, avg ms) for get_stats()
+
+    @property
+    def tier(self):
+        return self.tiers[self.tier_index]
+
+    def update(self, frame_ms):
+        """Feeds the work time of one frame. Returns True if the tier changed."""
+        # EMA smoothing (single slow frames should not trigger anything)
+        self.avg_ms = frame_ms if self.avg_ms is None else self.avg_ms * 0.9 + frame_ms * 0.1
+
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return False
+
+        if self.avg_ms > self.target_ms * self.DOWN_RATIO:
+            self._over += 1
+            self._under = 0
+        elif self.avg_ms < self.target_ms * self.UP_RATIO:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = 0
+            self._under = 0
+
+        if self._over >= self.DOWN_FRAMES and self.tier_index < len(self.tiers) - 1:
+            return self._set_tier(self.tier_index + 1)
+        if self._under >= self.UP_FRAMES and self.tier_index > 0:
+            return self._set_tier(self.tier_index - 1)
+        return False
+
+    def _set_tier(self, index):
+        self.tier_index = index
+        self._over = 0
+        self._under = 0
+        self._cooldown = self.COOLDOWN_FRAMES
+        self.changes += 1
+        self.last_change = (self.tier["name"], round(self.avg_ms, 1))
+        return True
+
+    def get_stats(self):
+        return {
+            "tier": self.tier["name"],
+            "avg_ms": self.avg_ms,
+            "target_ms": self.target_ms,
+            "changes": self.changes,
+            "last_change": self.last_change
+        }
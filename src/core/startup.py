@@ -0,0 +1,46 @@
+# src/core/startup.py
+import threading
+import time
+
+
+class StartupLoader:
+    """
+    Runs the heavy startup tasks (camera open, MediaPipe import + graphs,
+    model warm-up) on worker threads, so the main thread can keep the
+    splash screen animated. Tasks run in parallel; timings are kept per task.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+        self.results = {}
+        self.errors = {}
+        self.timings_ms = {}
+
+    def add(self, name, fn):
+        thread = threading.Thread(target=self._run, args=(name, fn))
+        thread.daemon = True
+        self._tasks[name] = thread
+        thread.start()
+        return self
+
+    def _run(self, name, fn):
+        start = time.perf_counter()
+        try:
+            self.results[name] = fn()
+        except Exception as e:
+            print(f"Startup: '{name}' failed: {e}")
+            self.errors[name] = e
+        self.timings_ms[name] = (time.perf_counter() - start) * 1000.0
+
+    def done(self):
+        return not any(t.is_alive() for t in self._tasks.values())
+
+    def pending(self):
+        return [name for name, t in self._tasks.items() if t.is_alive()]
+
+    def result(self, name):
+        """Result of a finished task (re-raises its exception on the caller thread)."""
+        self._tasks[name].join()
+        if name in self.errors:
+            raise self.errors[name]
+        return self.results[name]
@@ -0,0 +1,197 @@
+# src/core/trace_replay.py
+import json
+import random
+import time
+import zlib
+
+import numpy as np
+
+from src.core import clock
+from src.core import event_bus
+from src.core.perf import PerfMonitor
+from src.vision.gesture_trace import load_trace
+
+
+def _cursor(g):
+    if g["cursor_detected"]:
+        return g["x"], g["y"]
+    return None, None
+
+
+def _build_menu():
+    from src.ui.screens.menu import MenuController
+    return MenuController()
+
+
+def _build_games():
+    from src.ui.screens.game import QuizGame
+    return QuizGame()
+
+
+def _build_info():
+    from src.ui.screens.info_hub import InfoHub
+    return InfoHub()
+
+
+def _build_arcade():
+    from src.ui.screens.arcade import ArcadeComponent
+    return ArcadeComponent()
+
+
+def _build_maze():
+    from src.ui.screens.maze import MazeGame
+    maze = MazeGame()
+    maze.reset()
+    return maze
+
+
+def _update_menu(screen, g):
+    # main loop: menu only gets input while a hand is visible
+    if g["cursor_detected"]:
+        return screen.update(g["x"], g["y"])
+    return None
+
+
+def _update_info(screen, g):
+    # main loop: swipes arrive with the cursor of their frame and go out as GestureEvents
+    if g["cursor_detected"]:
+        result = screen.update(g["x"], g["y"])
+        if g["gesture"]:
+            event_bus.publish(event_bus.GestureEvent(g["gesture"], g["x"], g["y"]))
+        return result
+    return None
+
+
+def _update_with_none(screen, g):
+    # games hub, arcade + maze get None without a hand (timers, arcade pause)
+    x, y = _cursor(g)
+    return screen.update(x, y)
+
+
+# Screen name -> (builder, update adapter). Adapters call update() exactly
+# like the kiosk main loop does.
+REPLAY_SCREENS = {
+    "MENU": (_build_menu, _update_menu),
+    "GAMES": (_build_games, _update_with_none),
+    "INFO": (_build_info, _update_info),
+    "ARCADE": (_build_arcade, _update_with_none),
+    "MAZE": (_build_maze, _update_with_none),
+}
+
+
+class TraceReplay:
+    """
+    Replays a recorded gesture trace through ONE screen, without camera or
+    vision models: isolates UI cost from MediaPipe cost.
+    The app clock follows the trace timestamps (ManualClock), all random
+    generators are seeded and events go to a private EventBus dispatched after
+    every update, so two runs produce the same outputs (returns + events).
+    speed: 0 = as fast as possible, N = N x real time.
+    """
+
+    def __init__(self, trace_path, screen_name, speed=0.0, seed=0, frame_size=(1920, 1080)):
+        self.trace_path = trace_path
+        self.screen_name = screen_name
+        self.speed = speed
+        self.seed = seed
+        self.frame_size = frame_size
+        self.header, self.events = load_trace(trace_path)
+
+    @staticmethod
+    def _wait_for_loaders(screen):
+        """AI loaders run on threads: wait for them so replays stay deterministic."""
+        for obj in (screen, getattr(screen, "quiz", None), getattr(screen, "maze", None)):
+            thread = getattr(obj, "loader_thread", None)
+            if thread is not None and thread.is_alive():
+                thread.join()
+
+    def run(self):
+        build, update = REPLAY_SCREENS[self.screen_name]
+
+        random.seed(self.seed)
+        np.random.seed(self.seed)
+        sim_clock = clock.ManualClock(start=1_000_000.0)
+        previous_clock = clock.get_clock()
+        clock.set_clock(sim_clock)
+        bus = event_bus.EventBus()
+        previous_bus = event_bus.get_bus()
+        event_bus.set_bus(bus)
+        events = []
+        bus.subscribe(event_bus.Event, events.append)
+
+        try:
+            screen = build()
+            self._wait_for_loaders(screen)
+            bus.dispatch()
+            events.clear()
+
+            w, h = self.frame_size
+            background = np.full((h, w, 3), 40, dtype=np.uint8)
+            frame = np.empty_like(background)
+
+            perf = PerfMonitor(window=len(self.events) + 1, enabled=True)
+            outputs = []
+            base_t = sim_clock.time()
+            wall_start = time.perf_counter()
+
+            for i, (t, gesture_data) in enumerate(self.events):
+                sim_clock.t = base_t + t
+
+                if self.speed > 0:
+                    # Paced replay (N x real time)
+                    delay = t / self.speed - (time.perf_counter() - wall_start)
+                    if delay > 0:
+                        time.sleep(delay)
+
+                with perf.stage("update"):
+                    result = update(screen, gesture_data)
+                self._wait_for_loaders(screen)
+                bus.dispatch()
+                if result:
+                    outputs.append([i, result])
+                for event in events:
+                    outputs.append([i, repr(event)])
+                events.clear()
+
+                np.copyto(frame, background)
+                with perf.stage("draw"):
+                    screen.draw(frame)
+
+            wall_time = time.perf_counter() - wall_start
+        finally:
+            clock.set_clock(previous_clock)
+            event_bus.set_bus(previous_bus)
+
+        sim_time = self.events[-1][0] if self.events else 0.0
+        checksum = zlib.crc32(json.dumps(outputs).encode())
+        checksum = zlib.crc32(frame.tobytes(), checksum) if self.events else checksum
+
+        return {
+            "screen": self.screen_name,
+            "frames": len(self.events),
+            "sim_time": sim_time,
+            "wall_time": wall_time,
+            "speedup": (sim_time / wall_time) if wall_time > 0 else 0.0,
+            "stages": perf.summary(),
+            "outputs": outputs,
+            "checksum": checksum
+        }
+
+
+def compare_reports(current, baseline, tolerance=0.10, min_delta_ms=0.5):
+    """
+    Regression check against a saved report. Returns a list of problems
+    (empty = OK): different outputs / final frame, or p95 slower than baseline
+    by more than `tolerance` (and by at least `min_delta_ms`, timer noise).
+    """
+    problems = []
+    if current["checksum"] != baseline["checksum"]:
+        problems.append(f"{current['screen']}: outputs differ from baseline (checksum)")
+    for stage, st in current["stages"].items():
+        base = baseline["stages"].get(stage)
+        if not base:
+            continue
+        slower = st["p95"] - base["p95"]
+        if slower > base["p95"] * tolerance and slower > min_delta_ms:
+            problems.append(f"{current['screen']}: {stage} p95 {st['p95']:.2f} ms vs baseline {base['p95']:.2f} ms")
+    return problems
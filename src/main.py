@@ -0,0 +1,410 @@
+# src/main.py
+# Masina de stari a kiosk-ului, separata de fereastra si de camera.
+# main_app.py o ruleaza live (camera + fereastra), scripts/benchmark.py headless.
+import cv2
+import numpy as np
+import os
+import time
+
+from src import config
+from src.core import clock
+from src.core import event_bus
+from src.core.app_state import AppState
+from src.core.assets import get_assets
+from src.core.buffers import get_buffers
+from src.ui.text_cache import get_text_cache
+from src.ui.text_layout import get_layout_engine
+from src.ui.gradients import get_gradients
+from src.core.event_bus import GestureEvent, TransitionEvent
+from src.core.perf import PerfMonitor
+from src.core.quality_governor import QualityGovernor
+from src.ui.shared import QUALITY
+from src.ui.viewport import viewport
+from src.vision.gesture_engine import GestureEngine
+from src.vision.face_detector import FaceDetector
+from src.vision.scheduler import ModelScheduler
+from src.vision.preprocess import FramePreprocessor
+from src.vision.vision_worker import EMPTY_GESTURE
+
+# --- CONFIGURATION ---
+STATE_SAVER = "SAVER"
+STATE_MENU  = "MENU"
+STATE_INFO  = "INFO"
+STATE_GAME  = "GAME"
+
+# Time in seconds before returning to screensaver
+IDLE_TIMEOUT = 20.0
+
+# Render loop runs at display rate, independent of inference speed
+TARGET_FPS = 60
+
+
+class KioskApp:
+    """
+    Screens + state machine of the kiosk.
+    step() renders ONE frame from a camera frame and the newest vision result;
+    where the frames come from and where the output goes is up to the caller.
+    """
+
+    def __init__(self, screen_size=None, perf=None, render_size=None):
+        # Window size (output) and internal render size (screens draw at it, scaled up once at present)
+        self.SCREEN_W, self.SCREEN_H = screen_size or config.WINDOW_SIZE
+        self.RENDER_W, self.RENDER_H = render_size or config.RENDER_SIZE or (self.SCREEN_W, self.SCREEN_H)
+        self.perf = perf if perf is not None else PerfMonitor()
+
+        # 1. LOGO: variant per render resolution (decoded once, shared with InfoHub / splash)
+        self.LOGO_WIDTH = 400
+
+        # 2. INITIALIZE COMPONENTS
+        # Screens publish transitions / results, the app dispatches once per frame
+        self.bus = event_bus.get_bus()
+        self.bus.subscribe(TransitionEvent, self._on_transition)
+
+        self.engine = GestureEngine()
+        self.face_detector = FaceDetector(mode=config.FACE_DETECT_MODE, stride=config.FACE_DETECT_STRIDE)
+        # Screens are built once; INFO / GAME are warmed up while the saver runs
+        self.screens = AppState(self.face_detector)
+        self.saver = self.screens.saver
+        self.menu = self.screens.menu
+        self.screens.prewarm()
+
+        # The scheduler runs only the models the current screen needs
+        self.scheduler = ModelScheduler(budget_ms=config.VISION_BUDGET_MS)
+        self.scheduler.set_needs(ModelScheduler.needs_for(self.saver))
+
+        # Quality tiers (render scale, hands model, inference stride, effects)
+        self.governor = QualityGovernor(target_fps=TARGET_FPS)
+        self.render_w, self.render_h = self._apply_quality_tier(self.governor.tier)
+
+        self.current_state = STATE_SAVER
+        self.last_activity_time = clock.now()
+
+    @property
+    def info(self):
+        return self.screens.get(STATE_INFO)
+
+    @property
+    def game(self):
+        return self.screens.get(STATE_GAME)
+
+    def _active_screen(self):
+        if self.current_state == STATE_SAVER: return self.saver
+        elif self.current_state == STATE_MENU: return self.menu
+        return self.screens.get(self.current_state)
+
+    def _on_transition(self, event):
+        target = event.target
+        if target == "MENU":
+            self.current_state = STATE_MENU
+        elif target == "INFO":
+            self.current_state = STATE_INFO
+            self.screens.enter(STATE_INFO) # Reset state (same instance)
+        elif target == "JOCURI":
+            self.current_state = STATE_GAME
+            self.screens.enter(STATE_GAME) # Reset state (same instance)
+        elif target == "HARTA":
+            return # Placeholder
+        self.last_activity_time = clock.now()
+
+    def warm_up(self):
+        """
+        One inference pass on a dummy frame: MediaPipe builds its graphs and
+        buffers on the first process() call, this keeps it off the first real frame.
+        """
+        w, h = config.INFERENCE_SIZE
+        dummy = np.zeros((h, w, 3), dtype=np.uint8)
+        self.engine.process_rgb(dummy)
+        self.face_detector.detect(dummy)
+
+    def _full_hands_fits(self):
+        """
+        True if the Full Hands model fits the vision budget, judged on the
+        worker's measured inference times (an estimate while Lite runs).
+        """
+        hands = self.scheduler.cost_ms("hands")
+        if not self.engine.model_complexity:
+            hands *= config.HANDS_FULL_COST_RATIO
+        return 0.0 < hands and hands + self.scheduler.cost_ms("face") <= config.VISION_BUDGET_MS
+
+    def _apply_quality_tier(self, tier):
+        # Full model only with room for it on the vision worker (the frame time doesn't show its cost)
+        complexity = tier["model_complexity"] if self._full_hands_fits() else 0
+        self.engine.request_model_complexity(complexity)
+        self.scheduler.set_stride_multiplier(tier["inference_stride"])
+        QUALITY.update(tier["effects"])
+        scale = tier["render_scale"]
+        return int(self.RENDER_W * scale), int(self.RENDER_H * scale)
+
+    def screen_name(self):
+        """Active screen, including the games sub-mode (ex: GAME/ARCADE)."""
+        if self.current_state == STATE_GAME and self.game.mode != "MENU":
+            return f"{STATE_GAME}/{self.game.mode}"
+        return self.current_state
+
+    def force_state(self, state, game_mode=None):
+        """Jumps straight to a screen (scripted benchmark flows)."""
+        if state == STATE_INFO:
+            self.screens.enter(STATE_INFO)
+        elif state == STATE_GAME:
+            self.screens.enter(STATE_GAME)
+            if game_mode == "QUIZ":
+                self.game.quiz.reset()
+            elif game_mode == "ARCADE":
+                self.game.arcade.reset()
+            elif game_mode == "MAZE":
+                self.game.maze.reset()
+            if game_mode is not None:
+                self.game.mode = game_mode
+        self.current_state = state
+        self.last_activity_time = clock.now()
+
+    def step(self, frame, vision):
+        """
+        Renders one frame. Returns the display frame at WINDOW size; it is a
+        reused buffer, valid until the next step().
+        """
+        perf = self.perf
+
+        # Mirror and resize to the internal render resolution, into a reused buffer
+        # (resize first: the mirror then runs in place on the smaller image)
+        buffers = get_buffers()
+        with perf.stage("flip_resize"):
+            display_frame = buffers.get("app.display", (self.render_h, self.render_w, 3))
+            if frame.shape[:2] == display_frame.shape[:2]:
+                cv2.flip(frame, 1, dst=display_frame)
+            else:
+                cv2.resize(frame, (self.render_w, self.render_h), dst=display_frame)
+                cv2.flip(display_frame, 1, dst=display_frame)
+        h, w, _ = display_frame.shape
+        vp = viewport(display_frame)
+
+        # --- GESTURE PROCESSING (newest completed inference result) ---
+        if vision is not None:
+            gesture_data = vision["gesture_data"]
+            is_face_present = vision["face_present"]
+            # Screen logic advances once per inference result (dwell counters,
+            # per-frame motion), drawing runs at display rate.
+            new_input = vision["is_new"]
+        else:
+            gesture_data = EMPTY_GESTURE
+            is_face_present = False
+            new_input = False
+
+        # Reset timer if EITHER hand is detected OR face is detected
+        if gesture_data["cursor_detected"] or is_face_present:
+            self.last_activity_time = clock.now()
+
+        # Coordonate (pot fi None daca nu e mana)
+        gx = gesture_data["x"] if gesture_data["cursor_detected"] else None
+        gy = gesture_data["y"] if gesture_data["cursor_detected"] else None
+
+        # --- STATE MACHINE (UPDATE) ---
+        with perf.stage("update"):
+            # === A. SCREENSAVER ===
+            if self.current_state == STATE_SAVER:
+                if new_input:
+                    self.saver.update(display_frame, is_face_present)
+
+            # === B. MAIN MENU ===
+            elif self.current_state == STATE_MENU:
+                if clock.now() - self.last_activity_time > IDLE_TIMEOUT:
+                    self.current_state = STATE_SAVER
+
+                if new_input and gesture_data["cursor_detected"]:
+                    self.menu.update(gx, gy)
+
+            # === C. GAME HUB (MODIFICAT: Ruleaza update si fara mana) ===
+            elif self.current_state == STATE_GAME:
+                if clock.now() - self.last_activity_time > IDLE_TIMEOUT:
+                    self.current_state = STATE_SAVER
+
+                # Trimitem coordonatele (chiar daca sunt None) catre joc
+                # Jocul Maze are nevoie de apel continuu pentru a rula timerele
+                if new_input:
+                    self.game.update(gx, gy)
+
+            # === D. INFO HUB ===
+            elif self.current_state == STATE_INFO:
+                if clock.now() - self.last_activity_time > IDLE_TIMEOUT:
+                    self.current_state = STATE_SAVER
+
+                if new_input and gesture_data["cursor_detected"]:
+                    self.info.update(gx, gy)
+                    # Swipes go to the screen on display, like the cursor (InfoHub pages)
+                    if gesture_data["gesture"]:
+                        self.bus.publish(GestureEvent(gesture_data["gesture"], gx, gy, source=self))
+
+        # --- EVENTS (transitions, finished games, AI jobs from loader threads) ---
+        with perf.stage("events"):
+            self.bus.dispatch()
+
+        # --- DRAW ACTIVE SCREEN ---
+        with perf.stage("draw"):
+            if self.current_state == STATE_SAVER:
+                logo = get_assets().fit_width("logo_ugal.jpeg", vp.px(self.LOGO_WIDTH))
+                display_frame = self.saver.draw(display_frame, logo)
+            elif self.current_state == STATE_MENU:
+                display_frame = self.menu.draw(display_frame)
+            elif self.current_state == STATE_GAME:
+                display_frame = self.game.draw(display_frame)
+            elif self.current_state == STATE_INFO:
+                display_frame = self.info.draw(display_frame)
+
+        # --- VISION NEEDS OF THE ACTIVE SCREEN ---
+        self.scheduler.set_needs(ModelScheduler.needs_for(self._active_screen()))
+
+        # --- DRAW GLOBAL CURSOR ---
+        if self.current_state != STATE_SAVER and gesture_data["cursor_detected"]:
+            cx, cy = FramePreprocessor.to_display(gx, gy, w, h)
+            cv2.circle(display_frame, (cx, cy), vp.px(15), (0, 255, 255), vp.thick(2))
+            cv2.circle(display_frame, (cx, cy), vp.px(4), (255, 255, 255), -1)
+
+        if perf.hud_visible:
+            perf.draw_hud(display_frame)
+
+        # Scale up once, at present time
+        if (w, h) != (self.SCREEN_W, self.SCREEN_H):
+            with perf.stage("upscale"):
+                present = buffers.get("app.present", (self.SCREEN_H, self.SCREEN_W, 3))
+                display_frame = cv2.resize(display_frame, (self.SCREEN_W, self.SCREEN_H), dst=present,
+                                           interpolation=cv2.INTER_LINEAR)
+
+        return display_frame
+
+    def finish_frame(self, work_ms):
+        """Feeds the frame work time (without limiter sleep) to the perf stats and the governor."""
+        self.perf.record("frame", work_ms)
+        if self.governor.update(work_ms):
+            self.render_w, self.render_h = self._apply_quality_tier(self.governor.tier)
+        elif self.engine.model_complexity and not self._full_hands_fits():
+            # Full model over the vision budget: back to Lite until the next tier change
+            self.engine.request_model_complexity(0)
+
+    def get_stats(self):
+        return {
+            "face_detector": self.face_detector.get_stats(),
+            "scheduler": self.scheduler.get_stats(),
+            "quality_tier": self.governor.tier["name"],
+            "quality": dict(self.governor.get_stats(), hands_model=self.engine.model_complexity),
+            "events": self.bus.get_stats(),
+            "screens": self.screens.get_stats(),
+            "assets": get_assets().get_stats(),
+            "text": get_text_cache().get_stats(),
+            "text_layout": get_layout_engine().get_stats(),
+            "gradients": get_gradients().get_stats(),
+            "buffers": get_buffers().get_stats()
+        }
+
+
+def _build_warm_app(perf):
+    app = KioskApp(perf=perf)
+    app.warm_up()
+    return app
+
+
+def run_live(camera_source=0, start_time=None):
+    """
+    Kiosk with camera + fullscreen window (entry point of main_app.py).
+    start_time: perf_counter() at process start, for the time-to-first-interactive metric.
+    """
+    from src.core.startup import StartupLoader
+    from src.ui.screens.splash import SplashScreen
+    from src.vision.camera_thread import CameraThread
+    from src.vision.vision_worker import VisionWorker
+
+    if start_time is None:
+        start_time = time.perf_counter()
+
+    # Stage timers: only active with the HUD on (key 'p') or when dumping to JSON
+    perf = PerfMonitor(window=config.PERF_WINDOW, enabled=bool(config.PERF_DUMP_PATH))
+
+    # 1. SETUP WINDOW + SPLASH (before anything heavy)
+    window_name = "University AI Kiosk"
+    cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
+    cv2.setWindowProperty(window_name, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
+
+    splash = SplashScreen()
+    window_w, window_h = config.WINDOW_SIZE
+    splash_frame = np.zeros((window_h, window_w, 3), dtype=np.uint8)
+    cv2.imshow(window_name, splash.draw(splash_frame, ["camera", "app"]))
+    cv2.waitKey(1)
+    startup = {"splash_ms": (time.perf_counter() - start_time) * 1000.0}
+
+    # 2. CAMERA + MODELS in parallel, on worker threads
+    loader = StartupLoader()
+    loader.add("camera", lambda: CameraThread(camera_source, perf).start())
+    loader.add("app", lambda: _build_warm_app(perf))
+
+    while not loader.done():
+        cv2.imshow(window_name, splash.draw(splash_frame, loader.pending()))
+        if cv2.waitKey(15) & 0xFF == ord('q'):
+            cv2.destroyAllWindows()
+            return
+
+    camera = loader.result("camera")
+    app = loader.result("app")
+    startup["tasks_ms"] = loader.timings_ms
+
+    # Inference runs on its own thread, the loop below only renders
+    worker = VisionWorker(camera, app.engine, app.face_detector, app.scheduler, perf).start()
+
+    # Optional gesture trace (replayed later by scripts/replay_trace.py)
+    recorder = None
+    if config.TRACE_RECORD_PATH:
+        from src.vision.gesture_trace import GestureTraceRecorder
+        recorder = GestureTraceRecorder(config.TRACE_RECORD_PATH, config.TRACE_RECORD_LANDMARKS)
+    frame_interval = 1.0 / TARGET_FPS
+
+    # MAIN LOOP
+    while True:
+        loop_start = time.perf_counter()
+
+        # Newest camera frame for the background (never waits for inference)
+        success, frame, frame_time, frame_seq = camera.peek()
+        if camera.failed: break
+        if not success:
+            time.sleep(0.005)
+            continue
+
+        vision = worker.get_latest()
+        if recorder is not None and vision is not None and vision["is_new"]:
+            recorder.record(vision["capture_time"], vision["gesture_data"])
+
+        display_frame = app.step(frame, vision)
+
+        with perf.stage("present"):
+            cv2.imshow(window_name, display_frame)
+            key = cv2.waitKey(1) & 0xFF
+
+        # First frame that reacts to the user (camera + inference result on screen)
+        if "ttfi_ms" not in startup and vision is not None:
+            startup["ttfi_ms"] = (time.perf_counter() - start_time) * 1000.0
+            print(f"Startup: splash {startup['splash_ms']:.0f} ms, first interactive frame {startup['ttfi_ms']:.0f} ms "
+                  f"({', '.join(f'{k} {v:.0f} ms' for k, v in startup['tasks_ms'].items())})")
+        if key == ord('q'): break
+        if key == ord('p'): perf.toggle_hud()
+
+        # Quality governor sees the real work time (without the limiter sleep)
+        work_time = time.perf_counter() - loop_start
+        app.finish_frame(work_time * 1000.0)
+
+        # Frame limiter: no point redrawing faster than the display
+        remaining = frame_interval - work_time
+        if remaining > 0:
+            time.sleep(remaining)
+
+    worker.stop()
+    if recorder is not None:
+        recorder.close()
+    stats = camera.get_stats()
+    print(f"Camera: {stats['captured']} frames captured, {stats['dropped']} dropped")
+    app_stats = app.get_stats()
+    face_stats = app_stats["face_detector"]
+    print(f"FaceDetector: {face_stats['full_detections']} detections, {face_stats['tracked_frames']} tracked, "
+          f"{face_stats['tracker_losses']} tracker losses, {face_stats['hits']} cache hits")
+    if config.PERF_DUMP_PATH:
+        app_stats["camera"] = stats
+        app_stats["startup"] = startup
+        perf.dump_json(config.PERF_DUMP_PATH, extra=app_stats)
+    camera.release()
+    cv2.destroyAllWindows()
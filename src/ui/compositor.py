@@ -0,0 +1,170 @@
+# src/ui/compositor.py
+# Compozitie sprite-uri cu alpha premultiplicat, comuna tuturor ecranelor.
+import weakref
+
+import cv2
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class Sprite:
+    """
+    Image prepared for blending, computed ONCE:
+      premul    = bgr * alpha / 255   (uint8)
+      inv_alpha = 255 - alpha         (uint8, 3 channels)
+    so a blend is  dst = dst * inv_alpha / 255 + premul,  two OpenCV calls
+    on the whole ROI instead of per-channel float64 loops.
+    Opaque images (3 channels or alpha 255 everywhere) are plain copies.
+    """
+    __slots__ = ("w", "h", "premul", "inv_alpha", "opaque", "_tiles")
+
+    def __init__(self, img):
+        self.h, self.w = img.shape[:2]
+        self._tiles = None
+        if img.ndim == 2:
+            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+
+        alpha = img[:, :, 3] if img.shape[2] == 4 else None
+        self.opaque = alpha is None or bool(alpha.min() == 255)
+        if self.opaque:
+            self.premul = np.ascontiguousarray(img[:, :, :3])
+            self.inv_alpha = None
+        else:
+            alpha3 = cv2.merge((alpha, alpha, alpha))
+            self.premul = cv2.multiply(np.ascontiguousarray(img[:, :, :3]), alpha3, scale=1.0 / 255)
+            self.inv_alpha = cv2.bitwise_not(alpha3)
+
+    @classmethod
+    def from_premultiplied(cls, premul, alpha):
+        """Sprite from an already premultiplied BGR image and its alpha (rendered text, glows)."""
+        sprite = cls.__new__(cls)
+        sprite.h, sprite.w = premul.shape[:2]
+        sprite._tiles = None
+        sprite.opaque = False
+        sprite.premul = np.ascontiguousarray(premul)
+        sprite.inv_alpha = cv2.bitwise_not(cv2.merge((alpha, alpha, alpha)))
+        return sprite
+
+
+def blit(dst, sprite, x, y):
+    """Draws sprite with its top-left corner at (x, y). Clipped to dst; returns dst."""
+    dst_h, dst_w = dst.shape[:2]
+    x1, y1 = max(0, x), max(0, y)
+    x2, y2 = min(dst_w, x + sprite.w), min(dst_h, y + sprite.h)
+    if x1 >= x2 or y1 >= y2:
+        return dst
+
+    sx, sy = x1 - x, y1 - y
+    sw, sh = x2 - x1, y2 - y1
+    roi = dst[y1:y2, x1:x2]
+    premul = sprite.premul[sy:sy + sh, sx:sx + sw]
+    if sprite.opaque:
+        roi[:] = premul
+    else:
+        cv2.multiply(roi, sprite.inv_alpha[sy:sy + sh, sx:sx + sw], dst=roi, scale=1.0 / 255)
+        cv2.add(roi, premul, dst=roi)
+    return dst
+
+
+def _tiles(sprite, count):
+    """premul / inv_alpha stacked `count` times, (count * h, w, 3); grown by doubling."""
+    tiles = sprite._tiles
+    if tiles is None or tiles[0] < count:
+        n = max(count, 2 * tiles[0] if tiles else 16)
+        tiles = sprite._tiles = (n, np.tile(sprite.premul, (n, 1, 1)), np.tile(sprite.inv_alpha, (n, 1, 1)))
+    rows = count * sprite.h
+    return tiles[1][:rows], tiles[2][:rows]
+
+
+def _rounds(xs, ys, w, h):
+    """
+    Splits sprite positions into groups with no overlap inside a group.
+    Positions fall into w x h cells; two sprites in different cells of the
+    same (column, row) parity are at least one sprite apart, so a group is
+    "k-th sprite of its cell, for one of the 4 parities".
+    """
+    cx, cy = xs // w, ys // h
+    cell = cy * (int(cx.max()) + 1) + cx
+    order = np.argsort(cell, kind="stable")
+    sorted_cell = cell[order]
+    idx = np.arange(len(order))
+    starts = np.ones(len(order), dtype=bool)
+    starts[1:] = sorted_cell[1:] != sorted_cell[:-1]
+    rank = np.empty_like(idx)
+    rank[order] = idx - np.maximum.accumulate(np.where(starts, idx, 0))
+    key = rank * 4 + (cx & 1) + 2 * (cy & 1)
+    return [np.flatnonzero(key == k) for k in np.unique(key)]
+
+
+def _blit_batch(windows, sprite, xs, ys):
+    """Blend of n non-overlapping, fully visible sprites: gather -> 2 OpenCV calls -> scatter."""
+    n, h, w = len(xs), sprite.h, sprite.w
+    premul, inv_alpha = _tiles(sprite, n)
+    stack = windows[ys, xs].reshape(n * h, w, 3)
+    cv2.multiply(stack, inv_alpha, dst=stack, scale=1.0 / 255)
+    cv2.add(stack, premul, dst=stack)
+    windows[ys, xs] = stack.reshape(n, h, w, 3)
+
+
+# Below this many copies, plain blit() calls cost less than gather / scatter
+_BATCH_MIN = 4
+
+
+def blit_many(dst, sprite, xs, ys):
+    """
+    Draws `sprite` with its top-left corner at every (xs[i], ys[i]).
+    Same pixels as calling blit() for each position (only the stacking order
+    of overlapping copies may differ), but sprites fully inside dst are
+    drawn in a few batched NumPy / OpenCV passes instead of one Python
+    call each. Sprites crossing the border (and very small batches) go
+    through blit().
+    """
+    xs = np.asarray(xs, dtype=np.intp)
+    ys = np.asarray(ys, dtype=np.intp)
+    dst_h, dst_w = dst.shape[:2]
+    if not len(xs):
+        return dst
+    if dst.ndim != 3 or dst.shape[2] != 3 or sprite.w > dst_w or sprite.h > dst_h:
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            blit(dst, sprite, x, y)
+        return dst
+
+    inside = (xs >= 0) & (ys >= 0) & (xs + sprite.w <= dst_w) & (ys + sprite.h <= dst_h)
+    if len(xs) < _BATCH_MIN:
+        inside[:] = False
+    for x, y in zip(xs[~inside].tolist(), ys[~inside].tolist()):
+        blit(dst, sprite, x, y)
+
+    xs, ys = xs[inside], ys[inside]
+    if not len(xs):
+        return dst
+    # windows[y, x] is the (h, w, 3) ROI with top-left (x, y): a view, nothing copied
+    windows = sliding_window_view(dst, (sprite.h, sprite.w, 3), writeable=True)[:, :, 0]
+    if sprite.opaque:
+        # Plain copies, written in order: overlaps end up like sequential blits
+        windows[ys, xs] = sprite.premul
+    else:
+        for group in _rounds(xs, ys, sprite.w, sprite.h):
+            _blit_batch(windows, sprite, xs[group], ys[group])
+    return dst
+
+
+# Sprite-uri pentru imaginile din AssetManager: acelasi array -> acelasi Sprite.
+# Cheia e id(img), curatata automat cand array-ul dispare (evictie LRU).
+_sprites = {}
+
+
+def sprite_of(img):
+    """Cached Sprite for an image array that is reused between frames (asset variants)."""
+    key = id(img)
+    entry = _sprites.get(key)
+    if entry is not None and entry[0]() is img:
+        return entry[1]
+    sprite = Sprite(img)
+    _sprites[key] = (weakref.ref(img, lambda _, key=key: _sprites.pop(key, None)), sprite)
+    return sprite
+
+
+def blit_image(dst, img, x, y):
+    """blit() for an image array (premultiplied once, then cached)."""
+    return blit(dst, sprite_of(img), x, y)
@@ -0,0 +1,75 @@
+# src/ui/gradients.py
+# Gradienti verticali generati vectorizat si memorati per (marime, culori).
+from collections import OrderedDict
+
+import numpy as np
+
+from src import config
+
+
+class GradientCache:
+    """
+    Vertical gradient tiles, built with one NumPy expression (no per-row
+    Python loop) and cached by (w, h, top color, bottom color). Drawing a
+    gradient panel is then one slice copy. Tiles are shared and read-only.
+    """
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries if max_entries is not None else config.GRADIENT_CACHE_ENTRIES
+        self._tiles = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def vertical(self, w, h, c_top, c_bottom):
+        """(h, w, 3) uint8 tile: row i = c_top * (1 - i/h) + c_bottom * i/h, truncated."""
+        key = (w, h, tuple(c_top), tuple(c_bottom))
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            self.stats["hits"] += 1
+            return tile
+
+        self.stats["misses"] += 1
+        alpha = (np.arange(h, dtype=np.float64) / h)[:, None]
+        column = (np.array(c_top[:3], dtype=np.float64) * (1 - alpha) +
+                  np.array(c_bottom[:3], dtype=np.float64) * alpha).astype(np.uint8)
+        tile = np.ascontiguousarray(np.broadcast_to(column[:, None, :], (h, w, 3)))
+        tile.flags.writeable = False
+
+        self._tiles[key] = tile
+        if len(self._tiles) > self.max_entries:
+            self._tiles.popitem(last=False)
+            self.stats["evictions"] += 1
+        return tile
+
+    def get_stats(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return dict(
+            self.stats,
+            hit_rate=self.stats["hits"] / lookups if lookups else 0.0,
+            entries=len(self._tiles),
+            kb=sum(t.nbytes for t in self._tiles.values()) / 1024.0
+        )
+
+
+# Cache-ul comun tuturor ecranelor
+_gradients = None
+
+
+def get_gradients():
+    global _gradients
+    if _gradients is None:
+        _gradients = GradientCache()
+    return _gradients
+
+
+def draw_vertical_gradient(frame, x, y, w, h, c_top, c_bottom):
+    """Copies the cached gradient tile to frame at (x, y), clipped to the frame."""
+    if w <= 0 or h <= 0:
+        return frame
+    tile = get_gradients().vertical(w, h, c_top, c_bottom)
+    fh, fw = frame.shape[:2]
+    x1, y1 = max(0, x), max(0, y)
+    x2, y2 = min(fw, x + w), min(fh, y + h)
+    if x1 < x2 and y1 < y2:
+        frame[y1:y2, x1:x2] = tile[y1 - y:y2 - y, x1 - x:x2 - x]
+    return frame
@@ -0,0 +1,65 @@
+# src/ui/particles.py
+# Particule care cad (screensaver), tinute ca array-uri NumPy: o operatie pe toate odata.
+import cv2
+import numpy as np
+
+from src.ui.compositor import blit_many
+
+
+class ParticleField:
+    """
+    Falling particles as a struct of arrays (normalized 0.0 - 1.0 positions):
+      x, y   - position (top-left of the sprite)
+      speed  - fall per update, fraction of the screen height
+      kind   - sprite index (one sprite per color for the fallback streaks)
+    update() moves and respawns all of them with a few array operations and
+    draw() composites each kind with one blit_many() call, so the cost grows
+    with the pixels drawn, not with Python calls per particle.
+    """
+
+    def __init__(self, count, speed_range=(0.003, 0.01), kinds=1):
+        self.count = count
+        self.x = np.random.random(count)
+        self.y = np.random.random(count)
+        self.speed = np.random.uniform(speed_range[0], speed_range[1], count)
+        self.kind = np.random.randint(0, kinds, count)
+        self.kinds = kinds
+
+    def update(self):
+        self.y += self.speed
+        # Off the bottom (> 1.05) -> back to the top, at a new column
+        wrapped = self.y > 1.05
+        n = int(np.count_nonzero(wrapped))
+        if n:
+            self.y[wrapped] = -0.05
+            self.x[wrapped] = np.random.random(n)
+
+    def draw(self, frame, sprites, offset=(0, 0)):
+        """
+        sprites: one compositor Sprite per kind; offset: sprite pixel drawn at
+        the particle position, as (-dx, -dy) of the sprite's top-left.
+        """
+        h, w = frame.shape[:2]
+        # int() truncation, like the per-particle code
+        xs = (self.x * w).astype(np.intp) + offset[0]
+        ys = (self.y * h).astype(np.intp) + offset[1]
+        if len(sprites) == 1:
+            blit_many(frame, sprites[0], xs, ys)
+            return frame
+        for kind, sprite in enumerate(sprites):
+            sel = self.kind == kind
+            blit_many(frame, sprite, xs[sel], ys[sel])
+        return frame
+
+
+def streak_image(color, length=10, radius=2):
+    """
+    BGRA sprite of the fallback particle: a dot with a 1 px trail above it
+    (same pixels as cv2.circle + cv2.line). The dot's center is at
+    (radius, length), pass (-radius, -length) as the draw offset.
+    """
+    img = np.zeros((length + radius + 1, 2 * radius + 1, 4), dtype=np.uint8)
+    bgra = tuple(color) + (255,)
+    cv2.circle(img, (radius, length), radius, bgra, -1)
+    cv2.line(img, (radius, length), (radius, 0), bgra, 1)
+    return img
@@ -1,62 +1,95 @@
 import cv2
-import time
 import random
 import numpy as np
-import os
-import math
-
-class FallingItem:
-    def __init__(self, screen_w, item_type, text):
-        self.type = item_type 
-        self.text = text
-        
-        # Pozitie initiala
-        self.x = random.randint(70, screen_w - 70)
-        self.y = -70 
-        
-        # Viteza
-        base_speed = 20 
-        self.speed = random.uniform(base_speed, base_speed + 3)
-        
-        # Dimensiune
-        self.radius = 50 
-        self.collected = False
-        
-        # Culori & Text
-        if self.type == "GOOD":
-            self.color = (0, 200, 0)     # Verde
-            self.border = (0, 255, 0)    # Neon Verde
-            self.text_color = (0, 0, 0)  # --- TEXT NEGRU (Contrast mai bun) ---
-        elif self.type == "TROLL":
-            self.color = (255, 100, 0)   # Albastru/Cyan
-            self.border = (255, 255, 255)# Alb
-            self.text_color = (255, 255, 255) # Text Alb
-            self.speed += 8              # TROLL e mult mai rapid
-            self.radius = 55             
-
-    def update(self):
-        self.y += self.speed
-
-    def draw(self, frame, shake_x=0, shake_y=0):
-        # Aplicam shake-ul la coordonatele de desenare
-        draw_x = int(self.x + shake_x)
-        draw_y = int(self.y + shake_y)
-        
-        cv2.circle(frame, (draw_x, draw_y), self.radius, self.color, -1)
-        cv2.circle(frame, (draw_x, draw_y), self.radius, self.border, 3)
-        
-        font_scale = 0.8
-        if self.type == "TROLL": font_scale = 1.1
-        
-        ts = cv2.getTextSize(self.text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)[0]
-        tx = int(draw_x - ts[0] // 2)
-        ty = int(draw_y + ts[1] // 2)
-        
-        # Folosim culoarea textului definita in __init__
-        cv2.putText(frame, self.text, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, self.text_color, 2)
+from src import config
+from src.ui.shared import QUALITY, tint_rect, dim_frame
+from src.core import clock
+from src.core.assets import get_assets
+from src.core.event_bus import publish, GameFinished
+from src.ui.compositor import Sprite, blit
+from src.ui.text_cache import put_text, text_size
+from src.ui.viewport import viewport, DESIGN_W, DESIGN_H
+
+# Tipuri de iteme (index in FallingItems.kind)
+GOOD, TROLL = 0, 1
+
+# The speeds (px per update) and the shake decay (x0.9 per frame) were tuned
+# on the ~30 FPS camera loop; the fixed-step simulation keeps that pace
+REFERENCE_HZ = 30
+SHAKE_DECAY = 0.9
+
+# Per type: fill color, border, text color, font scale, radius (design px), extra speed
+ITEM_STYLES = {
+    GOOD:  ((0, 200, 0), (0, 255, 0), (0, 0, 0), 0.8, 50, 0),               # Verde, neon verde, TEXT NEGRU (contrast)
+    TROLL: ((255, 100, 0), (255, 255, 255), (255, 255, 255), 1.1, 55, 8),   # Albastru/Cyan, alb; TROLL e mult mai rapid
+}
+
+
+class FallingItems:
+    """
+    The falling items as a struct of arrays, in design space (1920x1080):
+      x, y    - center
+      prev_y  - y one simulation step earlier (draw interpolates between them)
+      speed   - fall speed (px / s)
+      radius  - hitbox / sprite radius (px)
+      kind    - GOOD / TROLL
+      label   - index into the label list of its kind
+    Only the first `n` rows are live. Motion and the basket hit test are
+    array operations on all of them; caught / missed / off-screen items are
+    dropped by compacting the rows in place (capacity doubles when full).
+    """
+    FIELDS = (("x", np.float64), ("y", np.float64), ("prev_y", np.float64), ("speed", np.float64),
+              ("radius", np.int32), ("kind", np.int8), ("label", np.int16))
+
+    def __init__(self, capacity=32):
+        self.n = 0
+        self.capacity = capacity
+        for name, dtype in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        self.n = 0
+
+    def add(self, x, y, speed, radius, kind, label):
+        if self.n == self.capacity:
+            self.capacity *= 2
+            for name, dtype in self.FIELDS:
+                grown = np.zeros(self.capacity, dtype=dtype)
+                grown[:self.n] = getattr(self, name)[:self.n]
+                setattr(self, name, grown)
+        i = self.n
+        self.x[i], self.y[i], self.prev_y[i], self.speed[i] = x, y, y, speed
+        self.radius[i], self.kind[i], self.label[i] = radius, kind, label
+        self.n += 1
+
+    def move(self, dt):
+        n = self.n
+        self.prev_y[:n] = self.y[:n]
+        self.y[:n] += self.speed[:n] * dt
+
+    def draw_y(self, alpha):
+        """y between the last two steps: alpha 0.0 = previous, 1.0 = current."""
+        n = self.n
+        return self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+
+    def keep(self, mask):
+        """Compacts the live rows to the ones where mask is True (same order)."""
+        k = int(np.count_nonzero(mask))
+        if k == self.n:
+            return
+        for name, _ in self.FIELDS:
+            arr = getattr(self, name)
+            arr[:k] = arr[:self.n][mask]
+        self.n = k
 
 class ArcadeComponent:
-    def __init__(self):
+    # Vision: only the hand cursor matters while playing
+    VISION_NEEDS = {"hands": 1, "face": 0}
+
+    def __init__(self, level=None):
         self.active = False
         self.game_over = False
         
@@ -66,16 +99,21 @@ class ArcadeComponent:
         
         self.good_labels = ["DATA", "INFO", "WIFI", "JAVA", "PY", "C++", "HTML", "CSS", "JS", "SQL"]
         self.troll_labels = ["JOB", "CV", "HR", "BOSS"] 
+        self.labels = {GOOD: self.good_labels, TROLL: self.troll_labels}
+
+        # Dificultate (config.ARCADE_LEVELS): spawn delay, items per spawn, troll chance
+        self.level = config.ARCADE_LEVELS.get(level or config.ARCADE_LEVEL, config.ARCADE_LEVELS["normal"])
+
+        # Items (arrays) + their sprites, rendered once per (type, label, resolution)
+        self.items = FallingItems()
+        self.item_sprites = {}
         
-        # Incarcare imagine Troll
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.abspath(os.path.join(current_dir, "../../../"))
-        img_path = os.path.join(project_root, "assets", "images", "job_application.png")
-        
-        self.troll_img = cv2.imread(img_path)
+        # Incarcare imagine Troll (partajata cu Maze prin AssetManager)
+        self.troll_img = get_assets().image("job_application.png")
         if self.troll_img is None:
-            self.troll_img = np.zeros((720, 1280, 3), dtype=np.uint8)
-            self.troll_img[:] = (0, 0, 255)
+            placeholder = np.zeros((720, 1280, 3), dtype=np.uint8)
+            placeholder[:] = (0, 0, 255)
+            self.troll_img = get_assets().register("job_application.png", placeholder)
 
         # High Score Session-Based
         self.high_score = 0
@@ -117,8 +155,13 @@ class ArcadeComponent:
         self.score = 0
         self.lives = 3
         
-        self.items = []
-        self.last_spawn_time = time.time()
+        self.items.clear()
+
+        # Simulare cu pas fix (config.ARCADE_TICK_HZ), independenta de FPS
+        self.sim_time = 0.0
+        self.sim_accum = 0.0
+        self.last_tick_time = clock.now()
+        self.last_spawn_time = 0.0  # sim time
         
         self.troll_active = False
         self.troll_start_time = 0
@@ -126,6 +169,7 @@ class ArcadeComponent:
         
         self.basket_x = 0 
         self.last_cx = 0.5 
+        self.hand_visible = True  # jocul porneste cu mana pe ecran
         
         self.hovered_btn = None
         self.selection_progress = 0.0
@@ -139,11 +183,27 @@ class ArcadeComponent:
     def _trigger_damage(self):
         """Activeaza efectul de damage (Flash rosu + Shake)"""
         self.lives -= 1
-        self.damage_timer = time.time()
+        self.damage_timer = clock.now()
         self.shake_intensity = 25 
 
+    def _finish(self):
+        """Back to the games hub (the hub reacts to GameFinished)."""
+        self.active = False
+        publish(GameFinished("ARCADE", self.score, source=self))
+
     def update(self, cx, cy):
+        """
+        Input only (basket x, buttons); the items move in draw(), once per
+        rendered frame. cx None = hand lost: the simulation pauses until it
+        comes back, and the time without a hand is not caught up.
+        """
         if not self.active: return
+        if cx is None:
+            self.hand_visible = False
+            return
+        if not self.hand_visible:
+            self.hand_visible = True
+            self.last_tick_time = clock.now()
         
         # --- VERIFICARE BUTON BACK ---
         if not self.game_over and not self.troll_active:
@@ -151,29 +211,24 @@ class ArcadeComponent:
             if bx < cx < bx + bw and by < cy < by + bh:
                 if not self.back_hovered:
                     self.back_hovered = True
-                    self.back_start_time = time.time()
+                    self.back_start_time = clock.now()
                     self.back_progress = 0.0
                 else:
-                    elapsed = time.time() - self.back_start_time
+                    elapsed = clock.now() - self.back_start_time
                     self.back_progress = min(elapsed / self.SELECTION_THRESHOLD, 1.0)
                     if self.back_progress >= 1.0:
-                        self.active = False 
+                        self._finish()
             else:
                 self.back_hovered = False
                 self.back_progress = 0.0
 
         # TROLL LOGIC
         if self.troll_active:
-            if time.time() - self.troll_start_time > self.TROLL_DURATION:
+            if clock.now() - self.troll_start_time > self.TROLL_DURATION:
                 self.troll_active = False
 
-        # GAME OVER LOGIC
-        if self.lives <= 0:
-            if not self.game_over:
-                self.game_over = True
-                if self.score > self.high_score:
-                    self.high_score = self.score
-            
+        # GAME OVER LOGIC (game_over e setat de _advance())
+        if self.game_over:
             # Selectie butoane Game Over
             hovered = None
             for key, (bx, by, bw, bh) in self.game_over_buttons.items():
@@ -182,105 +237,204 @@ class ArcadeComponent:
                     break
             
             if hovered and hovered == self.hovered_btn:
-                elapsed = time.time() - self.hover_start_time
+                elapsed = clock.now() - self.hover_start_time
                 self.selection_progress = min(elapsed / self.SELECTION_THRESHOLD, 1.0)
                 
                 if self.selection_progress >= 1.0:
                     if hovered == "RETRY":
                         self.reset()
                     elif hovered == "MENU":
-                        self.active = False 
+                        self._finish()
             else:
                 self.hovered_btn = hovered
-                self.hover_start_time = time.time()
+                self.hover_start_time = clock.now()
                 self.selection_progress = 0.0
                 
             return 
 
         self.last_cx = cx 
 
+    def _advance(self, cx):
+        """
+        Runs the simulation in fixed steps for the time since the last call.
+        A slow frame runs several steps, a fast one may run none (draw()
+        interpolates); after a stall at most ARCADE_MAX_TICKS steps are run
+        and the rest of the backlog is dropped. Called by draw().
+        """
+        dt = 1.0 / config.ARCADE_TICK_HZ
+        now = clock.now()
+        self.sim_accum += now - self.last_tick_time
+        self.last_tick_time = now
+
+        steps = int(self.sim_accum / dt)
+        if steps > config.ARCADE_MAX_TICKS:
+            steps = config.ARCADE_MAX_TICKS
+            self.sim_accum = steps * dt
+        for _ in range(steps):
+            self.sim_accum -= dt
+            self.sim_time += dt
+            self._tick(cx, dt)
+            if self.lives <= 0:
+                self.sim_accum = 0.0
+                self.game_over = True
+                if self.score > self.high_score:
+                    self.high_score = self.score
+                break
+
+    def _tick(self, cx, dt):
         # --- SPAWNARE ---
-        spawn_delay = max(0.4, 0.9 - (self.score * 0.02))
+        spawn_delay = max(self.level["min_delay"], self.level["spawn_delay"] - (self.score * 0.02))
         
-        if time.time() - self.last_spawn_time > spawn_delay:
+        if self.sim_time - self.last_spawn_time > spawn_delay:
             self._spawn_item()
-            self.last_spawn_time = time.time()
+            self.last_spawn_time = self.sim_time
+
+        # Update Elemente (all items at once)
+        self._update_items(cx, dt)
 
-        # Update Elemente
-        sim_w, sim_h = 1920, 1080 
+    def _update_items(self, cx, dt):
+        items = self.items
+        if not items.n:
+            return
+        sim_w, sim_h = DESIGN_W, DESIGN_H
         basket_px = int(cx * sim_w)
         basket_py = sim_h - 100 
-        
-        for item in self.items:
-            item.update()
-            
-            # Hitbox
-            in_y_range = (item.y + item.radius >= basket_py - 20) and (item.y - item.radius <= basket_py + 40)
-            in_x_range = abs(item.x - basket_px) < (self.basket_w // 2 + item.radius)
-            
-            # 1. PRINS
-            if in_y_range and in_x_range and not item.collected:
-                item.collected = True
-                if item.type == "GOOD":
-                    self.score += 1
-                elif item.type == "TROLL":
-                    self.troll_active = True
-                    self.troll_start_time = time.time()
-                    self.score += 5
-            
-            # 2. RATAT (Doar pentru GOOD items)
-            if item.y > sim_h + 50 and not item.collected:
-                if item.type == "GOOD":
-                    item.collected = True 
-                    self._trigger_damage()
 
-        # Curatare lista
-        self.items = [i for i in self.items if not i.collected and i.y < sim_h + 100]
+        items.move(dt)
+        n = items.n
+        x, y, radius = items.x[:n], items.y[:n], items.radius[:n]
+
+        # Hitbox
+        in_y_range = (y + radius >= basket_py - 20) & (y - radius <= basket_py + 40)
+        caught = in_y_range & (np.abs(x - basket_px) < (self.basket_w // 2 + radius))
+        below = y > sim_h + 50
+        # Most steps catch / miss nothing: skip the bookkeeping (few items = a few us of NumPy calls each)
+        if not (caught.any() or below.any()):
+            return
+        good = items.kind[:n] == GOOD
+
+        # 1. PRINS
+        self.score += int(np.count_nonzero(caught & good))
+        trolls = int(np.count_nonzero(caught & ~good))
+        if trolls:
+            self.troll_active = True
+            self.troll_start_time = clock.now()
+            self.score += 5 * trolls
+
+        # 2. RATAT (Doar pentru GOOD items)
+        missed = good & ~caught & below
+        for _ in range(int(np.count_nonzero(missed))):
+            self._trigger_damage()
+
+        # Curatare (compactare in loc, fara lista noua)
+        items.keep(~(caught | missed) & (y < sim_h + 100))
 
     def _spawn_item(self):
-        sim_w = 1920
-        rand_val = random.random()
-        
-        if rand_val < 0.15: 
-            text = random.choice(self.troll_labels)
-            item = FallingItem(sim_w, "TROLL", text)
-        else:
-            text = random.choice(self.good_labels)
-            item = FallingItem(sim_w, "GOOD", text)
-            
-        speed_boost = min(15, self.score * 0.5)
-        item.speed += speed_boost
-        
-        self.items.append(item)
+        sim_w = DESIGN_W
+        for _ in range(self.level["burst"]):
+            rand_val = random.random()
 
-    def _draw_laptop(self, frame, x, y, shake_x, shake_y):
+            if rand_val < self.level["troll_chance"]:
+                kind, text = TROLL, random.choice(self.troll_labels)
+            else:
+                kind, text = GOOD, random.choice(self.good_labels)
+            radius, extra_speed = ITEM_STYLES[kind][4:]
+
+            # Pozitie initiala + viteza
+            x = random.randint(70, sim_w - 70)
+            base_speed = 20 
+            speed = random.uniform(base_speed, base_speed + 3)
+            if extra_speed:
+                speed += extra_speed
+
+            speed_boost = min(15, self.score * 0.5)
+            speed += speed_boost
+
+            # px / update at REFERENCE_HZ -> px / s
+            self.items.add(x, -70, speed * REFERENCE_HZ, radius, kind, self.labels[kind].index(text))
+
+    def _item_sprite(self, vp, kind, label):
+        """
+        Circle + border + label of one item type, as a Sprite for this
+        resolution (same OpenCV calls as the old per-item draw). Returns the
+        sprite and the offset of its center.
+        """
+        color, border, text_color, font_scale, radius, _ = ITEM_STYLES[kind]
+        radius, thick = int(radius * vp.s), vp.thick(3)
+        font_scale, thickness = vp.font(font_scale), vp.thick(2)
+        key = (kind, label, radius, thick, font_scale, thickness)
+        cached = self.item_sprites.get(key)
+        if cached is not None:
+            return cached
+
+        text = self.labels[kind][label]
+        ts = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)[0]
+        c = max(radius + thick, ts[0] // 2 + thickness) + 2
+        size = 2 * c + 1
+        tx, ty = c - ts[0] // 2, c + ts[1] // 2
+
+        # Drawn on black: the image is already premultiplied by the alpha mask
+        img = np.zeros((size, size, 3), dtype=np.uint8)
+        alpha = np.zeros((size, size), dtype=np.uint8)
+        for canvas, fill, edge in ((img, color, border), (alpha, 255, 255)):
+            cv2.circle(canvas, (c, c), radius, fill, -1)
+            cv2.circle(canvas, (c, c), radius, edge, thick)
+        cv2.putText(img, text, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, text_color, thickness)
+        # Text past the circle edge (long labels) keeps its anti-aliased coverage
+        glyphs = np.zeros_like(alpha)
+        cv2.putText(glyphs, text, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, 255, thickness)
+        np.maximum(alpha, glyphs, out=alpha)
+
+        cached = self.item_sprites[key] = (Sprite.from_premultiplied(img, alpha), c)
+        return cached
+
+    def _draw_items(self, frame, vp, shake_x=0, shake_y=0):
+        """All items, one cached-sprite blit() each."""
+        items = self.items
+        n = items.n
+        if not n:
+            return
+        # Pozitia e in spatiul de design (1920x1080) -> pixeli + shake (int() truncation),
+        # interpolated between the last two simulation steps
+        alpha = min(1.0, self.sim_accum * config.ARCADE_TICK_HZ)
+        # Per-item blit() beats blit_many() here at any count: the 111 px
+        # sprites overlap often (many blend rounds) and the usual 1-10 items
+        # don't pay for the gather / scatter
+        xs = ((items.x[:n] * vp.sx).astype(np.intp) + shake_x).tolist()
+        ys = ((items.draw_y(alpha) * vp.sy).astype(np.intp) + shake_y).tolist()
+        for x, y, kind, label in zip(xs, ys, items.kind[:n].tolist(), items.label[:n].tolist()):
+            sprite, c = self._item_sprite(vp, kind, label)
+            blit(frame, sprite, x - c, y - c)
+
+    def _draw_laptop(self, frame, vp, x, y, shake_x, shake_y):
         x += int(shake_x)
         y += int(shake_y)
         
-        base_w = self.basket_w
-        base_h = 20
-        screen_h = 80
+        base_w = vp.px(self.basket_w)
+        base_h = vp.px(20)
+        screen_h = vp.px(80)
         screen_w = base_w
+        p5, p15, p20 = vp.px(5), vp.px(15), vp.px(20)
         
         cv2.rectangle(frame, (x - screen_w//2, y - screen_h), (x + screen_w//2, y), (50, 50, 50), -1)
-        cv2.rectangle(frame, (x - screen_w//2 + 5, y - screen_h + 5), (x + screen_w//2 - 5, y - 5), (255, 200, 100), -1)
+        cv2.rectangle(frame, (x - screen_w//2 + p5, y - screen_h + p5), (x + screen_w//2 - p5, y - p5), (255, 200, 100), -1)
         
         for i in range(3):
-            ly = y - screen_h + 20 + (i * 15)
-            cv2.line(frame, (x - screen_w//2 + 15, ly), (x + screen_w//2 - 15, ly), (255, 255, 255), 2)
+            ly = y - screen_h + p20 + (i * p15)
+            cv2.line(frame, (x - screen_w//2 + p15, ly), (x + screen_w//2 - p15, ly), (255, 255, 255), vp.thick(2))
 
         cv2.rectangle(frame, (x - base_w//2, y), (x + base_w//2, y + base_h), (80, 80, 80), -1)
-        cv2.rectangle(frame, (x - 20, y + 5), (x + 20, y + 15), (40, 40, 40), -1)
+        cv2.rectangle(frame, (x - p20, y + p5), (x + p20, y + p15), (40, 40, 40), -1)
 
-    def _draw_heart(self, frame, x, y, size, active):
+    def _draw_heart(self, frame, x, y, size, active, notch=3):
         color = (0, 0, 255) if active else (50, 50, 50) 
         
         radius = size // 2
         cv2.circle(frame, (x - radius, y - radius), radius, color, -1)
         cv2.circle(frame, (x + radius, y - radius), radius, color, -1)
         
-        pt1 = (x - size, y - radius + 3)
-        pt2 = (x + size, y - radius + 3)
+        pt1 = (x - size, y - radius + notch)
+        pt2 = (x + size, y - radius + notch)
         pt3 = (x, y + size)
         
         triangle_cnt = np.array( [pt1, pt2, pt3] )
@@ -288,6 +442,7 @@ class ArcadeComponent:
 
     def _draw_back_button(self, frame):
         h, w, _ = frame.shape
+        vp = viewport(frame)
         bx, by, bw, bh = self.back_btn_layout
         x1, y1 = int(bx * w), int(by * h)
         x2, y2 = int((bx + bw) * w), int((by + bh) * h)
@@ -295,15 +450,11 @@ class ArcadeComponent:
         corner_color = self.PALETTE["PINK"] if self.back_hovered else self.PALETTE["CYAN"]
         bg_color = self.PALETTE["BG_DARK"]
         
-        roi = frame[y1:y2, x1:x2]
-        block = np.zeros_like(roi, dtype=np.uint8)
-        block[:] = bg_color
-        cv2.addWeighted(block, 0.4, roi, 0.6, 0, roi)
-        frame[y1:y2, x1:x2] = roi
+        tint_rect(frame, x1, y1, x2, y2, bg_color, 0.4)
         
         corner_w = int((x2-x1) * 0.3)
         corner_h = int((y2-y1) * 0.4)
-        thick = 3 if self.back_hovered else 2
+        thick = vp.thick(3 if self.back_hovered else 2)
         
         cv2.line(frame, (x1, y1), (x1+corner_w, y1), corner_color, thick)
         cv2.line(frame, (x1, y1), (x1, y1+corner_h), corner_color, thick)
@@ -312,55 +463,58 @@ class ArcadeComponent:
         
         if self.back_hovered and self.back_progress > 0:
             pw = int((x2-x1) * self.back_progress)
-            cv2.rectangle(frame, (x1, y2-4), (x1+pw, y2), self.PALETTE["PINK"], -1)
+            cv2.rectangle(frame, (x1, y2 - vp.px(4)), (x1+pw, y2), self.PALETTE["PINK"], -1)
             
         label = "<< INAPOI"
-        ts = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
+        scale, t = vp.font(0.7), vp.thick(2)
+        ts = text_size(label, cv2.FONT_HERSHEY_SIMPLEX, scale, t)[0]
         tx = x1 + (x2-x1-ts[0]) // 2
         ty = y1 + (y2-y1+ts[1]) // 2
-        cv2.putText(frame, label, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.7, self.PALETTE["TEXT"], 2)
+        put_text(frame, label, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, scale, self.PALETTE["TEXT"], t)
 
     def draw(self, frame):
+        # Simularea avanseaza la fiecare frame randat, nu doar la un rezultat nou de vision
+        if self.active and not self.game_over and self.hand_visible:
+            self._advance(self.last_cx)
+
         h, w, _ = frame.shape
+        vp = viewport(frame)
+        t2 = vp.thick(2)
         
         shake_x, shake_y = 0, 0
-        damage_elapsed = time.time() - self.damage_timer
+        damage_elapsed = clock.now() - self.damage_timer
         is_damaged = (damage_elapsed < 0.4) 
         
-        if is_damaged:
-            shake_x = random.randint(-self.shake_intensity, self.shake_intensity)
-            shake_y = random.randint(-self.shake_intensity, self.shake_intensity)
-            self.shake_intensity = max(0, int(self.shake_intensity * 0.9))
+        if is_damaged and QUALITY["arcade_shake"]:
+            # Decays x0.9 per REFERENCE_HZ frame, whatever the real frame rate
+            shake = vp.px(int(self.shake_intensity * SHAKE_DECAY ** (damage_elapsed * REFERENCE_HZ)))
+            shake_x = random.randint(-shake, shake)
+            shake_y = random.randint(-shake, shake)
 
         if self.troll_active and self.troll_img is not None:
-            troll_overlay = cv2.resize(self.troll_img, (w, h))
+            troll_overlay = get_assets().variant("job_application.png", (w, h))
             frame[:] = troll_overlay
-            cv2.putText(frame, "GET A JOB", (w//2 - 250, h//2), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 3.0, (0, 0, 255), 8)
-            cv2.putText(frame, "GET A JOB", (w//2 - 250, h//2), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 3.0, (255, 255, 255), 3)
+            put_text(frame, "GET A JOB", (w//2 - vp.px(250), h//2), 
+                     cv2.FONT_HERSHEY_SIMPLEX, vp.font(3.0), (255, 255, 255), vp.thick(3),
+                     shadow=(0, 0, (0, 0, 255), vp.thick(8)))
             return frame
 
         if self.game_over:
-            overlay = frame.copy()
-            bg_overlay = (10, 10, 30)
-            cv2.rectangle(overlay, (0, 0), (w, h), bg_overlay, -1)
-            cv2.addWeighted(overlay, 0.85, frame, 0.15, 0, frame)
+            dim_frame(frame, (10, 10, 30), 0.85)
             
             title = "GAME OVER"
             title_col = (0, 0, 255)
 
-            cv2.putText(frame, title, (w//2 - 200, h//3), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 2.0, title_col, 5)
-            cv2.putText(frame, title, (w//2 - 200, h//3), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 2.0, (255, 255, 255), 2)
+            put_text(frame, title, (w//2 - vp.px(200), h//3), 
+                     cv2.FONT_HERSHEY_SIMPLEX, vp.font(2.0), (255, 255, 255), t2,
+                     shadow=(0, 0, title_col, vp.thick(5)))
             
-            cv2.putText(frame, f"Scor Final: {self.score}", (w//2 - 150, h//3 + 80), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
+            put_text(frame, f"Scor Final: {self.score}", (w//2 - vp.px(150), h//3 + vp.px(80)), 
+                     cv2.FONT_HERSHEY_SIMPLEX, vp.font(1.2), (255, 255, 255), t2)
             
             hs_text = f"CEL MAI BUN (SESIUNE): {self.high_score}"
-            cv2.putText(frame, hs_text, (w//2 - 200, h//3 + 140), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 215, 255), 2)
+            put_text(frame, hs_text, (w//2 - vp.px(200), h//3 + vp.px(140)), 
+                     cv2.FONT_HERSHEY_SIMPLEX, vp.font(1.2), (0, 215, 255), t2)
 
             for key, (bx, by, bw, bh) in self.game_over_buttons.items():
                 x1 = int(bx * w)
@@ -377,67 +531,52 @@ class ArcadeComponent:
                     color_border = (0, 255, 0) if key == "RETRY" else (0, 100, 255)
                 
                 cv2.rectangle(frame, (x1, y1), (x2, y2), color_bg, -1)
-                cv2.rectangle(frame, (x1, y1), (x2, y2), color_border, 3)
+                cv2.rectangle(frame, (x1, y1), (x2, y2), color_border, vp.thick(3))
                 
                 if is_hovered:
                     prog_w = int((x2 - x1) * self.selection_progress)
-                    cv2.rectangle(frame, (x1, y2-10), (x1+prog_w, y2), (255, 255, 255), -1)
+                    cv2.rectangle(frame, (x1, y2 - vp.px(10)), (x1+prog_w, y2), (255, 255, 255), -1)
                 
                 label = "REINCEARCA" if key == "RETRY" else "INAPOI LA JOCURI"
-                ts = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
+                ts = text_size(label, cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.8), t2)[0]
                 tx = x1 + (x2 - x1 - ts[0]) // 2
                 ty = y1 + (y2 - y1 + ts[1]) // 2
-                cv2.putText(frame, label, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+                put_text(frame, label, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.8), (255, 255, 255), t2)
             
             return frame
 
         if is_damaged:
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (0, 0), (w, h), (0, 0, 255), -1) 
-            cv2.addWeighted(overlay, 0.3, frame, 0.7, 0, frame)
+            dim_frame(frame, (0, 0, 255), 0.3)
 
         basket_x = int(self.last_cx * w)
-        basket_y = h - 100
-        self._draw_laptop(frame, basket_x, basket_y, shake_x, shake_y)
+        basket_y = h - vp.px(100)
+        self._draw_laptop(frame, vp, basket_x, basket_y, shake_x, shake_y)
         
-        scale_x = w / 1920
-        scale_y = h / 1080
-        
-        for item in self.items:
-            orig_x, orig_y = item.x, item.y
-            orig_r = item.radius
-            
-            item.x = int(orig_x * scale_x)
-            item.y = int(orig_y * scale_y)
-            item.radius = int(orig_r * min(scale_x, scale_y))
-            
-            item.draw(frame, shake_x, shake_y)
-            
-            item.x, item.y = orig_x, orig_y
-            item.radius = orig_r
+        # Simularea ruleaza in spatiul de design, _draw_items() o mapeaza pe frame
+        self._draw_items(frame, vp, shake_x, shake_y)
 
         self._draw_back_button(frame)
         
-        heart_size = 18 
-        spacing = 50
+        heart_size = vp.px(18)
+        spacing = vp.px(50)
         
         for i in range(3):
-            lx_normal = (w - 180) + (i * spacing)
+            lx_normal = (w - vp.px(180)) + (i * spacing)
             is_active = (i < self.lives)
-            self._draw_heart(frame, lx_normal, 60, heart_size, is_active)
+            self._draw_heart(frame, lx_normal, vp.px(60), heart_size, is_active, vp.px(3))
 
         score_text = f"SCOR: {self.score}"
-        ts_score = cv2.getTextSize(score_text, cv2.FONT_HERSHEY_SIMPLEX, 1.2, 3)[0]
-        score_x = (w - 200) - ts_score[0] - 20 
-        score_y = 70 
-        
-        cv2.putText(frame, score_text, (score_x + 2, score_y + 2), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 3)
-        cv2.putText(frame, score_text, (score_x, score_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 255, 0), 3)
+        score_scale, t3 = vp.font(1.2), vp.thick(3)
+        ts_score = text_size(score_text, cv2.FONT_HERSHEY_SIMPLEX, score_scale, t3)[0]
+        score_x = (w - vp.px(200)) - ts_score[0] - vp.px(20)
+        score_y = vp.px(70)
+        d = vp.px(2)
+        
+        put_text(frame, score_text, (score_x, score_y), 
+                 cv2.FONT_HERSHEY_SIMPLEX, score_scale, (0, 255, 0), t3, shadow=(d, d, (0, 0, 0)))
                    
         hs_small = f"BEST: {self.high_score}"
-        cv2.putText(frame, hs_small, (w - 250, 110), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 0), 2)
+        put_text(frame, hs_small, (w - vp.px(250), vp.px(110)), 
+                 cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.7), (200, 200, 0), t2)
 
         return frame
\ No newline at end of file
@@ -1,7 +1,5 @@
 import cv2
-import time
 import numpy as np
-import os
 import math
 import random
 
@@ -9,14 +7,25 @@ import random
 from src.ui.screens.quiz_game import QuizGame as QuizLogic
 from src.ui.screens.arcade import ArcadeComponent
 from src.ui.screens.maze import MazeGame
+from src.core import clock
+from src.ui.shared import tint_rect
+from src.core.assets import get_assets
+from src.ui.compositor import blit_image
+from src.ui.text_cache import put_text
+from src.ui.viewport import viewport
+from src.core.event_bus import publish, subscribe, TransitionEvent, GameFinished
 
 class QuizGame: # Clasa Hub pentru Jocuri
-    def __init__(self):
+    # Vision needs of the hub menu (sub-games declare their own)
+    VISION_NEEDS = {"hands": 1, "face": 3}
+
+    def __init__(self, ai_generator=None):
         self.mode = "MENU"     
         
-        self.quiz = QuizLogic()
+        # Un singur AIGenerator pentru quiz + maze
+        self.quiz = QuizLogic(ai_generator)
         self.arcade = ArcadeComponent()
-        self.maze = MazeGame()
+        self.maze = MazeGame(ai_generator)
         
         self.PALETTE = {
             "CYAN":   (235, 206, 135),
@@ -25,14 +34,12 @@ class QuizGame: # Clasa Hub pentru Jocuri
             "TEXT":   (255, 255, 255)
         }
 
-        # Asset Bubble
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.abspath(os.path.join(current_dir, "../../../"))
-        sprite_path = os.path.join(project_root, "assets", "images", "pixel_bubble.png")
-        self.bubble_sprite = cv2.imread(sprite_path, cv2.IMREAD_UNCHANGED)
+        # Asset Bubble (acelasi decode ca in meniu, din AssetManager)
+        self.bubble_sprite = get_assets().image("pixel_bubble.png")
         if self.bubble_sprite is None:
-            self.bubble_sprite = np.zeros((100, 100, 4), dtype=np.uint8)
-            cv2.circle(self.bubble_sprite, (50,50), 45, (50, 50, 50, 255), -1)
+            placeholder = np.zeros((100, 100, 4), dtype=np.uint8)
+            cv2.circle(placeholder, (50,50), 45, (50, 50, 50, 255), -1)
+            self.bubble_sprite = get_assets().register("pixel_bubble.png", placeholder)
 
         self.buttons = {
             "QUIZ":   (0.25, 0.5, 0.12),
@@ -47,41 +54,54 @@ class QuizGame: # Clasa Hub pentru Jocuri
         self.progress = 0.0
         self.SELECTION_TIME = 1.5
 
+        # Sub-jocurile anunta terminarea prin GameFinished (nu mai verificam .active)
+        subscribe(GameFinished, self._on_game_finished)
+
+    def reset(self):
+        """Back to the games menu (the sub-games reset when they are started)."""
+        self.mode = "MENU"
+        self.hovered = None
+        self.progress = 0.0
+
+    def _on_game_finished(self, event):
+        if event.source not in (self.quiz, self.arcade, self.maze): return
+        self.mode = "MENU"
+        event.source.reset()
+
+    def get_vision_needs(self):
+        """Needs of the active sub-game (the scheduler asks the hub every frame)."""
+        if self.mode == "QUIZ": return self.quiz.VISION_NEEDS
+        elif self.mode == "ARCADE": return self.arcade.VISION_NEEDS
+        elif self.mode == "MAZE": return self.maze.VISION_NEEDS
+        return self.VISION_NEEDS
+
     def update(self, cx, cy):
         # 1. TRANSMITEM UPDATE LA SUB-JOCURI (CHIAR DACA CX e NONE)
+        # (terminarea sub-jocurilor vine prin GameFinished -> _on_game_finished)
         if self.mode == "QUIZ":
             # Quiz-ul probabil are nevoie de mana, dar transmitem oricum
             if cx is not None:
-                result = self.quiz.update(cx, cy)
-                if result == "EXIT_TO_APP":
-                    self.mode = "MENU"
-                    self.quiz.reset()
-            return False
+                self.quiz.update(cx, cy)
+            return
 
         elif self.mode == "ARCADE":
-            if cx is not None:
-                self.arcade.update(cx, cy)
-            if not self.arcade.active:
-                self.mode = "MENU"
-                self.arcade.reset()
-            return False
+            # None = mana pierduta: Arcade pune simularea pe pauza
+            self.arcade.update(cx, cy)
+            return
 
         elif self.mode == "MAZE":
             # Aici e important: Maze primeste update si cu None, None
             # ca sa ruleze timerele de jumpscare
             self.maze.update(cx, cy)
-            if not self.maze.active:
-                self.mode = "MENU"
-                self.maze.reset()
-            return False
+            return
 
         # 2. LOGICA MENIU SELECTIE (Necesita Mana)
         if cx is None or cy is None:
             self.hovered = None
             self.progress = 0.0
-            return False
+            return
 
-        return self._update_menu(cx, cy)
+        self._update_menu(cx, cy)
 
     def _update_menu(self, cx, cy):
         current_hover = None
@@ -102,15 +122,15 @@ class QuizGame: # Clasa Hub pentru Jocuri
         if current_hover:
             if self.hovered != current_hover:
                 self.hovered = current_hover
-                self.hover_start = time.time()
+                self.hover_start = clock.now()
                 self.progress = 0.0
             else:
-                elapsed = time.time() - self.hover_start
+                elapsed = clock.now() - self.hover_start
                 self.progress = min(elapsed / self.SELECTION_TIME, 1.0)
                 if self.progress >= 1.0:
                     self.hovered = None
                     self.progress = 0.0
-                    if current_hover == "BACK": return True
+                    if current_hover == "BACK": publish(TransitionEvent("MENU", source=self))
                     elif current_hover == "QUIZ":
                         self.quiz.reset()
                         self.mode = "QUIZ"
@@ -123,27 +143,6 @@ class QuizGame: # Clasa Hub pentru Jocuri
         else:
             self.hovered = None
             self.progress = 0.0
-        return False
-
-    def overlay_transparent(self, background, overlay, x, y):
-        bg_h, bg_w, _ = background.shape
-        ov_h, ov_w, _ = overlay.shape
-        if x >= bg_w or y >= bg_h or x + ov_w < 0 or y + ov_h < 0: return background
-        bg_x_start, bg_y_start = max(0, x), max(0, y)
-        bg_x_end, bg_y_end = min(x + ov_w, bg_w), min(y + ov_h, bg_h)
-        roi_w, roi_h = bg_x_end - bg_x_start, bg_y_end - bg_y_start
-        if roi_w <= 0 or roi_h <= 0: return background
-        roi = background[bg_y_start:bg_y_end, bg_x_start:bg_x_end]
-        ov_crop_x, ov_crop_y = bg_x_start - x, bg_y_start - y
-        overlay_crop = overlay[ov_crop_y:ov_crop_y+roi_h, ov_crop_x:ov_crop_x+roi_w]
-        if overlay_crop.shape[2] == 4:
-            alpha = overlay_crop[:, :, 3] / 255.0
-            for c in range(3):
-                roi[:, :, c] = (alpha * overlay_crop[:, :, c] + (1.0 - alpha) * roi[:, :, c])
-        else:
-            roi[:] = overlay_crop
-        background[bg_y_start:bg_y_end, bg_x_start:bg_x_end] = roi
-        return background
 
     def draw(self, frame):
         if self.mode == "QUIZ": return self.quiz.draw(frame)
@@ -151,9 +150,10 @@ class QuizGame: # Clasa Hub pentru Jocuri
         elif self.mode == "MAZE": return self.maze.draw(frame)
         
         h, w, _ = frame.shape
-        current_time = time.time()
+        vp = viewport(frame)
+        current_time = clock.now()
         
-        cv2.putText(frame, "ALEGE JOCUL", (w//2 - 150, 150), cv2.FONT_HERSHEY_SIMPLEX, 1.5, self.PALETTE["TEXT"], 3)
+        put_text(frame, "ALEGE JOCUL", (w//2 - vp.px(150), vp.px(150)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(1.5), self.PALETTE["TEXT"], vp.thick(3))
         
         # Back Button
         bx, by, bw, bh = self.back_btn_rect["BACK"]
@@ -161,31 +161,28 @@ class QuizGame: # Clasa Hub pentru Jocuri
         is_back = (self.hovered == "BACK")
         col = self.PALETTE["PINK"] if is_back else self.PALETTE["CYAN"]
         
-        roi = frame[y1:y2, x1:x2]
-        blk = np.zeros_like(roi, dtype=np.uint8); blk[:] = self.PALETTE["BG_DARK"]
-        cv2.addWeighted(blk, 0.4, roi, 0.6, 0, roi)
-        frame[y1:y2, x1:x2] = roi
+        tint_rect(frame, x1, y1, x2, y2, self.PALETTE["BG_DARK"], 0.4)
         
-        cv2.rectangle(frame, (x1,y1), (x2,y2), col, 2)
+        cv2.rectangle(frame, (x1,y1), (x2,y2), col, vp.thick(2))
         if is_back and self.progress > 0:
-            cv2.rectangle(frame, (x1, y2-4), (x1+int((x2-x1)*self.progress), y2), self.PALETTE["PINK"], -1)
-        cv2.putText(frame, "<< INAPOI", (x1+20, y1+40), cv2.FONT_HERSHEY_SIMPLEX, 0.7, self.PALETTE["TEXT"], 2)
+            cv2.rectangle(frame, (x1, y2 - vp.px(4)), (x1+int((x2-x1)*self.progress), y2), self.PALETTE["PINK"], -1)
+        put_text(frame, "<< INAPOI", (x1 + vp.px(20), y1 + vp.px(40)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.7), self.PALETTE["TEXT"], vp.thick(2))
 
         # Bubbles
         for name, (cxn, cyn, rn) in self.buttons.items():
             ish = (self.hovered == name)
             sc = 1.1 if ish else 1.0
-            off = 0 if ish else math.sin(current_time*2.5 + self.anim_offsets[name])*10
+            off = 0 if ish else math.sin(current_time*2.5 + self.anim_offsets[name])*vp.px(10)
             cx, cy = int(cxn*w), int(cyn*h+off)
-            sz = int(rn*w*2*sc)
-            res = cv2.resize(self.bubble_sprite, (sz, sz), interpolation=cv2.INTER_NEAREST)
-            self.overlay_transparent(frame, res, cx-sz//2, cy-sz//2)
+            res = get_assets().scaled("pixel_bubble.png", (rn*w*2, rn*w*2), sc, cv2.INTER_NEAREST)
+            sz = res.shape[1]
+            blit_image(frame, res, cx-sz//2, cy-sz//2)
             
             if ish and self.progress > 0:
-                cv2.ellipse(frame, (cx, cy), (sz//2, sz//2), -90, 0, 360*self.progress, self.PALETTE["CYAN"], 6)
+                cv2.ellipse(frame, (cx, cy), (sz//2, sz//2), -90, 0, 360*self.progress, self.PALETTE["CYAN"], vp.thick(6))
             
             tcol = self.PALETTE["CYAN"] if ish else self.PALETTE["TEXT"]
-            cv2.putText(frame, name, (cx-40, cy+10), cv2.FONT_HERSHEY_SIMPLEX, 1.0*sc, (0,0,0), 4)
-            cv2.putText(frame, name, (cx-40, cy+10), cv2.FONT_HERSHEY_SIMPLEX, 1.0*sc, tcol, 2)
+            put_text(frame, name, (cx - vp.px(40), cy + vp.px(10)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(1.0*sc), tcol, vp.thick(2),
+                     shadow=(0, 0, (0,0,0), vp.thick(4)))
             
         return frame
\ No newline at end of file
@@ -1,59 +1,41 @@
 # src/ui/screens/info_hub.py
-import os
 import cv2
 import numpy as np
 from .info_detail import get_page_text
-
-# ============================================
-# Helper pentru text wrapping
-# ============================================
-def wrap_text(text, font, font_scale, thickness, max_width):
-    words = text.split(' ')
-    wrapped = []
-    current_line = ""
-
-    for word in words:
-        test_line = current_line + (' ' if current_line else '') + word
-        (w, h), _ = cv2.getTextSize(test_line, font, font_scale, thickness)
-
-        if w <= max_width:
-            current_line = test_line
-        else:
-            wrapped.append(current_line)
-            current_line = word
-
-    if current_line:
-        wrapped.append(current_line)
-
-    return wrapped
+from src.core.event_bus import publish, subscribe, TransitionEvent, GestureEvent
+from src.core.assets import get_assets
+from src.ui.compositor import blit_image
+from src.ui.shared import tint_rect, draw_panel, draw_translucent_text
+from src.ui.text_cache import put_text, text_size
+from src.ui.text_layout import wrap_paragraphs
+from src.ui.viewport import viewport
 
 # ============================================
 # Helper pentru text cu umbra
 # ============================================
-def draw_text_with_shadow(frame, text, x, y, font, scale, thickness):
-    cv2.putText(frame, text, (x + 2, y + 2), font, scale, (0, 0, 0), thickness, cv2.LINE_AA)
-    cv2.putText(frame, text, (x, y), font, scale, (255, 255, 255), thickness, cv2.LINE_AA)
+def draw_text_with_shadow(frame, text, x, y, font, scale, thickness, color=(255, 255, 255)):
+    # Text + umbra randate o singura data (text cache), apoi un singur blit
+    d = viewport(frame).px(2)
+    put_text(frame, text, (x, y), font, scale, color, thickness, cv2.LINE_AA, shadow=(d, d, (0, 0, 0)))
 
 # ============================================
 # Helper pentru desenare cutie transparenta
 # ============================================
 def draw_transparent_box(frame, x1, y1, x2, y2, color=(200, 50, 50), alpha=0.7):
-    overlay = frame.copy()
-    cv2.rectangle(overlay, (x1, y1), (x2, y2), color, -1)
-    cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
-    cv2.rectangle(frame, (x1, y1), (x2, y2), (255, 255, 255), 1)
+    draw_panel(frame, x1, y1, x2, y2, color, alpha, border_color=(255, 255, 255))
 
 # ============================================
 # Helper pentru text transparent
 # ============================================
 def draw_transparent_text(frame, text, x, y, font, scale, color=(200, 50, 50), thickness=2, alpha=0.7):
-    overlay = frame.copy()
-    cv2.putText(overlay, text, (x, y), font, scale, color, thickness, cv2.LINE_AA)
-    cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+    draw_translucent_text(frame, text, (x, y), font, scale, color, thickness, alpha)
 
 # ============================================
 
 class InfoHub:
+    # Vision: hand cursor + swipes every frame, face only for the idle timer
+    VISION_NEEDS = {"hands": 1, "face": 3}
+
     def __init__(self):
         # --- CONFIGURARE CULORI (STYLE GAME.PY) ---
         self.PALETTE = {
@@ -63,24 +45,14 @@ class InfoHub:
             "TEXT":   (255, 255, 255)
         }
 
-        # --- INCARCARE LOGO ---
-        self.logo_path = "assets/images/logo_ugal.jpeg"
-        self.logo_img = None
-        
-        if os.path.exists(self.logo_path):
-            try:
-                temp_img = cv2.imread(self.logo_path, cv2.IMREAD_UNCHANGED)
-                if temp_img is not None:
-                    target_h = 100
-                    h_orig, w_orig = temp_img.shape[:2]
-                    aspect = w_orig / h_orig
-                    target_w = int(target_h * aspect)
-                    self.logo_img = cv2.resize(temp_img, (target_w, target_h))
-                    print(f"InfoHub: Logo loaded ({target_w}x{target_h})")
-                else:
-                    print(f"InfoHub WARNING: Failed to load image at {self.logo_path}")
-            except Exception as e:
-                print(f"InfoHub Error: {e}")
+        # --- INCARCARE LOGO (din AssetManager, decodat o singura data) ---
+        # 100 px tall at 1080p (draw() asks for the variant of the current resolution)
+        self.LOGO_HEIGHT = 100
+        self.logo_img = get_assets().fit_height("logo_ugal.jpeg", self.LOGO_HEIGHT)
+        if self.logo_img is not None:
+            print(f"InfoHub: Logo loaded ({self.logo_img.shape[1]}x{self.logo_img.shape[0]})")
+        else:
+            print("InfoHub WARNING: Failed to load logo_ugal.jpeg")
         # ----------------------
 
         self.specializations = {
@@ -111,13 +83,23 @@ class InfoHub:
         self.DWELL_THRESHOLD = 22       
         self.BACK_DWELL_THRESHOLD = 11  
 
-    def update(self, cursor_x, cursor_y, gesture):
+        # Swipes (pages) come from the event bus, published by the app while this screen is up
+        subscribe(GestureEvent, self._on_gesture)
+
+    def reset(self):
+        """Back to the specialization list (the screen is reused between visits)."""
+        self.active_spec = None
+        self.current_page = 0
+        self.dwell_timer = 0
+        self.hovered_btn = None
+
+    def update(self, cursor_x, cursor_y):
         if self.active_spec is None:
-            return self._update_selection_mode(cursor_x, cursor_y, gesture)
+            return self._update_selection_mode(cursor_x, cursor_y)
         else:
-            return self._update_detail_mode(cursor_x, cursor_y, gesture)
+            return self._update_detail_mode(cursor_x, cursor_y)
 
-    def _update_selection_mode(self, x, y, gesture):
+    def _update_selection_mode(self, x, y):
         hit = None
         
         bbx, bby, bbw, bbh = self.back_btn_rect
@@ -137,7 +119,8 @@ class InfoHub:
                 self.dwell_timer = 0
                 
                 if hit == "BACK_BTN":
-                    return "BACK_TO_MENU"
+                    publish(TransitionEvent("MENU", source=self))
+                    return None
                 else:
                     self.active_spec = hit
                     self.current_page = 0
@@ -148,7 +131,7 @@ class InfoHub:
             
         return None
 
-    def _update_detail_mode(self, x, y, gesture):
+    def _update_detail_mode(self, x, y):
         # 1. Verificam Butonul EXIT
         ebx, eby, ebw, ebh = self.exit_btn_rect
         
@@ -171,28 +154,26 @@ class InfoHub:
                 self.hovered_btn = None
                 self.dwell_timer = 0
 
-        # 2. Gestionare Swipe (Navigare Pagini)
-        if not gesture:
-            return None
+        return None
+
+    def _on_gesture(self, event):
+        # Gestionare Swipe (Navigare Pagini), doar in Detail Mode
+        if self.active_spec is None:
+            return
             
         max_pages = self.specializations[self.active_spec]["pages"]
         
         # SWIPE DREAPTA -> NEXT PAGE
-        if gesture == "SWIPE_RIGHT":
+        if event.gesture == "SWIPE_RIGHT":
             if self.current_page < max_pages - 1:
                 self.current_page += 1
-                return "NEXT_PAGE"
                 
         # SWIPE STANGA -> PREV PAGE (sau EXIT daca e prima pag)
-        elif gesture == "SWIPE_LEFT":
+        elif event.gesture == "SWIPE_LEFT":
             if self.current_page > 0:
                 self.current_page -= 1
-                return "PREV_PAGE"
             else:
                 self.active_spec = None
-                return None
-                
-        return None
 
     def get_ui_data(self):
         spec_name = None
@@ -225,6 +206,7 @@ class InfoHub:
     
     def _draw_back_button_styled(self, frame, x, y, w, h, is_hovered, progress):
         """Deseneaza butonul Back in stilul modern din game.py"""
+        vp = viewport(frame)
         x1, y1 = x, y
         x2, y2 = x + w, y + h
         
@@ -233,16 +215,12 @@ class InfoHub:
         bg_color = self.PALETTE["BG_DARK"]
         
         # 1. Fundal Semitransparent
-        roi = frame[y1:y2, x1:x2]
-        block = np.zeros_like(roi, dtype=np.uint8)
-        block[:] = bg_color
-        cv2.addWeighted(block, 0.4, roi, 0.6, 0, roi)
-        frame[y1:y2, x1:x2] = roi
+        tint_rect(frame, x1, y1, x2, y2, bg_color, 0.4)
         
         # 2. Border "Tech" (Colturi Opuse)
         corner_w = int((x2-x1) * 0.3)
         corner_h = int((y2-y1) * 0.4)
-        thick = 3 if is_hovered else 2
+        thick = vp.thick(3 if is_hovered else 2)
         
         # Stanga-Sus
         cv2.line(frame, (x1, y1), (x1+corner_w, y1), corner_color, thick)
@@ -254,40 +232,35 @@ class InfoHub:
         # 3. Bara Progres
         if is_hovered and progress > 0:
             pw = int((x2-x1) * progress)
-            cv2.rectangle(frame, (x1, y2-4), (x1+pw, y2), self.PALETTE["PINK"], -1)
+            cv2.rectangle(frame, (x1, y2 - vp.px(4)), (x1+pw, y2), self.PALETTE["PINK"], -1)
             
         # 4. Text
         label = "<< INAPOI"
-        ts = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
+        scale, t = vp.font(0.6), vp.thick(2)
+        ts = text_size(label, cv2.FONT_HERSHEY_SIMPLEX, scale, t)[0]
         tx = x1 + (x2-x1-ts[0]) // 2
         ty = y1 + (y2-y1+ts[1]) // 2
-        cv2.putText(frame, label, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.PALETTE["TEXT"], 2)
+        put_text(frame, label, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, scale, self.PALETTE["TEXT"], t)
 
     def draw(self, frame):
         h, w, _ = frame.shape
+        vp = viewport(frame)
         data = self.get_ui_data()
         font = cv2.FONT_HERSHEY_SIMPLEX
+        t2 = vp.thick(2)
         
         # --- LOGO ---
         if self.logo_img is not None:
-            lh, lw = self.logo_img.shape[:2]
+            logo_img = get_assets().fit_height("logo_ugal.jpeg", vp.px(self.LOGO_HEIGHT))
+            lh, lw = logo_img.shape[:2]
             x_offset = (w - lw) // 2
-            y_offset = 20 
+            y_offset = vp.px(20)
 
             if y_offset + lh < h and x_offset + lw < w and x_offset >= 0:
-                roi = frame[y_offset:y_offset+lh, x_offset:x_offset+lw]
-                if self.logo_img.shape[2] == 4:
-                    b, g, r, a = cv2.split(self.logo_img)
-                    overlay_color = cv2.merge((b, g, r))
-                    mask = a / 255.0
-                    mask_inv = 1.0 - mask
-                    for c in range(0, 3):
-                        roi[:, :, c] = (mask * overlay_color[:, :, c] + mask_inv * roi[:, :, c])
-                else:
-                    frame[y_offset:y_offset+lh, x_offset:x_offset+lw] = self.logo_img
+                blit_image(frame, logo_img, x_offset, y_offset)
         else:
-            text_w, _ = cv2.getTextSize("INFO HUB", font, 1.5, 3)[0]
-            cv2.putText(frame, "INFO HUB", ((w - text_w)//2, 50), font, 1.5, (255, 255, 255), 3)
+            text_w, _ = text_size("INFO HUB", font, vp.font(1.5), vp.thick(3))[0]
+            put_text(frame, "INFO HUB", ((w - text_w)//2, vp.px(50)), font, vp.font(1.5), (255, 255, 255), vp.thick(3))
         # ------------
 
         if data["mode"] == "SELECTION":
@@ -306,8 +279,8 @@ class InfoHub:
             # ---------------------------------------------
 
             # Titlu
-            draw_transparent_text(frame, "Alege specializarea:", 65, 160, 
-                                  font, 1.0, color=(200, 50, 50), alpha=0.7)
+            draw_transparent_text(frame, "Alege specializarea:", *vp.pt(65, 160), 
+                                  font, vp.font(1.0), color=(200, 50, 50), thickness=t2, alpha=0.7)
 
             # Butoane Specializari
             for key, (bx_norm, by_norm, bw_norm, bh_norm) in self.buttons.items():
@@ -325,22 +298,21 @@ class InfoHub:
                 
                 if is_hovered and data["progress"] > 0:
                     bar_w = int((x2 - x1) * data["progress"])
-                    cv2.rectangle(frame, (x1, y2 - 10), (x1 + bar_w, y2), (0, 255, 0), -1)
+                    cv2.rectangle(frame, (x1, y2 - vp.px(10)), (x1 + bar_w, y2), (0, 255, 0), -1)
 
                 text_content = self.specializations[key]["name"].split(',')[0]
-                text_size = cv2.getTextSize(text_content, font, 0.8, 2)[0]
-                tx = x1 + (x2 - x1 - text_size[0]) // 2
-                ty = y1 + (y2 - y1 + text_size[1]) // 2
+                ts = text_size(text_content, font, vp.font(0.8), t2)[0]
+                tx = x1 + (x2 - x1 - ts[0]) // 2
+                ty = y1 + (y2 - y1 + ts[1]) // 2
                 
-                cv2.putText(frame, text_content, (tx, ty), font, 0.8, (255, 255, 255), 2)
+                put_text(frame, text_content, (tx, ty), font, vp.font(0.8), (255, 255, 255), t2)
 
         elif data["mode"] == "DETAIL":
             # --- DETAIL MODE ---
             
             title_text = f"{data['spec_name']} - P. {data['page']}/{self.specializations[data['active_spec']]['pages']}"
             
-            draw_text_with_shadow(frame, title_text, 50, 160, font, 1.0, 2)
-            cv2.putText(frame, title_text, (50, 160), font, 1.0, (200, 50, 50), 2, cv2.LINE_AA)
+            draw_text_with_shadow(frame, title_text, *vp.pt(50, 160), font, vp.font(1.0), t2, color=(200, 50, 50))
             
             box_w_norm, box_h_norm = 0.85, 0.65
             bx_norm, by_norm = 0.075, 0.20 
@@ -352,16 +324,15 @@ class InfoHub:
             
             draw_transparent_box(frame, x1, y1, x2, y2, color=(200, 50, 50), alpha=0.7)
 
-            line_height = 40 
-            y_offset = y1 + 50
-            max_text_width = (x2 - x1) - 60
-            text_scale = 0.9
+            line_height = vp.px(40)
+            y_offset = y1 + vp.px(50)
+            max_text_width = (x2 - x1) - vp.px(60)
+            text_scale = vp.font(0.9)
 
-            for raw_line in data["page_text"].split('\n'):
-             wrapped_lines = wrap_text(raw_line.strip(), font, text_scale, 1, max_text_width)
-             for line in wrapped_lines:
-               cv2.putText(frame, line, (x1 + 30, y_offset),
-                           font, text_scale, (255, 255, 255), 2, cv2.LINE_AA)
+            # Toata pagina impartita pe randuri o singura data (text_layout memoreaza)
+            for line in wrap_paragraphs(data["page_text"], font, text_scale, 1, max_text_width):
+               put_text(frame, line, (x1 + vp.px(30), y_offset),
+                        font, text_scale, (255, 255, 255), t2, cv2.LINE_AA)
                y_offset += line_height
 
             # --- BUTON EXIT (Jos Mijloc) ---
@@ -381,21 +352,21 @@ class InfoHub:
             # Bara de progres pentru Exit
             if is_exit_hovered and data["progress"] > 0:
                 bar_w = int((ex2 - ex1) * data["progress"])
-                cv2.rectangle(frame, (ex1, ey2 - 5), (ex1 + bar_w, ey2), (0, 255, 0), -1)
+                cv2.rectangle(frame, (ex1, ey2 - vp.px(5)), (ex1 + bar_w, ey2), (0, 255, 0), -1)
 
             # Text "EXIT"
-            text_size = cv2.getTextSize("EXIT", font, 0.8, 2)[0]
-            tx = ex1 + (ex2 - ex1 - text_size[0]) // 2
-            ty = ey1 + (ey2 - ey1 + text_size[1]) // 2
-            cv2.putText(frame, "EXIT", (tx, ty), font, 0.8, (255, 255, 255), 2)
+            ts = text_size("EXIT", font, vp.font(0.8), t2)[0]
+            tx = ex1 + (ex2 - ex1 - ts[0]) // 2
+            ty = ey1 + (ey2 - ey1 + ts[1]) // 2
+            put_text(frame, "EXIT", (tx, ty), font, vp.font(0.8), (255, 255, 255), t2)
 
             # --- SWIPE HINTS ---
             back_text = "<- SWIPE LEFT (Inapoi)" if data['page'] > 1 else "<- SWIPE LEFT (Lista)"
-            draw_text_with_shadow(frame, back_text, x1, ey1 + 30, font, 0.8, 2)
+            draw_text_with_shadow(frame, back_text, x1, ey1 + vp.px(30), font, vp.font(0.8), t2)
 
             if data['page'] < self.specializations[data['active_spec']]['pages']:
                 next_text = "SWIPE RIGHT (Inainte) ->"
-                (tw, _), _ = cv2.getTextSize(next_text, font, 0.8, 2)
-                draw_text_with_shadow(frame, next_text, x2 - tw, ey1 + 30, font, 0.8, 2)
+                (tw, _), _ = text_size(next_text, font, vp.font(0.8), t2)
+                draw_text_with_shadow(frame, next_text, x2 - tw, ey1 + vp.px(30), font, vp.font(0.8), t2)
 
         return frame
\ No newline at end of file
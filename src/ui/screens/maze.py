@@ -1,16 +1,22 @@
 import cv2
-import time
 import numpy as np
-import os
 import math
 import threading
 from collections import deque
 from src.core.ai_generator import AIGenerator
+from src.ui.shared import QUALITY, tint_rect, dim_frame
+from src.core import clock
+from src.core.assets import get_assets
+from src.core.event_bus import publish, subscribe, GameFinished, JobDone
+from src.ui.viewport import viewport
 
 class MazeGame:
-    def __init__(self):
+    # Vision: only the hand cursor matters while playing
+    VISION_NEEDS = {"hands": 1, "face": 0}
+
+    def __init__(self, ai_generator=None):
         self.active = False
-        self.ai_generator = AIGenerator()
+        self.ai_generator = ai_generator if ai_generator is not None else AIGenerator()
         
         # Stari: GENERATING, WAITING, PLAYING, JUMPSCARE, WIN_SCREEN, LOST
         self.state = "GENERATING" 
@@ -22,6 +28,11 @@ class MazeGame:
         self.grid_h = 11
         self.grid_w = 20
         self.last_dims = (0, 0)
+        self.parsed_dims = (0, 0)  # rezolutia pentru care au fost calculati peretii
+
+        # Stratul static (fundal + grid + pereti), randat o data per layout / rezolutie
+        self.static_layer = None
+        self.static_key = None
         
         # Cursor & Trail (Coada pentru efectul de urma)
         self.cursor_norm = (0.5, 0.5)
@@ -32,14 +43,11 @@ class MazeGame:
         self.jumpscare_start_time = 0
         
         # --- IMAGINI ---
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.abspath(os.path.join(current_dir, "../../../"))
-        jumpscare_path = os.path.join(project_root, "assets", "images", "job_application.png")
-        
-        self.jumpscare_img = cv2.imread(jumpscare_path)
+        self.jumpscare_img = get_assets().image("job_application.png")
         if self.jumpscare_img is None:
-             self.jumpscare_img = np.zeros((500, 500, 3), dtype=np.uint8)
-             self.jumpscare_img[:] = (0, 0, 255)
+             placeholder = np.zeros((500, 500, 3), dtype=np.uint8)
+             placeholder[:] = (0, 0, 255)
+             self.jumpscare_img = get_assets().register("job_application.png", placeholder)
 
         # --- INTERFATA LOST / WIN ---
         self.buttons_layout = {
@@ -61,6 +69,9 @@ class MazeGame:
         self.COL_WALL_BORDER = (235, 206, 135) # Cyan ACIEE
         self.COL_TRAIL = (203, 192, 255) # Pink ACIEE
 
+        # Layout-ul generat pe thread ajunge prin JobDone (aplicat pe main thread)
+        subscribe(JobDone, self._on_job_done)
+
     def _is_solvable(self, layout):
         # (LOGICA RAMANE NESCHIMBATA - O pastram pentru siguranta)
         rows = len(layout)
@@ -88,6 +99,7 @@ class MazeGame:
         return False 
 
     def _parse_level(self, width, height):
+        self.parsed_dims = (width, height)
         self.walls = []
         self.start_rect = None
         self.end_rect = None
@@ -120,9 +132,10 @@ class MazeGame:
         self.hovered_btn = None
         self.selection_progress = 0.0
         
-        thread = threading.Thread(target=self._generate_task)
-        thread.daemon = True
-        thread.start()
+        # Pastram referinta (replay-ul determinist asteapta generarea)
+        self.loader_thread = threading.Thread(target=self._generate_task)
+        self.loader_thread.daemon = True
+        self.loader_thread.start()
 
     def _generate_task(self):
         try:
@@ -130,15 +143,27 @@ class MazeGame:
             generated_layout = self.ai_generator.generate_maze()
             if self._is_solvable(generated_layout):
                 print("Maze: Layout validat!")
-                self.level_layout = generated_layout
+                publish(JobDone("maze_layout", True, generated_layout, source=self))
             else:
                 print("Maze: Layout invalid. Fallback.")
-                self.level_layout = self.ai_generator.get_fallback_maze()
-            self.state = "READY_TO_START"
+                publish(JobDone("maze_layout", False, self.ai_generator.get_fallback_maze(), source=self))
         except Exception as e:
             print(f"Maze Error: {e}")
-            self.level_layout = self.ai_generator.get_fallback_maze()
-            self.state = "READY_TO_START"
+            publish(JobDone("maze_layout", False, self.ai_generator.get_fallback_maze(), source=self))
+
+    def _on_job_done(self, event):
+        if event.source is not self or event.job != "maze_layout": return
+        if self.state != "GENERATING": return
+        self.level_layout = event.result
+        self.state = "WAITING"
+        self.message = "Vino in zona VERDE!"
+        self.msg_color = (255, 255, 255)
+        self.last_dims = (0, 0)
+
+    def _finish(self):
+        """Back to the games hub (the hub reacts to GameFinished)."""
+        self.active = False
+        publish(GameFinished("MAZE", source=self))
 
     def update(self, cx_norm, cy_norm):
         if not self.active: return
@@ -146,19 +171,14 @@ class MazeGame:
         if cy_norm is None: cy_norm = 0.5
         
         self.cursor_norm = (cx_norm, cy_norm)
-        current_time = time.time()
+        current_time = clock.now()
         
         # Actualizare Trail (doar in timpul jocului)
         if self.state in ["WAITING", "PLAYING"]:
             self.trail.append(self.cursor_norm)
 
         # Logica stari
-        if self.state == "READY_TO_START":
-            self.state = "WAITING"
-            self.message = "Vino in zona VERDE!"
-            self.msg_color = (255, 255, 255)
-            self.last_dims = (0, 0) 
-        elif self.state == "GENERATING": return
+        if self.state == "GENERATING": return
         elif self.state == "JUMPSCARE":
             if current_time - self.jumpscare_start_time > self.TRANSIT_DURATION + 2.0:
                 self.state = "WIN_SCREEN"
@@ -166,7 +186,7 @@ class MazeGame:
             return
         elif self.state == "WIN_SCREEN":
             if current_time - self.win_start_time > self.WIN_DISPLAY_TIME:
-                self.active = False
+                self._finish()
             return
         elif self.state == "LOST":
             self._update_buttons_interaction(cx_norm, cy_norm)
@@ -182,15 +202,15 @@ class MazeGame:
                 break
         
         if hovered and hovered == self.hovered_btn:
-            elapsed = time.time() - self.selection_start
+            elapsed = clock.now() - self.selection_start
             self.selection_progress = min(elapsed / self.SELECTION_TIME, 1.0)
             if self.selection_progress >= 1.0:
                 self.selection_progress = 0.0
                 if hovered == "RETRY": self.reset()
-                elif hovered == "MENU": self.active = False
+                elif hovered == "MENU": self._finish()
         else:
             self.hovered_btn = hovered
-            self.selection_start = time.time()
+            self.selection_start = clock.now()
             self.selection_progress = 0.0
 
     def _check_logic(self):
@@ -211,7 +231,7 @@ class MazeGame:
                 ex, ey, ew, eh = self.end_rect
                 if ex < cx < ex + ew and ey < cy < ey + eh:
                     self.state = "JUMPSCARE"
-                    self.jumpscare_start_time = time.time()
+                    self.jumpscare_start_time = clock.now()
                     return
             for (wx, wy, ww, wh) in self.walls:
                 if wx < cx < wx + ww and wy < cy < wy + wh:
@@ -222,27 +242,55 @@ class MazeGame:
 
     def _draw_tech_grid(self, frame, w, h):
         """Deseneaza un grilaj subtil in fundal - Foarte rapid."""
+        if not QUALITY["maze_grid"]: return
+        step = viewport(frame).px(60)
         # Linii Verticale
-        for x in range(0, w, 60):
+        for x in range(0, w, step):
             cv2.line(frame, (x, 0), (x, h), self.COL_GRID, 1)
         # Linii Orizontale
-        for y in range(0, h, 60):
+        for y in range(0, h, step):
             cv2.line(frame, (0, y), (w, y), self.COL_GRID, 1)
 
+    def _get_static_layer(self, w, h, layout=()):
+        """
+        Background, grid and walls for `layout` at (w, h), rendered once.
+        Rebuilt only when the layout, the resolution or the quality flags change.
+        """
+        key = (layout, w, h, QUALITY["maze_grid"], QUALITY["maze_wall_fill"])
+        if key == self.static_key:
+            return self.static_layer
+
+        layer = np.empty((h, w, 3), dtype=np.uint8)
+        layer[:] = self.COL_BG
+        self._draw_tech_grid(layer, w, h)
+        vp = viewport(layer)
+        inset, border = vp.px(2), vp.thick(2)
+
+        # Pereti (Stil Neon: Fill transparent + Border)
+        for (wx, wy, ww, wh) in (self.walls if layout else ()):
+            if QUALITY["maze_wall_fill"]:
+                cv2.rectangle(layer, (wx+inset, wy+inset), (wx+ww-inset, wy+wh-inset), self.COL_WALL_FILL, -1)
+            cv2.rectangle(layer, (wx, wy), (wx+ww, wy+wh), self.COL_WALL_BORDER, border)
+            # Detaliu "Tech" (un punct in mijloc)
+            cv2.circle(layer, (wx + ww//2, wy + wh//2), inset, self.COL_WALL_BORDER, -1)
+
+        self.static_layer, self.static_key = layer, key
+        return layer
+
     def draw(self, frame):
         h, w, _ = frame.shape
+        vp = viewport(frame)
         self.last_dims = (w, h)
         
         # --- 1. ECRAN GENERARE ---
         if self.state == "GENERATING":
-            cv2.rectangle(frame, (0,0), (w,h), self.COL_BG, -1)
-            self._draw_tech_grid(frame, w, h)
+            frame[:] = self._get_static_layer(w, h)
             msg = "GENERARE LABIRINT..."
-            pulse = abs(math.sin(time.time() * 4))
+            pulse = abs(math.sin(clock.now() * 4))
             col = (0, int(255 * pulse), 255)
             font = cv2.FONT_HERSHEY_SIMPLEX
-            ts = cv2.getTextSize(msg, font, 1.2, 3)[0]
-            cv2.putText(frame, msg, ((w-ts[0])//2, h//2), font, 1.2, col, 3)
+            ts = cv2.getTextSize(msg, font, vp.font(1.2), vp.thick(3))[0]
+            cv2.putText(frame, msg, ((w-ts[0])//2, h//2), font, vp.font(1.2), col, vp.thick(3))
             return frame
 
         # --- 2. ECRAN WIN ---
@@ -250,67 +298,63 @@ class MazeGame:
             frame[:] = 0 # Negru
             msgs = ["FELICITARI!", "Ai castigat!"]
             font = cv2.FONT_HERSHEY_SIMPLEX
-            y_off = h // 2 - 50
+            y_off = h // 2 - vp.px(50)
             for i, line in enumerate(msgs):
-                scale = 2.0 if i == 0 else 1.2
+                scale = vp.font(2.0 if i == 0 else 1.2)
                 color = (0, 255, 0) if i == 0 else (200, 200, 200)
-                thick = 4 if i == 0 else 2
+                thick = vp.thick(4 if i == 0 else 2)
                 ts = cv2.getTextSize(line, font, scale, thick)[0]
                 cv2.putText(frame, line, ((w - ts[0]) // 2, y_off), font, scale, color, thick)
-                y_off += 80
+                y_off += vp.px(80)
             return frame
 
         # --- 3. JUMPSCARE ---
         if self.state == "JUMPSCARE" and self.jumpscare_img is not None:
             frame[:] = 0 
-            elapsed = time.time() - self.jumpscare_start_time
+            elapsed = clock.now() - self.jumpscare_start_time
             progress = min(elapsed / self.TRANSIT_DURATION, 1.0)
             scale = 0.1 + (progress**3) * 0.9 
             tw, th = int(w * scale), int(h * scale)
             if tw > 0 and th > 0:
-                resized = cv2.resize(self.jumpscare_img, (tw, th))
+                if progress >= 1.0:
+                    # Full screen for ~2 s: cached variant (same one the arcade troll uses)
+                    resized = get_assets().variant("job_application.png", (tw, th))
+                else:
+                    # Zoom-in lasts TRANSIT_DURATION only: not worth caching every size
+                    resized = cv2.resize(self.jumpscare_img, (tw, th))
                 x_off = (w - tw) // 2
                 y_off = (h - th) // 2
                 frame[y_off:y_off+th, x_off:x_off+tw] = resized
             return frame
         
         # --- 4. GAMEPLAY (NEON STYLE) ---
-        if self.level_layout and not self.walls: self._parse_level(w, h)
+        # Re-parse cand se schimba rezolutia de randare (QualityGovernor)
+        if self.level_layout and (not self.walls or self.parsed_dims != (w, h)): self._parse_level(w, h)
 
-        # A. Fundal & Grid
-        cv2.rectangle(frame, (0,0), (w,h), self.COL_BG, -1)
-        self._draw_tech_grid(frame, w, h)
-        
-        # B. Pereti (Stil Neon: Fill transparent + Border)
-        # Optimizare: Desenam toti peretii
-        for (wx, wy, ww, wh) in self.walls:
-            # Poti comenta linia de fill daca vrei transparenta totala pentru performanta MAXIMA
-            cv2.rectangle(frame, (wx+2, wy+2), (wx+ww-2, wy+wh-2), self.COL_WALL_FILL, -1)
-            cv2.rectangle(frame, (wx, wy), (wx+ww, wy+wh), self.COL_WALL_BORDER, 2)
-            # Detaliu "Tech" (un punct in mijloc)
-            cv2.circle(frame, (wx + ww//2, wy + wh//2), 2, self.COL_WALL_BORDER, -1)
+        # A+B. Fundal, Grid & Pereti: strat static cache-uit, o singura copiere
+        frame[:] = self._get_static_layer(w, h, tuple(self.level_layout))
             
         # C. Start Zone (Pulse Green)
         if self.start_rect:
             sx, sy, sw, sh = self.start_rect
-            pulse = 0.5 + 0.5 * math.sin(time.time() * 5) # 0.0 -> 1.0
+            pulse = 0.5 + 0.5 * math.sin(clock.now() * 5) # 0.0 -> 1.0
             color_s = (0, int(150 + 100*pulse), 0)
             cv2.rectangle(frame, (sx, sy), (sx+sw, sy+sh), color_s, -1)
-            cv2.putText(frame, "S", (sx+sw//2-10, sy+sh//2+10), cv2.FONT_HERSHEY_SIMPLEX, 1, (255,255,255), 2)
+            cv2.putText(frame, "S", (sx+sw//2 - vp.px(10), sy+sh//2 + vp.px(10)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(1), (255,255,255), vp.thick(2))
         
         # D. End Zone (Pulse Red)
         if self.end_rect:
             ex, ey, ew, eh = self.end_rect
-            pulse = 0.5 + 0.5 * math.cos(time.time() * 5)
+            pulse = 0.5 + 0.5 * math.cos(clock.now() * 5)
             color_e = (0, 0, int(150 + 100*pulse))
             cv2.rectangle(frame, (ex, ey), (ex+ew, ey+eh), color_e, -1)
-            cv2.putText(frame, "E", (ex+ew//2-10, ey+eh//2+10), cv2.FONT_HERSHEY_SIMPLEX, 1, (255,255,255), 2)
+            cv2.putText(frame, "E", (ex+ew//2 - vp.px(10), ey+eh//2 + vp.px(10)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(1), (255,255,255), vp.thick(2))
 
         # E. Player Trail (Coada)
         for i, (tx, ty) in enumerate(self.trail):
             px, py = int(tx * w), int(ty * h)
             # Cerculete care se micsoreaza
-            radius = int(5 + i * 1.5) 
+            radius = int((5 + i * 1.5) * vp.s)
             alpha = (i + 1) / len(self.trail)
             col = tuple(int(c * alpha) for c in self.COL_TRAIL)
             cv2.circle(frame, (px, py), radius, col, -1)
@@ -318,19 +362,15 @@ class MazeGame:
         # Mesaj jos (daca nu e LOST)
         if self.state != "LOST":
             # Bara neagra semitransparenta
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (0, h-60), (w, h), (0,0,0), -1)
-            cv2.addWeighted(overlay, 0.6, frame, 0.4, 0, frame)
-            cv2.putText(frame, self.message, (50, h - 20), cv2.FONT_HERSHEY_SIMPLEX, 1, self.msg_color, 2)
+            tint_rect(frame, 0, h - vp.px(60), w, h, (0,0,0), 0.6)
+            cv2.putText(frame, self.message, (vp.px(50), h - vp.px(20)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(1), self.msg_color, vp.thick(2))
 
         # --- 5. ECRAN LOST OVERLAY ---
         if self.state == "LOST":
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (0, 0), (w, h), (0, 0, 50), -1) 
-            cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+            dim_frame(frame, (0, 0, 50), 0.7)
             
-            cv2.putText(frame, "AI LOVIT ZIDUL!", (w//2 - 200, h//2 - 50), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 255), 3)
+            cv2.putText(frame, "AI LOVIT ZIDUL!", (w//2 - vp.px(200), h//2 - vp.px(50)), 
+                        cv2.FONT_HERSHEY_SIMPLEX, vp.font(1.5), (0, 0, 255), vp.thick(3))
 
             for key, (bx, by, bw, bh) in self.buttons_layout.items():
                 x1, y1 = int(bx * w), int(by * h)
@@ -342,16 +382,16 @@ class MazeGame:
                 border_col = (0, 255, 0) if is_hovered else (200, 200, 200)
 
                 cv2.rectangle(frame, (x1, y1), (x2, y2), bg_col, -1)
-                cv2.rectangle(frame, (x1, y1), (x2, y2), border_col, 2)
+                cv2.rectangle(frame, (x1, y1), (x2, y2), border_col, vp.thick(2))
                 
                 if is_hovered:
                     prog_w = int((x2 - x1) * self.selection_progress)
-                    cv2.rectangle(frame, (x1, y2-10), (x1+prog_w, y2), (255, 255, 255), -1)
+                    cv2.rectangle(frame, (x1, y2 - vp.px(10)), (x1+prog_w, y2), (255, 255, 255), -1)
                 
                 label = "REINCEARCA" if key == "RETRY" else "IESIRE MENIU"
-                ts = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
+                ts = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.8), vp.thick(2))[0]
                 tx = x1 + (x2 - x1 - ts[0]) // 2
                 ty = y1 + (y2 - y1 + ts[1]) // 2
-                cv2.putText(frame, label, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+                cv2.putText(frame, label, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.8), (255, 255, 255), vp.thick(2))
 
         return frame
\ No newline at end of file
@@ -1,11 +1,19 @@
 import cv2
-import time
 import numpy as np
 import math
-import os
 import random
+from src import config
+from src.core import clock
+from src.core.event_bus import publish, TransitionEvent
+from src.core.assets import get_assets
+from src.ui.compositor import blit_image
+from src.ui.text_cache import put_text, text_size
+from src.ui.viewport import viewport
 
 class MenuController:
+    # Vision: hand cursor every frame, face only for the idle timer
+    VISION_NEEDS = {"hands": 1, "face": 3}
+
     def __init__(self):
         # Layout: Dictionary of "Key": (Center_X_Norm, Center_Y_Norm, Radius_Norm_Fraction_of_Width)
         self.layout = {
@@ -25,37 +33,34 @@ class MenuController:
         # Generate a random "phase" (0 to 2pi) for each button.
         self.anim_offsets = {k: random.uniform(0, 6.28) for k in self.layout.keys()}
 
-        # --- ASSET LOADING ---
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.abspath(os.path.join(current_dir, "../../../"))
-        assets_dir = os.path.join(project_root, "assets", "images")
+        # --- ASSET LOADING (AssetManager: decodat o data, variante cache-uite) ---
+        assets = get_assets()
         
         # 1. Load Bubble Sprite
-        sprite_path = os.path.join(assets_dir, "pixel_bubble.png")
-        self.bubble_sprite = cv2.imread(sprite_path, cv2.IMREAD_UNCHANGED)
+        self.bubble_sprite = assets.image("pixel_bubble.png")
         
         if self.bubble_sprite is None:
-            print(f"ERROR: Could not load image at {sprite_path}")
-            self.bubble_sprite = np.zeros((100, 100, 4), dtype=np.uint8)
-            cv2.circle(self.bubble_sprite, (50,50), 45, (50, 50, 50, 255), -1)
-
-        # 2. Load QR/Site Images (ACIEE & Polestar)
-        self.img_aciee = self._load_and_resize(os.path.join(assets_dir, "site_aciee.png"), target_width=150)
-        self.img_polestar = self._load_and_resize(os.path.join(assets_dir, "site_polestar.png"), target_width=150)
-
-    def _load_and_resize(self, path, target_width):
+            print(f"ERROR: Could not load image at {assets.path('pixel_bubble.png')}")
+            placeholder = np.zeros((100, 100, 4), dtype=np.uint8)
+            cv2.circle(placeholder, (50,50), 45, (50, 50, 50, 255), -1)
+            self.bubble_sprite = assets.register("pixel_bubble.png", placeholder)
+
+        # 2. Load QR/Site Images (ACIEE & Polestar), 150 px wide at 1080p
+        # (resized per resolution in draw(), the variants stay in the asset cache)
+        self.site_width = 150
+        self.img_aciee = self._load_and_resize("site_aciee.png", target_width=self.site_width)
+        self.img_polestar = self._load_and_resize("site_polestar.png", target_width=self.site_width)
+
+    def _load_and_resize(self, name, target_width):
         """Helper pentru a încărca și redimensiona o imagine păstrând aspect ratio."""
-        if os.path.exists(path):
-            img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
-            if img is not None:
-                h, w = img.shape[:2]
-                scale = target_width / w
-                return cv2.resize(img, (target_width, int(h * scale)))
-            else:
-                print(f"WARN: Imaginea {path} nu a putut fi citita (format invalid?).")
-        else:
-            print(f"WARN: Imaginea {path} nu exista.")
-        return None
+        assets = get_assets()
+        if not assets.exists(name):
+            print(f"WARN: Imaginea {assets.path(name)} nu exista.")
+            return None
+        img = assets.fit_width(name, target_width)
+        if img is None:
+            print(f"WARN: Imaginea {assets.path(name)} nu a putut fi citita (format invalid?).")
+        return img
 
     def get_layout(self):
         return self.layout
@@ -79,105 +84,66 @@ class MenuController:
         # State Machine
         if currently_hovered != self.state["hovered"]:
             self.state["hovered"] = currently_hovered
-            self.state["start_hover_time"] = time.time()
+            self.state["start_hover_time"] = clock.now()
             self.state["progress"] = 0.0
         
         if currently_hovered:
-            elapsed = time.time() - self.state["start_hover_time"]
+            elapsed = clock.now() - self.state["start_hover_time"]
             self.state["progress"] = min(elapsed / self.state["selection_threshold"], 1.0)
             
             if elapsed >= self.state["selection_threshold"]:
                 self.state["hovered"] = None
                 self.state["progress"] = 0.0
-                return currently_hovered
+                publish(TransitionEvent(currently_hovered, source=self))
                 
         return None
 
-    def overlay_transparent(self, background, overlay, x, y):
-        bg_h, bg_w, _ = background.shape
-        ov_h, ov_w = overlay.shape[:2]
-
-        if x >= bg_w or y >= bg_h or x + ov_w < 0 or y + ov_h < 0: 
-            return background
-
-        # Calculate intersection
-        ov_x_start = max(0, x)
-        ov_y_start = max(0, y)
-        bg_x_start = max(0, x)
-        bg_y_start = max(0, y)
-        
-        ov_x_end = min(x + ov_w, bg_w)
-        ov_y_end = min(y + ov_h, bg_h)
-        bg_x_end = min(x + ov_w, bg_w)
-        bg_y_end = min(y + ov_h, bg_h)
-        
-        roi_w = bg_x_end - bg_x_start
-        roi_h = bg_y_end - bg_y_start
-        
-        if roi_w <= 0 or roi_h <= 0: return background
-
-        roi = background[bg_y_start:bg_y_end, bg_x_start:bg_x_end]
-        
-        # Crop overlay to match ROI
-        ov_crop_x_start = bg_x_start - x
-        ov_crop_y_start = bg_y_start - y
-        overlay_crop = overlay[ov_crop_y_start:ov_crop_y_start+roi_h, ov_crop_x_start:ov_crop_x_start+roi_w]
-
-        if overlay_crop.shape[2] == 4:
-            alpha_channel = overlay_crop[:, :, 3] / 255.0
-            overlay_bgr = overlay_crop[:, :, :3]
-
-            for c in range(3):
-                roi[:, :, c] = (alpha_channel * overlay_bgr[:, :, c] + 
-                                (1.0 - alpha_channel) * roi[:, :, c])
-        else:
-            roi[:] = overlay_crop
-
-        background[bg_y_start:bg_y_end, bg_x_start:bg_x_end] = roi
-        return background
-
     def draw(self, frame):
         h, w, _ = frame.shape
-        current_time = time.time()
+        vp = viewport(frame)
+        current_time = clock.now()
 
         # ---------------------------------------------------------
         # 1. DESENARE QR / IMAGINI COLTURI
         # ---------------------------------------------------------
-        margin = 40
+        margin = vp.px(40)
+        site_w = vp.px(self.site_width)
         
         # --- Colț Stânga Jos: ACIEE ---
-        if self.img_aciee is not None:
-            ih, iw = self.img_aciee.shape[:2]
+        img_aciee = get_assets().fit_width("site_aciee.png", site_w) if self.img_aciee is not None else None
+        if img_aciee is not None:
+            ih, iw = img_aciee.shape[:2]
             x_pos = margin
             y_pos = h - ih - margin
             
             # Text deasupra
             text = "Site-ul facultatii"
-            font_scale = 0.7
-            ts = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)[0]
+            font_scale = vp.font(0.7)
+            ts = text_size(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, vp.thick(2))[0]
             # Centram textul fata de imagine
             tx = x_pos + (iw - ts[0]) // 2
-            ty = y_pos - 15
+            ty = y_pos - vp.px(15)
             
-            cv2.putText(frame, text, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, (255, 255, 255), 2)
-            frame = self.overlay_transparent(frame, self.img_aciee, x_pos, y_pos)
+            put_text(frame, text, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, (255, 255, 255), vp.thick(2))
+            blit_image(frame, img_aciee, x_pos, y_pos)
 
         # --- Colț Dreapta Jos: POLESTAR ---
-        if self.img_polestar is not None:
-            ih, iw = self.img_polestar.shape[:2]
+        img_polestar = get_assets().fit_width("site_polestar.png", site_w) if self.img_polestar is not None else None
+        if img_polestar is not None:
+            ih, iw = img_polestar.shape[:2]
             x_pos = w - iw - margin
             y_pos = h - ih - margin
             
             # Text deasupra
             text = "Site-ul nostru"
-            font_scale = 0.7
-            ts = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)[0]
+            font_scale = vp.font(0.7)
+            ts = text_size(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, vp.thick(2))[0]
             # Centram textul fata de imagine
             tx = x_pos + (iw - ts[0]) // 2
-            ty = y_pos - 15
+            ty = y_pos - vp.px(15)
             
-            cv2.putText(frame, text, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, (255, 255, 255), 2)
-            frame = self.overlay_transparent(frame, self.img_polestar, x_pos, y_pos)
+            put_text(frame, text, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, (255, 255, 255), vp.thick(2))
+            blit_image(frame, img_polestar, x_pos, y_pos)
 
         # ---------------------------------------------------------
         # 2. DESENARE BUTOANE MENIU (BULE)
@@ -192,7 +158,7 @@ class MenuController:
             scale_factor = 1.0
 
             if not is_hovered:
-                float_offset_y = math.sin(current_time * 2.5 + self.anim_offsets[name]) * 15
+                float_offset_y = math.sin(current_time * 2.5 + self.anim_offsets[name]) * vp.px(15)
             else:
                 scale_factor = 1.1 + 0.05 * math.sin(current_time * 8) 
 
@@ -200,37 +166,36 @@ class MenuController:
             center_x = int(cx_norm * w)
             center_y = int(cy_norm * h + float_offset_y) 
             
-            target_diameter = int(r_norm * w * 2 * scale_factor)
-            radius_px = target_diameter // 2
-            
-            # Resize sprite
-            resized_bubble = cv2.resize(self.bubble_sprite, (target_diameter, target_diameter), interpolation=cv2.INTER_NEAREST)
+            # Resized sprite from the cache (pulse scale quantized -> a few sizes)
+            base_diameter = r_norm * w * 2
+            resized_bubble = get_assets().scaled("pixel_bubble.png", (base_diameter, base_diameter), scale_factor, cv2.INTER_NEAREST)
+            radius_px = resized_bubble.shape[1] // 2
             
             top_left_x = center_x - radius_px
             top_left_y = center_y - radius_px
 
             # Draw Bubble
-            frame = self.overlay_transparent(frame, resized_bubble, top_left_x, top_left_y)
+            blit_image(frame, resized_bubble, top_left_x, top_left_y)
 
             # Draw Selection Ring
             if is_hovered and self.state["progress"] > 0:
-                thickness = 8 
+                thickness = vp.thick(8)
                 angle = 360 * self.state["progress"]
                 cv2.ellipse(frame, (center_x, center_y), (radius_px + thickness//2, radius_px + thickness//2),
                             -90, 0, angle, (255, 255, 0), thickness, lineType=cv2.LINE_4)
 
-            # Draw Text
-            font_scale = 1.0 * scale_factor 
-            thickness = 2
-            text_size = cv2.getTextSize(name, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)[0]
-            tx = center_x - text_size[0] // 2
-            ty = center_y + text_size[1] // 2
+            # Draw Text (scale quantized like the bubble -> a few cached text bitmaps)
+            font_scale = vp.font(round(scale_factor / config.ASSET_SCALE_STEP) * config.ASSET_SCALE_STEP)
+            thickness = vp.thick(2)
+            ts = text_size(name, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)[0]
+            tx = center_x - ts[0] // 2
+            ty = center_y + ts[1] // 2
             
             # Outline & Fill
             text_color = (255, 255, 255)
             if is_hovered: text_color = (200, 255, 255) 
             
-            cv2.putText(frame, name, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, (0,0,0), thickness+3, lineType=cv2.LINE_4)
-            cv2.putText(frame, name, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, text_color, thickness, lineType=cv2.LINE_4)
+            put_text(frame, name, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, text_color, thickness,
+                     cv2.LINE_4, shadow=(0, 0, (0,0,0), thickness + vp.thick(3)))
     
         return frame
\ No newline at end of file
@@ -1,13 +1,21 @@
 import cv2
-import time
-import numpy as np
 import math
 import random
 import threading
 from src.core.ai_generator import AIGenerator
+from src.core import clock
+from src.ui.shared import tint_rect, draw_panel
+from src.ui.text_cache import put_text, text_size
+from src.ui.text_layout import fit_text
+from src.ui.gradients import draw_vertical_gradient
+from src.core.event_bus import publish, subscribe, GameFinished, JobDone
+from src.ui.viewport import viewport
 
 class QuizGame:
-    def __init__(self):
+    # Vision: hand cursor every frame, face only for the idle timer
+    VISION_NEEDS = {"hands": 1, "face": 3}
+
+    def __init__(self, ai_generator=None):
         # --- CONFIGURARE JOC ---
         self.DWELL_THRESHOLD = 1.0  
         self.FEEDBACK_DURATION = 2.0 
@@ -20,8 +28,10 @@ class QuizGame:
         
         self.game_over = False 
         
-        print("QuizGame: Initializare generator AI...")
-        self.ai_generator = AIGenerator()
+        if ai_generator is None:
+            print("QuizGame: Initializare generator AI...")
+            ai_generator = AIGenerator()
+        self.ai_generator = ai_generator
         
         self.questions = []
         self.current_q_index = 0
@@ -70,6 +80,9 @@ class QuizGame:
 
         self.anim_offsets = {k: random.uniform(0, 6.28) for k in list(self.options_layout.keys()) + list(self.game_over_layout.keys())}
 
+        # Intrebarile generate pe thread ajung prin JobDone (aplicate pe main thread)
+        subscribe(JobDone, self._on_job_done)
+
         self.start_loading_questions()
 
     def start_loading_questions(self):
@@ -81,20 +94,29 @@ class QuizGame:
             try:
                 new_questions = self.ai_generator.generate_quiz()
                 if new_questions and len(new_questions) > 0:
-                    self.questions = new_questions
+                    publish(JobDone("quiz_questions", True, new_questions, source=self))
                 else:
-                    self.questions = self._get_hardcoded_fallback()
+                    publish(JobDone("quiz_questions", False, self._get_hardcoded_fallback(), source=self))
             except Exception as e:
                 print(f"QuizGame [Thread] EROARE: {e}")
-                self.questions = self._get_hardcoded_fallback()
-            
-            self.current_q_index = 0
-            self.score = 0
-            self.state = self.STATE_PLAYING
+                publish(JobDone("quiz_questions", False, self._get_hardcoded_fallback(), source=self))
+
+        # Pastram referinta (replay-ul determinist asteapta incarcarea)
+        self.loader_thread = threading.Thread(target=worker)
+        self.loader_thread.daemon = True 
+        self.loader_thread.start()
+
+    def _on_job_done(self, event):
+        if event.source is not self or event.job != "quiz_questions": return
+        if self.state != self.STATE_LOADING: return
+        self.questions = event.result
+        self.current_q_index = 0
+        self.score = 0
+        self.state = self.STATE_PLAYING
 
-        thread = threading.Thread(target=worker)
-        thread.daemon = True 
-        thread.start()
+    def _finish(self):
+        """Back to the games hub (the hub reacts to GameFinished)."""
+        publish(GameFinished("QUIZ", self.score, source=self))
 
     def _get_hardcoded_fallback(self):
         return [
@@ -118,56 +140,20 @@ class QuizGame:
         return text
 
     def _draw_centered_text_wrapped(self, frame, text, center_x, center_y, max_w, max_h, color, thickness=2, font_face=cv2.FONT_HERSHEY_SIMPLEX):
-        words = text.split(' ')
-        best_scale = 1.5 
-        min_scale = 0.5
-        final_lines = []
-        final_scale = best_scale
-        
-        for scale in np.arange(best_scale, min_scale - 0.1, -0.1):
-            scale = round(scale, 1)
-            (w_space, h_line), baseline = cv2.getTextSize("Tg", font_face, scale, thickness)
-            line_height = h_line + baseline + 10 
-            lines = []
-            current_line = ""
-            valid_fit = True
-            
-            for word in words:
-                test_line = current_line + (" " if current_line else "") + word
-                (w_text, h_text), _ = cv2.getTextSize(test_line, font_face, scale, thickness)
-                if w_text <= max_w:
-                    current_line = test_line
-                else:
-                    if current_line: lines.append(current_line)
-                    (w_word, _), _ = cv2.getTextSize(word, font_face, scale, thickness)
-                    if w_word > max_w:
-                        valid_fit = False 
-                        break
-                    current_line = word
-            if current_line: lines.append(current_line)
-            if not valid_fit: continue 
-            
-            total_h = len(lines) * line_height
-            if total_h <= max_h:
-                final_lines = lines
-                final_scale = scale
-                break 
-        
-        if not final_lines:
-            final_lines = [text]
-            final_scale = min_scale
-
-        (w_dummy, h_line), baseline = cv2.getTextSize("Tg", font_face, final_scale, thickness)
-        line_height = h_line + baseline + 10
-        total_block_h = len(final_lines) * line_height
-        start_y = center_y - (total_block_h // 2) + h_line 
-        
-        for i, line in enumerate(final_lines):
-            (lw, lh), _ = cv2.getTextSize(line, font_face, final_scale, thickness)
+        # Randuri + scala calculate o data per (text, cutie) - text_layout le memoreaza
+        vp = viewport(frame)
+        thickness = vp.thick(thickness)
+        layout = fit_text(text, font_face, thickness, max_w, max_h, max_scale=vp.font(1.5), min_scale=vp.font(0.5),
+                          step=vp.font(0.1), line_gap=vp.px(10))
+        d = vp.px(2)
+
+        total_block_h = len(layout.lines) * layout.line_height
+        start_y = center_y - (total_block_h // 2) + layout.h_line 
+        
+        for i, (line, lw) in enumerate(zip(layout.lines, layout.widths)):
             lx = center_x - (lw // 2)
-            ly = start_y + (i * line_height)
-            cv2.putText(frame, line, (lx+2, ly+2), font_face, final_scale, (0,0,0), thickness)
-            cv2.putText(frame, line, (lx, ly), font_face, final_scale, color, thickness)
+            ly = start_y + (i * layout.line_height)
+            put_text(frame, line, (lx, ly), font_face, layout.scale, color, thickness, shadow=(d, d, (0,0,0)))
 
     def reset(self):
         self.game_over = False
@@ -183,15 +169,16 @@ class QuizGame:
             if bx < cursor_x < bx + bw and by < cursor_y < by + bh:
                 if not self.back_hovered:
                     self.back_hovered = True
-                    self.back_start_time = time.time()
+                    self.back_start_time = clock.now()
                     self.back_progress = 0.0
                 else:
-                    elapsed = time.time() - self.back_start_time
+                    elapsed = clock.now() - self.back_start_time
                     self.back_progress = min(elapsed / self.DWELL_THRESHOLD, 1.0)
                     if self.back_progress >= 1.0:
                         self.back_hovered = False
                         self.back_progress = 0.0
-                        return "EXIT_TO_APP" 
+                        self._finish()
+                        return None
             else:
                 self.back_hovered = False
                 self.back_progress = 0.0
@@ -201,11 +188,11 @@ class QuizGame:
             return None
 
         if self.state == self.STATE_GAMEOVER:
-            # FIX: Returnam rezultatul interactiunii (ca sa prindem EXIT_TO_APP)
-            return self._handle_interaction(cursor_x, cursor_y, self.game_over_layout, is_game=False)
+            self._handle_interaction(cursor_x, cursor_y, self.game_over_layout, is_game=False)
+            return None
 
         if self.state == self.STATE_FEEDBACK:
-            if time.time() - self.feedback_start_time > self.FEEDBACK_DURATION:
+            if clock.now() - self.feedback_start_time > self.FEEDBACK_DURATION:
                 self._next_question()
             return None
 
@@ -223,7 +210,7 @@ class QuizGame:
                 break
         
         if hovered and hovered == self.current_selection:
-            elapsed = time.time() - self.selection_start_time
+            elapsed = clock.now() - self.selection_start_time
             self.progress = min(elapsed / self.DWELL_THRESHOLD, 1.0)
             
             if self.progress >= 1.0:
@@ -237,10 +224,10 @@ class QuizGame:
                     if hovered == "RETRY":
                         self.reset()
                     elif hovered == "EXIT":
-                        return "EXIT_TO_APP" # <--- AICI ERA PROBLEMA!
+                        self._finish()
         else:
             self.current_selection = hovered
-            self.selection_start_time = time.time()
+            self.selection_start_time = clock.now()
             self.progress = 0.0
             
         return None
@@ -252,7 +239,7 @@ class QuizGame:
         self.is_correct = (choice == q["correct"])
         if self.is_correct: self.score += 1
         self.state = self.STATE_FEEDBACK
-        self.feedback_start_time = time.time()
+        self.feedback_start_time = clock.now()
 
     def _next_question(self):
         self.current_q_index += 1
@@ -263,23 +250,15 @@ class QuizGame:
 
     def _draw_gradient_rect(self, frame, x, y, w, h, c1, c2):
         if w <= 0 or h <= 0: return frame
-        gradient = np.zeros((h, w, 3), dtype=np.uint8)
-        for i in range(h):
-            alpha = i / h
-            color = (
-                int(c1[0]*(1-alpha) + c2[0]*alpha),
-                int(c1[1]*(1-alpha) + c2[1]*alpha),
-                int(c1[2]*(1-alpha) + c2[2]*alpha)
-            )
-            gradient[i, :] = color
-        
         if y+h > frame.shape[0] or x+w > frame.shape[1]: return frame
-        frame[y:y+h, x:x+w] = gradient
+        # Gradient din cache (construit o data, vectorizat)
+        draw_vertical_gradient(frame, x, y, w, h, c1, c2)
         cv2.rectangle(frame, (x, y), (x+w, y+h), (255, 255, 255), 1)
         return frame
 
     def _draw_back_button(self, frame):
         h, w, _ = frame.shape
+        vp = viewport(frame)
         bx, by, bw, bh = self.back_btn_layout
         x1, y1 = int(bx * w), int(by * h)
         x2, y2 = int((bx + bw) * w), int((by + bh) * h)
@@ -289,16 +268,12 @@ class QuizGame:
         bg_col = self.BLUE_PALETTE["BG"]
         
         # 1. Fundal Semitransparent
-        roi = frame[y1:y2, x1:x2]
-        block = np.zeros_like(roi, dtype=np.uint8)
-        block[:] = bg_col
-        cv2.addWeighted(block, 0.4, roi, 0.6, 0, roi)
-        frame[y1:y2, x1:x2] = roi
+        tint_rect(frame, x1, y1, x2, y2, bg_col, 0.4)
         
         # 2. Border "Tech" (Colturi Opuse)
         corner_w = int((x2-x1) * 0.3)
         corner_h = int((y2-y1) * 0.4)
-        thick = 3 if self.back_hovered else 2
+        thick = vp.thick(3 if self.back_hovered else 2)
         
         # Stanga-Sus
         cv2.line(frame, (x1, y1), (x1+corner_w, y1), border_col, thick)
@@ -310,21 +285,23 @@ class QuizGame:
         # 3. Bara Progres
         if self.back_hovered and self.back_progress > 0:
             pw = int((x2-x1) * self.back_progress)
-            cv2.rectangle(frame, (x1, y2-4), (x1+pw, y2), self.BLUE_PALETTE["HOVER"], -1)
+            cv2.rectangle(frame, (x1, y2 - vp.px(4)), (x1+pw, y2), self.BLUE_PALETTE["HOVER"], -1)
             
         # 4. Text
         label = "<< INAPOI"
-        ts = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
+        scale, t = vp.font(0.6), vp.thick(2)
+        ts = text_size(label, cv2.FONT_HERSHEY_SIMPLEX, scale, t)[0]
         tx = x1 + (x2-x1-ts[0]) // 2
         ty = y1 + (y2-y1+ts[1]) // 2
-        cv2.putText(frame, label, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.BLUE_PALETTE["TEXT"], 2)
+        put_text(frame, label, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, scale, self.BLUE_PALETTE["TEXT"], t)
 
     def _draw_modern_button(self, frame, key, text, layout_dict, current_time, is_answer=False):
         text = self._clean_text(text)
         bx, by, bw, bh = layout_dict[key]
         h, w, _ = frame.shape
+        vp = viewport(frame)
         
-        float_off = math.sin(current_time * 3 + self.anim_offsets.get(key,0)) * 5
+        float_off = math.sin(current_time * 3 + self.anim_offsets.get(key,0)) * vp.px(5)
         x1 = int(bx*w)
         y1 = int(by*h + float_off)
         w_px = int(bw*w)
@@ -348,28 +325,26 @@ class QuizGame:
             border = (0,255,255)
 
         if is_hover and self.state != self.STATE_FEEDBACK:
-            cv2.rectangle(frame, (x1-2, y1-2), (x2+2, y2+2), (0,100,100), -1)
+            g = vp.px(2)
+            cv2.rectangle(frame, (x1-g, y1-g), (x2+g, y2+g), (0,100,100), -1)
         
         if h_px > 0 and w_px > 0:
-            grad = np.zeros((h_px, w_px, 3), dtype=np.uint8)
-            for i in range(h_px):
-                a = i/h_px
-                grad[i,:] = (int(c_top[0]*(1-a)+c_bot[0]*a), int(c_top[1]*(1-a)+c_bot[1]*a), int(c_top[2]*(1-a)+c_bot[2]*a))
-            frame[y1:y2, x1:x2] = grad
+            draw_vertical_gradient(frame, x1, y1, w_px, h_px, c_top, c_bot)
 
-        cv2.rectangle(frame, (x1, y1), (x2, y2), border, 2)
+        cv2.rectangle(frame, (x1, y1), (x2, y2), border, vp.thick(2))
         
         if is_hover and self.progress > 0 and self.state != self.STATE_FEEDBACK:
             bw_prog = int(w_px * self.progress)
-            cv2.rectangle(frame, (x1, y2-6), (x1+bw_prog, y2), (0,255,0), -1)
+            cv2.rectangle(frame, (x1, y2 - vp.px(6)), (x1+bw_prog, y2), (0,255,0), -1)
 
         center_x = x1 + w_px // 2
         center_y = y1 + h_px // 2
-        self._draw_centered_text_wrapped(frame, text, center_x, center_y, w_px - 20, h_px - 20, (255,255,255))
+        self._draw_centered_text_wrapped(frame, text, center_x, center_y, w_px - vp.px(20), h_px - vp.px(20), (255,255,255))
 
     def draw(self, frame):
         h, w, _ = frame.shape
-        curr_time = time.time()
+        vp = viewport(frame)
+        curr_time = clock.now()
         
         # FIX: Deseneaza Butonul BACK doar daca NU e Game Over
         if self.state != self.STATE_GAMEOVER:
@@ -378,25 +353,27 @@ class QuizGame:
         if self.state == self.STATE_LOADING:
             msg = "AI GENEREAZA INTREBARI..."
             font = cv2.FONT_HERSHEY_SIMPLEX
-            ts = cv2.getTextSize(msg, font, 1.0, 2)[0]
+            ts = cv2.getTextSize(msg, font, vp.font(1.0), vp.thick(2))[0]
+            # Culoarea pulseaza in fiecare frame: ar rata mereu text_cache, ramane cv2.putText
             pulse = abs(math.sin(curr_time * 3)) * 255
             col = (255, pulse, 0)
-            cv2.putText(frame, msg, (w//2 - ts[0]//2, h//2), font, 1.0, col, 2)
+            cv2.putText(frame, msg, (w//2 - ts[0]//2, h//2), font, vp.font(1.0), col, vp.thick(2))
             return frame
 
         if self.state == self.STATE_FEEDBACK:
-            if time.time() - self.feedback_start_time > self.FEEDBACK_DURATION:
+            if clock.now() - self.feedback_start_time > self.FEEDBACK_DURATION:
                 self._next_question()
 
         if self.state == self.STATE_GAMEOVER:
-            panel_w, panel_h = 700, 350
-            px, py = w//2 - panel_w//2, 80
+            panel_w, panel_h = vp.px(700), vp.px(350)
+            px, py = w//2 - panel_w//2, vp.px(80)
             self._draw_gradient_rect(frame, px, py, panel_w, panel_h, self.COLOR_ACIEE_DARK, self.COLOR_ACIEE_LIGHT)
+            t2 = vp.thick(2)
             
-            cv2.putText(frame, "REZULTAT FINAL", (w//2 - 130, py + 60), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255,255,255), 2)
+            put_text(frame, "REZULTAT FINAL", (w//2 - vp.px(130), py + vp.px(60)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(1.2), (255,255,255), t2)
             score_txt = f"{self.score} / {len(self.questions)}"
-            ts = cv2.getTextSize(score_txt, cv2.FONT_HERSHEY_SIMPLEX, 2.5, 5)[0]
-            cv2.putText(frame, score_txt, (w//2 - ts[0]//2, py + 140), cv2.FONT_HERSHEY_SIMPLEX, 2.5, (0,255,255), 5)
+            ts = text_size(score_txt, cv2.FONT_HERSHEY_SIMPLEX, vp.font(2.5), vp.thick(5))[0]
+            put_text(frame, score_txt, (w//2 - ts[0]//2, py + vp.px(140)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(2.5), (0,255,255), vp.thick(5))
             
             r = 0 if not self.questions else self.score/len(self.questions)
             m1 = "Excelent! Esti nascut pentru inginerie!" if r>=0.8 else "Bravo! Ai potential mare." if r>=0.5 else "Nu te descuraja!"
@@ -404,10 +381,10 @@ class QuizGame:
             m1 = self._clean_text(m1)
             m2 = self._clean_text(m2)
             
-            ts1 = cv2.getTextSize(m1, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
-            cv2.putText(frame, m1, (w//2 - ts1[0]//2, py + 220), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (220,220,220), 2)
-            ts2 = cv2.getTextSize(m2, cv2.FONT_HERSHEY_SIMPLEX, 0.9, 2)[0]
-            cv2.putText(frame, m2, (w//2 - ts2[0]//2, py + 270), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0,255,255), 2)
+            ts1 = text_size(m1, cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.8), t2)[0]
+            put_text(frame, m1, (w//2 - ts1[0]//2, py + vp.px(220)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.8), (220,220,220), t2)
+            ts2 = text_size(m2, cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.9), t2)[0]
+            put_text(frame, m2, (w//2 - ts2[0]//2, py + vp.px(270)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.9), (0,255,255), t2)
             
             self._draw_modern_button(frame, "RETRY", "REINCEARCA", self.game_over_layout, curr_time)
             self._draw_modern_button(frame, "EXIT", "INAPOI LA JOCURI", self.game_over_layout, curr_time)
@@ -418,29 +395,27 @@ class QuizGame:
         q = self.questions[self.current_q_index]
         q_text = self._clean_text(q['text'])
         
-        hw, hh = int(w*0.9), 140
+        hw, hh = int(w*0.9), vp.px(140)
         hx, hy = (w-hw)//2, int(h*0.25)
         self._draw_gradient_rect(frame, hx, hy, hw, hh, self.COLOR_ACIEE_DARK, self.COLOR_ACIEE_LIGHT)
         
         q_count_text = f"Intrebarea {self.current_q_index + 1} / {len(self.questions)}"
         q_count_text = self._clean_text(q_count_text)
         
-        ts_q = cv2.getTextSize(q_count_text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
-        panel_q_x = w // 2 - (ts_q[0] + 40) // 2 
-        panel_q_y = 30
+        ts_q = text_size(q_count_text, cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.7), vp.thick(2))[0]
+        pad = vp.px(40)
+        panel_q_x = w // 2 - (ts_q[0] + pad) // 2 
+        panel_q_y = vp.px(30)
         
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (panel_q_x, panel_q_y), (panel_q_x + ts_q[0] + 40, panel_q_y + 40), (0,0,0), -1)
-        cv2.addWeighted(overlay, 0.6, frame, 0.4, 0, frame)
-        cv2.rectangle(frame, (panel_q_x, panel_q_y), (panel_q_x + ts_q[0] + 40, panel_q_y + 40), (200,200,200), 1)
-        cv2.putText(frame, q_count_text, (panel_q_x + 20, panel_q_y + 28), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255,255,255), 2)
+        draw_panel(frame, panel_q_x, panel_q_y, panel_q_x + ts_q[0] + pad, panel_q_y + pad, (0,0,0), 0.6, border_color=(200,200,200))
+        put_text(frame, q_count_text, (panel_q_x + vp.px(20), panel_q_y + vp.px(28)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.7), (255,255,255), vp.thick(2))
 
         score_lbl = f"Scor: {self.score}"
-        cv2.putText(frame, score_lbl, (hx + hw - 150, hy + hh - 15), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200,200,200), 1)
+        put_text(frame, score_lbl, (hx + hw - vp.px(150), hy + hh - vp.px(15)), cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.8), (200,200,200), 1)
         
         center_qx = hx + hw // 2
         center_qy = hy + hh // 2
-        self._draw_centered_text_wrapped(frame, q_text, center_qx, center_qy, hw - 40, hh - 20, (255,255,255))
+        self._draw_centered_text_wrapped(frame, q_text, center_qx, center_qy, hw - vp.px(40), hh - vp.px(20), (255,255,255))
         
         for k, v in q["options"].items():
             self._draw_modern_button(frame, k, v, self.options_layout, curr_time, is_answer=True)
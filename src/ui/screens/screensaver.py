@@ -1,17 +1,29 @@
 import cv2
-import mediapipe as mp
-import time
 import numpy as np
-import random
-import os
+from src import config
+from src.vision.face_detector import FaceDetector
+from src.ui.shared import QUALITY, dim_frame
+from src.core import clock
+from src.core.assets import get_assets
+from src.core.buffers import get_buffers
+from src.ui.compositor import blit_image, sprite_of
+from src.ui.particles import ParticleField, streak_image
+from src.ui.text_cache import put_text
+from src.core.event_bus import publish, TransitionEvent
+from src.ui.viewport import viewport
+
+# Glass card color and its 0.6 / 0.4 blend as a lookup table (same rounding as cv2.addWeighted)
+_CARD_COLOR = np.array((10, 10, 10), dtype=np.uint8)
+_GLASS_LUT = cv2.addWeighted(np.full((1, 256), 10, dtype=np.uint8), 0.6,
+                             np.arange(256, dtype=np.uint8).reshape(1, 256), 0.4, 0)
 
 class Screensaver:
-    def __init__(self):
-        # Face Detection Setup
-        self.mp_face_detection = mp.solutions.face_detection
-        self.face_detection = self.mp_face_detection.FaceDetection(
-            min_detection_confidence=0.5
-        )
+    # Vision: only the face matters here (wake up)
+    VISION_NEEDS = {"hands": 0, "face": 1}
+
+    def __init__(self, face_detector=None):
+        # Face Detection Setup (shared service, one inference per frame)
+        self.face_detector = face_detector if face_detector is not None else FaceDetector()
         
         # State
         self.face_detected_time = 0
@@ -19,19 +31,20 @@ class Screensaver:
         
         # Load Particle Image (ACIEE Logo)
         self.particle_img = None
+        self.particle_name = None
+        self.PARTICLE_SIZE = 30  # px at 1080p
         # Check standard extensions
         possible_names = ["aciee_logo.jpeg", "aciee_logo.png", "aciee_logo.jpg"]
-        base_path = "assets/images"
+        assets = get_assets()
         
         for name in possible_names:
-            full_path = os.path.join(base_path, name)
-            if os.path.exists(full_path):
+            if assets.exists(name):
                 try:
-                    loaded_img = cv2.imread(full_path, cv2.IMREAD_UNCHANGED)
-                    if loaded_img is not None:
-                        # Resize to a small particle size (e.g., 30x30 pixels)
-                        self.particle_img = cv2.resize(loaded_img, (30, 30))
-                        print(f"Screensaver: Loaded particle image from {full_path}")
+                    # Small particle size (e.g., 30x30 pixels)
+                    self.particle_img = assets.variant(name, (self.PARTICLE_SIZE, self.PARTICLE_SIZE))
+                    if self.particle_img is not None:
+                        self.particle_name = name
+                        print(f"Screensaver: Loaded particle image from {assets.path(name)}")
                         break
                 except Exception as e:
                     print(f"Screensaver: Error loading {name}: {e}")
@@ -39,86 +52,49 @@ class Screensaver:
         if self.particle_img is None:
             print("Screensaver: No 'aciee_logo' found in assets. Using default circles.")
 
-        # Animation State
-        # Format: [x, y, speed, color]
-        self.particles = []
-        for _ in range(65): 
-            self.particles.append([
-                random.random(),             # x: 0.0 - 1.0
-                random.random(),             # y: 0.0 - 1.0
-                random.uniform(0.003, 0.01), # speed: ~0.3% to 1% of screen height
-                random.choice([(0, 255, 255), (255, 100, 0)]) 
-            ])
+        # Animation State: x, y (0.0 - 1.0), speed (~0.3% to 1% of screen height) and color
+        # per particle, as NumPy arrays (src/ui/particles.py)
+        self.PARTICLE_COLORS = [(0, 255, 255), (255, 100, 0)]
+        self.particles = ParticleField(config.SAVER_PARTICLES, (0.003, 0.01), kinds=len(self.PARTICLE_COLORS))
+        self.streaks = {}  # fallback sprites per resolution
+
+        # Glass card (masks + static text), built once per resolution
+        self.card = None
+        self.card_key = None
             
         self.logo_pulse = 0.0
 
-    def is_face_present(self, frame):
-        h, w, c = frame.shape
+    def is_face_present(self, frame, seq=None):
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.face_detection.process(frame_rgb)
-        
-        if results.detections:
-            for detection in results.detections:
-                bboxC = detection.location_data.relative_bounding_box
-                face_height = int(bboxC.height * h)
-                if face_height > h * 0.10: 
-                    return True
-        return False
-
-    def update(self, frame):
-        face_found = self.is_face_present(frame)
+        return self.face_detector.is_face_present(frame_rgb, seq)
+
+    def is_face_present_rgb(self, frame_rgb, seq=None):
+        """Face check on the shared RGB inference buffer (memoized per seq)."""
+        return self.face_detector.is_face_present(frame_rgb, seq)
+
+    def update(self, frame, face_found=None):
+        # face_found can come from the vision worker (no second inference pass)
+        if face_found is None:
+            face_found = self.is_face_present(frame)
         
         if face_found:
             if self.face_detected_time == 0:
-                self.face_detected_time = time.time()
+                self.face_detected_time = clock.now()
             
-            elapsed = time.time() - self.face_detected_time
+            elapsed = clock.now() - self.face_detected_time
             if elapsed > self.WAKE_THRESHOLD:
                 self.face_detected_time = 0
-                return "WAKE_UP"
+                publish(TransitionEvent("MENU", source=self))
+                return None
         else:
             self.face_detected_time = 0
         
-        # Update Particle Animation (Normalized Math)
-        for p in self.particles:
-            p[1] += p[2]  # y += speed
-            # If particle goes off the bottom (>1.0), reset to top
-            if p[1] > 1.05:
-                p[1] = -0.05
-                p[0] = random.random()
+        # Update Particle Animation (Normalized Math, all particles at once)
+        self.particles.update()
 
         self.logo_pulse += 0.1
         return None
 
-    def _overlay_image(self, bg, overlay, x, y):
-        """Helper to draw an overlay with transparency checks."""
-        bg_h, bg_w = bg.shape[:2]
-        ov_h, ov_w = overlay.shape[:2]
-
-        # Calculate limits to prevent out-of-bounds errors
-        x1, y1 = max(0, x), max(0, y)
-        x2, y2 = min(bg_w, x + ov_w), min(bg_h, y + ov_h)
-
-        if x1 >= x2 or y1 >= y2: return
-
-        ov_x1 = x1 - x
-        ov_y1 = y1 - y
-        ov_x2 = ov_x1 + (x2 - x1)
-        ov_y2 = ov_y1 + (y2 - y1)
-
-        bg_crop = bg[y1:y2, x1:x2]
-        ov_crop = overlay[ov_y1:ov_y2, ov_x1:ov_x2]
-
-        if overlay.shape[2] == 4:
-            alpha = ov_crop[:, :, 3] / 255.0
-            alpha_inv = 1.0 - alpha
-            
-            for c in range(3):
-                bg_crop[:, :, c] = (alpha * ov_crop[:, :, c] + 
-                                    alpha_inv * bg_crop[:, :, c])
-        else:
-            bg[y1:y2, x1:x2] = ov_crop
-
     def _draw_rounded_rect(self, img, pt1, pt2, color, thickness, r):
         """Helper to draw a rectangle with rounded corners."""
         x1, y1 = pt1
@@ -152,100 +128,135 @@ class Screensaver:
             cv2.ellipse(img, (x1 + r, y2 - r), (r, r), 90, 0, 90, color, thickness)
             cv2.ellipse(img, (x2 - r, y2 - r), (r, r), 0, 0, 90, color, thickness)
 
-    def draw(self, frame, logo_img=None):
-        h, w, _ = frame.shape
-        
-        # 1. Background Dimming (Neutral Dark Charcoal)
-        overlay = frame.copy()
-        # BGR Color: All equal and low -> Dark Grey
-        cv2.rectangle(overlay, (0, 0), (w, h), (15, 15, 15), -1) 
-        
-        cv2.addWeighted(overlay, 0.95, frame, 0.05, 0, frame)
-        
-        # 2. Draw Matrix Particles
-        for p in self.particles:
-            nx, ny, speed, color = p
-            draw_x = int(nx * w)
-            draw_y = int(ny * h)
-            
-            if self.particle_img is not None:
-                self._overlay_image(frame, self.particle_img, draw_x, draw_y)
-            else:
-                cv2.circle(frame, (draw_x, draw_y), 2, color, -1)
-                cv2.line(frame, (draw_x, draw_y), (draw_x, draw_y-10), color, 1)
+    def _streak_sprites(self, vp):
+        """Fallback particles (dot + trail), one sprite per color, per resolution."""
+        radius, length = vp.px(2), vp.px(10)
+        sprites = self.streaks.get((radius, length))
+        if sprites is None:
+            sprites = self.streaks[(radius, length)] = [
+                sprite_of(streak_image(color, length, radius)) for color in self.PARTICLE_COLORS
+            ]
+        return sprites, (-radius, -length)
+
+    def _get_card(self, vp):
+        """
+        The glass card at (w, h): visible rect + masks of the rounded fill and
+        of the glow border, and the static shadow border. Drawn once with the
+        same OpenCV calls as before, reused every frame (the text is
+        anti-aliased, it goes through the text cache in draw()).
+        """
+        w, h = vp.w, vp.h
+        if self.card_key == (w, h):
+            return self.card
 
-        # 3. Draw Glass Card & Text
-        pulse = abs(np.sin(self.logo_pulse))
         center_y = h // 2
         
         # --- NEW SIZE LOGIC: Centered box instead of full width ---
-        box_width = 800
-        box_height = 180
+        box_width = vp.px(800)
+        box_height = vp.px(180)
         half_w = box_width // 2
         half_h = box_height // 2
+        offset = vp.px(6)
+        # Corner radius for rounded edges
+        radius = vp.px(20)
+
+        # Card rect with the shadow border around it, in card coordinates
+        pad = offset + vp.thick(2) + 1
+        cx1, cy1 = (w // 2) - half_w - pad, center_y - half_h - pad
+        cw, ch = 2 * (half_w + pad) + 1, 2 * (half_h + pad) + 1
+        box1, box2 = (pad, pad), (pad + 2 * half_w, pad + 2 * half_h)
+
+        fill = np.zeros((ch, cw), dtype=np.uint8)
+        self._draw_rounded_rect(fill, box1, box2, 255, -1, radius)
+        glow = np.zeros((ch, cw), dtype=np.uint8)
+        self._draw_rounded_rect(glow, box1, box2, 255, vp.thick(2), radius)
+
+        overlay = np.zeros((ch, cw, 3), dtype=np.uint8)
+        self._draw_rounded_rect(overlay, (pad - offset, pad - offset),
+                                (box2[0] + offset, box2[1] + offset), (200, 200, 200), 1, radius + vp.px(2))
+        overlay_mask = overlay.any(axis=2)
 
-        box_x1, box_y1 = (w // 2) - half_w, center_y - half_h
-        box_x2, box_y2 = (w // 2) + half_w, center_y + half_h
+        # Clip to the frame
+        x1, y1 = max(0, cx1), max(0, cy1)
+        x2, y2 = min(w, cx1 + cw), min(h, cy1 + ch)
+        crop = (slice(y1 - cy1, y2 - cy1), slice(x1 - cx1, x2 - cx1))
+        self.card = (x1, y1, x2, y2,
+                     fill[crop][:, :, None] > 0, glow[crop][:, :, None] > 0,
+                     np.ascontiguousarray(overlay[crop]), overlay_mask[crop][:, :, None])
+        self.card_key = (w, h)
+        return self.card
+
+    def draw(self, frame, logo_img=None):
+        h, w, _ = frame.shape
+        vp = viewport(frame)
         
-        # Corner radius for rounded edges
-        radius = 20
+        # 1. Background Dimming (Neutral Dark Charcoal)
+        # BGR Color: All equal and low -> Dark Grey
+        dim_frame(frame, (15, 15, 15), 0.95)
+        
+        # 2. Draw Matrix Particles (batched, one compositing pass per sprite)
+        if self.particle_img is not None:
+            size = vp.px(self.PARTICLE_SIZE)
+            particle_img = get_assets().variant(self.particle_name, (size, size))
+            self.particles.draw(frame, [sprite_of(particle_img)])
+        else:
+            sprites, offset = self._streak_sprites(vp)
+            self.particles.draw(frame, sprites, offset)
+
+        # 3. Draw Glass Card & Text (masks cached per resolution, only the blend runs per frame)
+        pulse = abs(np.sin(self.logo_pulse))
+        x1, y1, x2, y2, fill, glow, overlay, overlay_mask = self._get_card(vp)
+        roi = frame[y1:y2, x1:x2]
 
         # Glass Effect (Rounded)
-        glass_overlay = frame.copy()
-        # Use new helper for filled rect (-1 thickness)
-        self._draw_rounded_rect(glass_overlay, (box_x1, box_y1), (box_x2, box_y2), (10, 10, 10), -1, radius)
-        cv2.addWeighted(glass_overlay, 0.6, frame, 0.4, 0, frame)
+        if QUALITY["saver_glass"]:
+            # 0.6 * card + 0.4 * background, as a lookup table, inside the card only
+            glass = get_buffers().scratch("saver.glass", roi.shape)
+            cv2.LUT(roi, _GLASS_LUT, dst=glass)
+            np.copyto(roi, glass, where=fill)
+        else:
+            # Low quality: solid card, no blend
+            np.copyto(roi, _CARD_COLOR, where=fill)
 
         # Glowing Border (Rounded)
         glow_color = (255, 150 + int(50 * pulse), 0)
-        # Use new helper for outline (2 thickness)
-        self._draw_rounded_rect(frame, (box_x1, box_y1), (box_x2, box_y2), glow_color, 2, radius)
-        
-        # Offset/Shadow Border (Rounded)
-        offset = 6
-        self._draw_rounded_rect(frame, 
-                                (box_x1 - offset, box_y1 - offset), 
-                                (box_x2 + offset, box_y2 + offset), 
-                                (200, 200, 200), 1, radius + 2)
-
-        # Text with Shadow
+        np.copyto(roi, np.array(glow_color, dtype=np.uint8), where=glow)
+
+        # Offset/Shadow Border (static)
+        np.copyto(roi, overlay, where=overlay_mask)
+
+        # Text (adjusted x-coordinates slightly to center within the 800px box)
         font = cv2.FONT_HERSHEY_SIMPLEX
-        # Adjusted x-coordinates slightly to center within the 800px box
-        cv2.putText(frame, "Facultatea de Automatica, Calculatoare,", (w//2 - 300, center_y - 20), font, 1, (255, 255, 255), 2)
-        cv2.putText(frame, "Inginerie Electrica si Electronica", (w//2 - 260, center_y + 30), font, 1, (255, 255, 255), 2)
+        center_y = h // 2
+        put_text(frame, "Facultatea de Automatica, Calculatoare,", (w//2 - vp.px(300), center_y - vp.px(20)),
+                 font, vp.font(1), (255, 255, 255), vp.thick(2))
+        put_text(frame, "Inginerie Electrica si Electronica", (w//2 - vp.px(260), center_y + vp.px(30)),
+                 font, vp.font(1), (255, 255, 255), vp.thick(2))
 
         # Blink Text
-        if int(time.time() * 2) % 2 == 0: 
-            cv2.putText(frame, "[ VINO IN FATA CAMEREI PENTRU A INCEPE ]", (w//2 - 400, h - 180), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.1, (255, 204, 0), 2)
+        if int(clock.now() * 2) % 2 == 0: 
+            cv2.putText(frame, "[ VINO IN FATA CAMEREI PENTRU A INCEPE ]", (w//2 - vp.px(400), h - vp.px(180)), 
+                       cv2.FONT_HERSHEY_SIMPLEX, vp.font(1.1), (255, 204, 0), vp.thick(2))
 
         # 4. Draw Logo (Main University Logo)
         if logo_img is not None:
             try:
                 ly, lx = logo_img.shape[:2]
                 x_pos = (w // 2) - (lx // 2)
-                y_pos = 50 
+                y_pos = vp.px(50)
                 if y_pos + ly <= h and x_pos + lx <= w:
-                    roi = frame[y_pos:y_pos+ly, x_pos:x_pos+lx]
-                    if logo_img.shape[2] == 4:
-                        b, g, r, a = cv2.split(logo_img)
-                        overlay_color = cv2.merge((b, g, r))
-                        mask = cv2.merge((a, a, a))
-                        img1_bg = cv2.bitwise_and(roi.copy(), cv2.bitwise_not(mask))
-                        img2_fg = cv2.bitwise_and(overlay_color, mask)
-                        frame[y_pos:y_pos+ly, x_pos:x_pos+lx] = cv2.add(img1_bg, img2_fg)
-                    else:
-                        frame[y_pos:y_pos+ly, x_pos:x_pos+lx] = logo_img
+                    blit_image(frame, logo_img, x_pos, y_pos)
             except Exception as e:
                 print(f"Error drawing logo: {e}")
 
         # 5. Waking Progress
-        waking_progress = 0 if self.face_detected_time == 0 else (time.time() - self.face_detected_time) / self.WAKE_THRESHOLD
+        waking_progress = 0 if self.face_detected_time == 0 else (clock.now() - self.face_detected_time) / self.WAKE_THRESHOLD
         if waking_progress > 0:
             bw = int(w * waking_progress)
-            cv2.rectangle(frame, (0, h-10), (w, h), (50, 50, 50), -1)
-            cv2.rectangle(frame, (0, h-10), (bw, h), (255, 200, 0), -1)
-            cv2.putText(frame, "INITIALIZARE SISTEM", (20, h - 30), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 200, 0), 2)
+            bar_h = vp.px(10)
+            cv2.rectangle(frame, (0, h - bar_h), (w, h), (50, 50, 50), -1)
+            cv2.rectangle(frame, (0, h - bar_h), (bw, h), (255, 200, 0), -1)
+            cv2.putText(frame, "INITIALIZARE SISTEM", (vp.px(20), h - vp.px(30)), 
+                       cv2.FONT_HERSHEY_SIMPLEX, vp.font(0.7), (255, 200, 0), vp.thick(2))
                        
         return frame
\ No newline at end of file
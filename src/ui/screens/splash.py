@@ -0,0 +1,55 @@
+import cv2
+import math
+from src.ui.shared import SHARED_PALETTE
+from src.core import clock
+from src.core.assets import get_assets
+from src.ui.viewport import viewport
+
+class SplashScreen:
+    """
+    Shown from the first frame while the kiosk loads (models, camera).
+    Cheap on purpose: no MediaPipe, one small image, plain OpenCV drawing.
+    """
+
+    # Textul afisat pentru fiecare task de pornire
+    TASK_LABELS = {
+        "camera": "Pornire camera...",
+        "app": "Incarcare modele AI..."
+    }
+
+    def __init__(self):
+        # Same decode the kiosk uses later for its own logo variants
+        # (300 px wide at 1080p; draw() takes the variant for the window size)
+        self.LOGO_WIDTH = 300
+        self.logo_img = get_assets().fit_width("logo_ugal.jpeg", self.LOGO_WIDTH)
+
+    def draw(self, frame, pending=()):
+        h, w, _ = frame.shape
+        vp = viewport(frame)
+        frame[:] = SHARED_PALETTE["BG_DARK"]
+        center_x, center_y = w // 2, h // 2
+
+        # Logo
+        logo_img = self.logo_img
+        if logo_img is not None and vp.s != 1:
+            logo_img = get_assets().fit_width("logo_ugal.jpeg", vp.px(self.LOGO_WIDTH))
+        if logo_img is not None:
+            lh, lw = logo_img.shape[:2]
+            x, y = center_x - lw // 2, center_y - lh - vp.px(120)
+            if x >= 0 and y >= 0:
+                frame[y:y + lh, x:x + lw] = logo_img[:, :, :3]
+
+        # Spinner
+        angle = (clock.now() * 360) % 360
+        r = vp.px(40)
+        cv2.ellipse(frame, (center_x, center_y), (r, r), angle, 0, 270, SHARED_PALETTE["CYAN"], vp.thick(4), cv2.LINE_AA)
+
+        # Status
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        labels = [self.TASK_LABELS.get(name, name) for name in pending] or ["Gata!"]
+        for i, text in enumerate(labels):
+            ts = cv2.getTextSize(text, font, vp.font(0.9), vp.thick(2))[0]
+            alpha = 0.6 + 0.4 * abs(math.sin(clock.now() * 2 + i))
+            color = tuple(int(c * alpha) for c in SHARED_PALETTE["TEXT"])
+            cv2.putText(frame, text, (center_x - ts[0] // 2, center_y + vp.px(110 + i * 45)), font, vp.font(0.9), color, vp.thick(2))
+        return frame
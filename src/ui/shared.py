@@ -1,5 +1,8 @@
 import cv2
 import numpy as np
+from src.core.buffers import get_buffers
+from src.ui.text_cache import put_text, text_size
+from src.ui.viewport import viewport
 
 # Paleta comuna pentru toata echipa
 SHARED_PALETTE = {
@@ -9,6 +12,70 @@ SHARED_PALETTE = {
     "TEXT":   (255, 255, 255)
 }
 
+# Efecte costisitoare - comutate de QualityGovernor (src/core/quality_governor.py)
+# cand kiosk-ul nu mai tine FPS-ul tinta. Ecranele le citesc la fiecare draw.
+QUALITY = {
+    "saver_glass": True,     # Screensaver: panoul de sticla (blend)
+    "maze_grid": True,       # Maze: grilajul tech din fundal
+    "maze_wall_fill": True,  # Maze: umplerea neon a peretilor
+    "arcade_shake": True     # Arcade: shake la damage
+}
+
+# --- PRIMITIVE TRANSLUCIDE ---
+# Blend doar pe regiunea afectata, in-place (fara frame.copy() pe tot ecranul).
+# from src.ui.shared import tint_rect, dim_frame, draw_panel, draw_translucent_text
+
+def _tint_matrix(color, alpha):
+    """3x4 affine matrix for cv2.transform: out = (1 - alpha) * pixel + alpha * color."""
+    m = np.zeros((3, 4), dtype=np.float32)
+    m[0, 0] = m[1, 1] = m[2, 2] = 1.0 - alpha
+    m[:, 3] = [c * alpha for c in color[:3]]
+    return m
+
+def _clip_rect(frame, x1, y1, x2, y2):
+    h, w = frame.shape[:2]
+    return max(0, x1), max(0, y1), min(w, x2), min(h, y2)
+
+def tint_rect(frame, x1, y1, x2, y2, color, alpha):
+    """
+    Blends a solid `color` over frame[y1:y2, x1:x2] with opacity `alpha`.
+    Same result as drawing the rectangle on a copy + addWeighted, but one
+    in-place pass over the ROI only.
+    """
+    x1, y1, x2, y2 = _clip_rect(frame, x1, y1, x2, y2)
+    if x1 >= x2 or y1 >= y2:
+        return frame
+    roi = frame[y1:y2, x1:x2]
+    cv2.transform(roi, _tint_matrix(color, alpha), dst=roi)
+    return frame
+
+def dim_frame(frame, color=(0, 0, 0), alpha=0.6):
+    """Full-screen tint (pause / game over overlays): one scaled pass, no copy."""
+    cv2.transform(frame, _tint_matrix(color, alpha), dst=frame)
+    return frame
+
+def draw_panel(frame, x1, y1, x2, y2, color, alpha, border_color=None, border_thickness=1):
+    """Translucent rectangle with an optional opaque border."""
+    tint_rect(frame, x1, y1, x2, y2, color, alpha)
+    if border_color is not None:
+        cv2.rectangle(frame, (x1, y1), (x2, y2), border_color, border_thickness)
+    return frame
+
+def draw_translucent_text(frame, text, org, font, scale, color, thickness=2, alpha=0.7, line_type=cv2.LINE_AA):
+    """putText with opacity `alpha`; only the text's bounding box is copied and blended."""
+    (tw, th), baseline = cv2.getTextSize(text, font, scale, thickness)
+    pad = thickness + 2
+    x, y = org
+    x1, y1, x2, y2 = _clip_rect(frame, x - pad, y - th - pad, x + tw + pad, y + baseline + pad)
+    if x1 >= x2 or y1 >= y2:
+        return frame
+    roi = frame[y1:y2, x1:x2]
+    patch = get_buffers().scratch("ui.text_patch", roi.shape)
+    patch[:] = roi
+    cv2.putText(patch, text, (x - x1, y - y1), font, scale, color, thickness, line_type)
+    cv2.addWeighted(patch, alpha, roi, 1 - alpha, 0, dst=roi)
+    return frame
+
 # back_button - de importat in alte screens
 # from src.ui.shared import draw_back_button
 def draw_back_button(frame, rect_norm, is_hovered, progress):
@@ -19,6 +86,7 @@ def draw_back_button(frame, rect_norm, is_hovered, progress):
     progress: float (0.0 - 1.0)
     """
     h, w, _ = frame.shape
+    vp = viewport(frame)
     bx, by, bw, bh = rect_norm
     
     # Calculare pixeli
@@ -30,16 +98,12 @@ def draw_back_button(frame, rect_norm, is_hovered, progress):
     bg_color = SHARED_PALETTE["BG_DARK"]
     
     # Fundal Transparent
-    roi = frame[y1:y2, x1:x2]
-    color_block = np.zeros_like(roi, dtype=np.uint8)
-    color_block[:] = bg_color
-    cv2.addWeighted(color_block, 0.4, roi, 0.6, 0, roi)
-    frame[y1:y2, x1:x2] = roi
+    tint_rect(frame, x1, y1, x2, y2, bg_color, 0.4)
 
     # Colturi Tech
     corner_len_w = int((x2 - x1) * 0.3)
     corner_len_h = int((y2 - y1) * 0.4)
-    thick = 3 if is_hovered else 2
+    thick = vp.thick(3 if is_hovered else 2)
 
     cv2.line(frame, (x1, y1), (x1 + corner_len_w, y1), corner_color, thick)
     cv2.line(frame, (x1, y1), (x1, y1 + corner_len_h), corner_color, thick)
@@ -49,12 +113,12 @@ def draw_back_button(frame, rect_norm, is_hovered, progress):
     # Progres
     if is_hovered and progress > 0:
         prog_w = int((x2 - x1) * progress)
-        cv2.rectangle(frame, (x1, y2 - 4), (x1 + prog_w, y2), SHARED_PALETTE["PINK"], -1)
+        cv2.rectangle(frame, (x1, y2 - vp.px(4)), (x1 + prog_w, y2), SHARED_PALETTE["PINK"], -1)
 
     # Text
     text = "<< INAPOI"
-    font_scale = 0.7
-    ts = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)[0]
+    font_scale = vp.font(0.7)
+    ts = text_size(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, vp.thick(2))[0]
     tx = x1 + (x2 - x1 - ts[0]) // 2
     ty = y1 + (y2 - y1 + ts[1]) // 2
-    cv2.putText(frame, text, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, SHARED_PALETTE["TEXT"], 2)
\ No newline at end of file
+    put_text(frame, text, (tx, ty), cv2.FONT_HERSHEY_SIMPLEX, font_scale, SHARED_PALETTE["TEXT"], vp.thick(2))
\ No newline at end of file
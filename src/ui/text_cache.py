@@ -0,0 +1,201 @@
+# src/ui/text_cache.py
+# Text randat o data (masca + metrici), apoi doar compus cu culoarea lui la blit.
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from src import config
+from src.core.buffers import get_buffers
+
+
+class TextCache:
+    """
+    Pre-rendered text masks keyed by (text, font, scale, thickness, color,
+    line type, shadow). A miss draws the glyphs once into single-channel
+    uint8 masks (one per color, cropped to the inked pixels); a hit tints
+    them at blit time through a per-color lookup table, one blend for the
+    text and its shadow instead of the Hershey strokes twice.
+    Bounded LRU by bytes (config.TEXT_CACHE_MB); only used from the draw
+    (main) thread.
+    """
+
+    def __init__(self, max_bytes=None, max_sizes=None):
+        self.max_bytes = max_bytes if max_bytes is not None else int(config.TEXT_CACHE_MB * 1024 * 1024)
+        self.max_sizes = max_sizes if max_sizes is not None else config.TEXT_SIZE_ENTRIES
+        self._entries = OrderedDict()  # key -> (offset_x, offset_y, inv, layers, nbytes) or None
+        self._sizes = OrderedDict()    # (text, font, scale, thickness) -> getTextSize result
+        self._luts = {}                # channel value -> LUT: i -> round(i * value / 255)
+        self.bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "size_hits": 0, "size_misses": 0}
+
+    def text_size(self, text, font, scale, thickness=1):
+        """Memoized cv2.getTextSize: ((w, h), baseline)."""
+        key = (text, font, scale, thickness)
+        size = self._sizes.get(key)
+        if size is not None:
+            self.stats["size_hits"] += 1
+            return size
+        self.stats["size_misses"] += 1
+        size = cv2.getTextSize(text, font, scale, thickness)
+        self._sizes[key] = size
+        if len(self._sizes) > self.max_sizes:
+            self._sizes.popitem(last=False)
+        return size
+
+    def put_text(self, frame, text, org, font, scale, color, thickness=1, line_type=cv2.LINE_8, shadow=None):
+        """
+        Drop-in for cv2.putText (org = baseline-left corner).
+        shadow: (dx, dy, color) or (dx, dy, color, thickness), drawn under the
+        text - (2, 2, black) for drop shadows, (0, 0, black, t + 3) for outlines.
+        """
+        if not text:
+            return frame
+        key = (text, font, scale, thickness, tuple(color), line_type, shadow)
+        if key in self._entries:
+            entry = self._entries[key]
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            entry = self._render(text, font, scale, color, thickness, line_type, shadow)
+            self._entries[key] = entry
+            self.bytes += entry[4] if entry is not None else 0
+            while self.bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted[4] if evicted is not None else 0
+                self.stats["evictions"] += 1
+
+        if entry is not None:
+            self._blit(frame, entry, org[0] + entry[0], org[1] + entry[1])
+        return frame
+
+    def _render(self, text, font, scale, color, thickness, line_type, shadow):
+        layers = []
+        if shadow is not None:
+            dx, dy, s_color = shadow[:3]
+            layers.append((dx, dy, s_color, shadow[3] if len(shadow) > 3 else thickness))
+        layers.append((0, 0, color, thickness))
+
+        # Canvas large enough for every layer (stroke width + AA margin around the metrics)
+        (tw, th), baseline = self.text_size(text, font, scale, thickness)
+        pad = max(layer[3] for layer in layers) + 2
+        min_dx, max_dx = min(l[0] for l in layers), max(l[0] for l in layers)
+        min_dy, max_dy = min(l[1] for l in layers), max(l[1] for l in layers)
+        ox, oy = pad - min_dx, pad + th - min_dy
+        canvas_w = tw + 2 * pad + max_dx - min_dx
+        canvas_h = th + baseline + 2 * pad + max_dy - min_dy
+
+        # Back-to-front "over" compositing: the share of every layer in the
+        # final pixel (weight) and what is left of the background (remain)
+        weights = []
+        remain = np.ones((canvas_h, canvas_w), dtype=np.float32)
+        mask = np.zeros((canvas_h, canvas_w), dtype=np.uint8)
+        for dx, dy, l_color, l_thickness in layers:
+            mask[:] = 0
+            cv2.putText(mask, text, (ox + dx, oy + dy), font, scale, 255, l_thickness, line_type)
+            a = mask.astype(np.float32) / 255.0
+            weights = [(w * (1.0 - a), c) for w, c in weights]
+            weights.append((a, tuple(int(v) for v in l_color[:3])))
+            remain *= 1.0 - a
+
+        # Keep only the inked pixels (smaller blit)
+        ys, xs = np.nonzero(remain < 1.0)
+        if len(xs) == 0:
+            return None
+        x1, x2, y1, y2 = xs.min(), xs.max() + 1, ys.min(), ys.max() + 1
+
+        def to_mask(m):
+            return np.round(m[y1:y2, x1:x2] * 255.0).astype(np.uint8)
+
+        # One color: its mask is the whole coverage. Otherwise (shadows, black
+        # text): remaining background + one mask per non-black color (black
+        # adds nothing to the blend)
+        single = len(weights) == 1 and any(weights[0][1])
+        inv = None if single else to_mask(remain)
+        masks = tuple((to_mask(w), c) for w, c in weights if any(c))
+        nbytes = sum(m.nbytes for m, _ in masks) + (inv.nbytes if inv is not None else 0)
+        return int(x1) - ox, int(y1) - oy, inv, masks, nbytes
+
+    def _lut(self, value):
+        lut = self._luts.get(value)
+        if lut is None:
+            lut = self._luts[value] = np.round(np.arange(256, dtype=np.float32) * (value / 255.0)).astype(np.uint8)
+        return lut
+
+    def _tint(self, mask, color, tint):
+        """mask * color / 255 as a BGR image (white: the mask itself, gray: one LUT)."""
+        b, g, r = color
+        if b == g == r:
+            if b != 255:
+                mask = cv2.LUT(mask, self._lut(b))
+            return cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR, dst=tint)
+        return cv2.merge([cv2.LUT(mask, self._lut(v)) for v in color], dst=tint)
+
+    def _blit(self, frame, entry, x, y):
+        """dst = dst * inv / 255 + sum(mask * color / 255), clipped to the frame."""
+        _, _, inv, masks, _ = entry
+        h, w = (inv if inv is not None else masks[0][0]).shape
+        frame_h, frame_w = frame.shape[:2]
+        x1, y1 = max(0, x), max(0, y)
+        x2, y2 = min(frame_w, x + w), min(frame_h, y + h)
+        if x1 >= x2 or y1 >= y2:
+            return
+        crop = (slice(y1 - y, y2 - y), slice(x1 - x, x2 - x))
+        roi = frame[y1:y2, x1:x2]
+        sh, sw = y2 - y1, x2 - x1
+
+        # Two 3-channel scratch images (contiguous views of one pool buffer)
+        n = sh * sw * 3
+        scratch = get_buffers().scratch("text.blend", (2 * n,))
+        spread, tint = scratch[:n].reshape(sh, sw, 3), scratch[n:].reshape(sh, sw, 3)
+
+        if inv is None:
+            # One color: 255 - mask scales the background, then the mask is the ink
+            mask, color = masks[0]
+            cv2.cvtColor(mask[crop], cv2.COLOR_GRAY2BGR, dst=spread)
+            cv2.bitwise_not(spread, dst=spread)
+            cv2.multiply(roi, spread, dst=roi, scale=1.0 / 255)
+            if color == (255, 255, 255):
+                cv2.add(roi, cv2.bitwise_not(spread, dst=spread), dst=roi)
+            else:
+                cv2.add(roi, self._tint(mask[crop], color, tint), dst=roi)
+            return
+
+        cv2.cvtColor(inv[crop], cv2.COLOR_GRAY2BGR, dst=spread)
+        cv2.multiply(roi, spread, dst=roi, scale=1.0 / 255)
+        for mask, color in masks:
+            cv2.add(roi, self._tint(mask[crop], color, tint), dst=roi)
+
+    def clear(self):
+        self._entries.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    def get_stats(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return dict(
+            self.stats,
+            hit_rate=self.stats["hits"] / lookups if lookups else 0.0,
+            entries=len(self._entries),
+            kb=self.bytes / 1024.0
+        )
+
+
+# Cache-ul comun tuturor ecranelor
+_text_cache = None
+
+
+def get_text_cache():
+    global _text_cache
+    if _text_cache is None:
+        _text_cache = TextCache()
+    return _text_cache
+
+
+def put_text(frame, text, org, font, scale, color, thickness=1, line_type=cv2.LINE_8, shadow=None):
+    return get_text_cache().put_text(frame, text, org, font, scale, color, thickness, line_type, shadow)
+
+
+def text_size(text, font, scale, thickness=1):
+    return get_text_cache().text_size(text, font, scale, thickness)
@@ -0,0 +1,168 @@
+# src/ui/text_layout.py
+# Impartirea textului pe randuri + alegerea scalei, calculate o data si memorate.
+from bisect import bisect_right
+from collections import OrderedDict
+
+from src import config
+from src.ui.text_cache import text_size
+
+
+class TextLayout:
+    """Result of fit_text: the lines, their widths and the metrics needed to draw them."""
+    __slots__ = ("lines", "widths", "scale", "line_height", "h_line", "baseline")
+
+    def __init__(self, lines, widths, scale, line_height, h_line, baseline):
+        self.lines = lines
+        self.widths = widths
+        self.scale = scale
+        self.line_height = line_height
+        self.h_line = h_line
+        self.baseline = baseline
+
+
+class TextLayoutEngine:
+    """
+    Line breaking and font-scale fitting for the Hershey fonts, memoized per
+    (text, box, font). Same greedy breaks as the old word-by-word loops,
+    but line ends are found with a binary search over cumulative word widths
+    (checked exactly with getTextSize only at the break), and the largest
+    fitting scale with a binary search over the candidate scales.
+    """
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries if max_entries is not None else config.TEXT_LAYOUT_ENTRIES
+        self._cache = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _memo(self, key, build):
+        value = self._cache.get(key)
+        if value is not None:
+            self._cache.move_to_end(key)
+            self.stats["hits"] += 1
+            return value
+        self.stats["misses"] += 1
+        value = build()
+        self._cache[key] = value
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return value
+
+    # --- WRAP ---
+    def wrap(self, text, font, scale, thickness, max_width):
+        """Lines of `text` no wider than max_width (a word wider than that gets its own line)."""
+        key = ("wrap", text, font, scale, thickness, max_width)
+        return self._memo(key, lambda: self._wrap(text, font, scale, thickness, max_width)[0])
+
+    def wrap_paragraphs(self, text, font, scale, thickness, max_width):
+        """wrap() for every '\\n' paragraph, flattened (a whole INFO page in one lookup)."""
+        key = ("page", text, font, scale, thickness, max_width)
+        return self._memo(key, lambda: tuple(
+            line for raw in text.split('\n')
+            for line in self.wrap(raw.strip(), font, scale, thickness, max_width)
+        ))
+
+    def _wrap(self, text, font, scale, thickness, max_width):
+        """(lines, widths, fits): fits is False when a single word is wider than max_width."""
+        words = text.split(' ')
+        if not text:
+            return (), (), True
+
+        def width(s):
+            return text_size(s, font, scale, thickness)[0][0]
+
+        # getTextSize(s) = advance(s) * scale + k, so joining words with a
+        # space adds `gap` = width(" ") - 2k per word (k from "x" vs "xx")
+        k = 2 * width("x") - width("xx")
+        gap = width(" ") - 2 * k
+        word_w = [width(wd) - k for wd in words]  # advance of each word
+        prefix = [0]
+        for ww in word_w:
+            prefix.append(prefix[-1] + ww + gap)
+        # estimate of width(words[i:j]) = prefix[j] - prefix[i] - gap + k
+
+        lines, widths, fits = [], [], True
+        i, n = 0, len(words)
+        while i < n:
+            # Runs of spaces at the start of a line are dropped (like the old loops)
+            if not words[i]:
+                i += 1
+                continue
+            j = bisect_right(prefix, prefix[i] + max_width + gap - k) - 1
+            j = min(max(j, i + 1), n)
+            # Exact check at the break (rounding makes the estimate off by a pixel or two)
+            line_w = width(" ".join(words[i:j]))
+            while j > i + 1 and line_w > max_width:
+                j -= 1
+                line_w = width(" ".join(words[i:j]))
+            while j < n:
+                next_w = width(" ".join(words[i:j + 1]))
+                if next_w > max_width: break
+                j, line_w = j + 1, next_w
+            if line_w > max_width:
+                fits = False
+            lines.append(" ".join(words[i:j]))
+            widths.append(line_w)
+            i = j
+        return tuple(lines), tuple(widths), fits
+
+    # --- FIT ---
+    def fit(self, text, font, thickness, max_w, max_h, max_scale=1.5, min_scale=0.5, step=0.1, line_gap=10):
+        """Largest scale in max_scale..min_scale (by `step`) at which the wrapped text fits the box."""
+        key = ("fit", text, font, thickness, max_w, max_h, max_scale, min_scale, step, line_gap)
+        return self._memo(key, lambda: self._fit(text, font, thickness, max_w, max_h,
+                                                 max_scale, min_scale, step, line_gap))
+
+    def _layout_at(self, text, font, thickness, max_w, scale, line_gap):
+        (_, h_line), baseline = text_size("Tg", font, scale, thickness)
+        lines, widths, fits = self._wrap(text, font, scale, thickness, max_w)
+        return TextLayout(lines, widths, scale, h_line + baseline + line_gap, h_line, baseline), fits
+
+    def _fit(self, text, font, thickness, max_w, max_h, max_scale, min_scale, step, line_gap):
+        count = int(round((max_scale - min_scale) / step)) + 1
+        scales = [round(max_scale - i * step, 3) for i in range(count)]  # descending
+
+        # First (largest) scale that fits; smaller scales never fit worse
+        best = None
+        lo, hi = 0, len(scales) - 1
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            layout, fits = self._layout_at(text, font, thickness, max_w, scales[mid], line_gap)
+            if fits and layout.lines and len(layout.lines) * layout.line_height <= max_h:
+                best, hi = layout, mid - 1
+            else:
+                lo = mid + 1
+        if best is not None:
+            return best
+
+        # Nothing fits: one line at the smallest scale (as before)
+        (w, _), _ = text_size(text, font, min_scale, thickness)
+        layout, _ = self._layout_at("", font, thickness, max_w, min_scale, line_gap)
+        layout.lines, layout.widths = (text,), (w,)
+        return layout
+
+    def get_stats(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return dict(self.stats, hit_rate=self.stats["hits"] / lookups if lookups else 0.0, entries=len(self._cache))
+
+
+# Motorul comun tuturor ecranelor
+_engine = None
+
+
+def get_layout_engine():
+    global _engine
+    if _engine is None:
+        _engine = TextLayoutEngine()
+    return _engine
+
+
+def wrap_text(text, font, font_scale, thickness, max_width):
+    return list(get_layout_engine().wrap(text, font, font_scale, thickness, max_width))
+
+
+def wrap_paragraphs(text, font, font_scale, thickness, max_width):
+    return get_layout_engine().wrap_paragraphs(text, font, font_scale, thickness, max_width)
+
+
+def fit_text(text, font, thickness, max_w, max_h, max_scale=1.5, min_scale=0.5, step=0.1, line_gap=10):
+    return get_layout_engine().fit(text, font, thickness, max_w, max_h, max_scale, min_scale, step, line_gap)
@@ -0,0 +1,57 @@
+# src/ui/viewport.py
+# Sistemul de coordonate comun: ecranele sunt gandite la DESIGN_SIZE (1920x1080)
+# si desenate la orice rezolutie interna de randare (720p pe kiosk-uri slabe, 4K nativ).
+from src import config
+
+DESIGN_W, DESIGN_H = config.DESIGN_SIZE
+
+
+class Viewport:
+    """
+    Maps design-space values (pixels of a 1920x1080 layout) to the frame
+    being drawn. Screens keep their numbers and wrap them:
+      vp.px(40)        - length (uniform scale, keeps circles round)
+      vp.pt(x, y)      - design-space point
+      vp.x(x), vp.y(y) - single coordinates
+      vp.font(0.8)     - Hershey font scale
+      vp.thick(2)      - line thickness (at least 1)
+    At the design resolution every mapping is the identity.
+    """
+    __slots__ = ("w", "h", "sx", "sy", "s")
+
+    def __init__(self, w, h):
+        self.w, self.h = w, h
+        self.sx = w / DESIGN_W
+        self.sy = h / DESIGN_H
+        self.s = min(self.sx, self.sy)
+
+    def px(self, v):
+        return int(round(v * self.s))
+
+    def x(self, v):
+        return int(round(v * self.sx))
+
+    def y(self, v):
+        return int(round(v * self.sy))
+
+    def pt(self, x, y):
+        return int(round(x * self.sx)), int(round(y * self.sy))
+
+    def font(self, scale):
+        # Rounded: the value is part of the text / layout cache keys
+        return round(scale * self.s, 3)
+
+    def thick(self, t):
+        return max(1, int(round(t * self.s)))
+
+
+_viewports = {}
+
+
+def viewport(frame):
+    """Viewport for a frame (one instance per resolution)."""
+    h, w = frame.shape[:2]
+    vp = _viewports.get((w, h))
+    if vp is None:
+        vp = _viewports[(w, h)] = Viewport(w, h)
+    return vp
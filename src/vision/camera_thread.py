@@ -0,0 +1,116 @@
+# src/vision/camera_thread.py
+import cv2
+import time
+import threading
+from src.core import clock
+
+
+class CameraThread:
+    """
+    Background capture stage.
+    Reads frames from the camera as fast as the driver delivers them and keeps
+    ONLY the newest one (latest-frame handoff). Frames that were never picked
+    up by the consumer are dropped instead of queued, so the UI never works
+    on a stale image.
+    """
+
+    def __init__(self, source=0, perf=None):
+        self.source = source
+        self.perf = perf
+        # Camera index / video path, or any object with read() (see frame_source.py)
+        self.cap = source if hasattr(source, "read") else cv2.VideoCapture(source)
+
+        # Keep the driver buffer as small as possible (not every backend supports it)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # Latest frame slot
+        self._lock = threading.Condition()
+        self._frame = None
+        self._timestamp = 0.0
+        self._seq = 0
+        self._consumed_seq = 0
+
+        # Stats
+        self.frames_captured = 0
+        self.frames_dropped = 0
+
+        self.running = False
+        self.failed = False
+        self._thread = None
+
+    def start(self):
+        if self.running:
+            return self
+        self.running = True
+        self._thread = threading.Thread(target=self._capture_loop, name="CameraThread")
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def _capture_loop(self):
+        while self.running:
+            t0 = time.perf_counter()
+            success, frame = self.cap.read()
+            if self.perf is not None:
+                self.perf.record("capture", (time.perf_counter() - t0) * 1000.0)
+            if not success:
+                # Camera disconnected / end of stream
+                with self._lock:
+                    self.failed = True
+                    self.running = False
+                    self._lock.notify_all()
+                break
+
+            timestamp = clock.now()
+            with self._lock:
+                # The previous frame was never read -> it is dropped
+                if self._seq > self._consumed_seq:
+                    self.frames_dropped += 1
+                self._frame = frame
+                self._timestamp = timestamp
+                self._seq += 1
+                self.frames_captured += 1
+                self._lock.notify_all()
+
+    def read(self, last_seq=None, timeout=1.0):
+        """
+        Returns (success, frame, timestamp, seq) for the newest frame.
+        If last_seq is given, waits until a frame newer than last_seq is available;
+        on timeout (camera stalled) it fails instead of returning the old frame again.
+        """
+        with self._lock:
+            if last_seq is not None:
+                ready = self._lock.wait_for(lambda: self._seq > last_seq or self.failed, timeout)
+                if not ready or self._seq <= last_seq:
+                    return False, None, 0.0, self._seq
+            elif self._frame is None:
+                self._lock.wait_for(lambda: self._frame is not None or self.failed, timeout)
+
+            if self._frame is None or (self.failed and self._seq == self._consumed_seq):
+                return False, None, 0.0, self._seq
+
+            self._consumed_seq = self._seq
+            return True, self._frame, self._timestamp, self._seq
+
+    def peek(self):
+        """
+        Returns (success, frame, timestamp, seq) for the newest frame without
+        marking it as consumed (used by the render loop for the background).
+        """
+        with self._lock:
+            if self._frame is None:
+                return False, None, 0.0, self._seq
+            return True, self._frame, self._timestamp, self._seq
+
+    def get_stats(self):
+        return {
+            "captured": self.frames_captured,
+            "dropped": self.frames_dropped,
+            "last_seq": self._seq
+        }
+
+    def release(self):
+        self.running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.cap.release()
@@ -0,0 +1,180 @@
+# src/vision/face_detector.py
+import cv2
+import threading
+
+
+def _create_tracker():
+    """Cheap bbox tracker from opencv-contrib (None if the build has none)."""
+    factories = [
+        getattr(getattr(cv2, "legacy", None), "TrackerMOSSE_create", None),
+        getattr(cv2, "TrackerMOSSE_create", None),
+        getattr(getattr(cv2, "legacy", None), "TrackerKCF_create", None),
+        getattr(cv2, "TrackerKCF_create", None),
+    ]
+    for factory in factories:
+        if factory is not None:
+            try:
+                return factory()
+            except Exception:
+                continue
+    return None
+
+
+class FaceDetector:
+    """
+    Shared face detection service.
+    Results are memoized per frame sequence number, so any number of callers
+    (vision worker, screensaver, idle timer) share ONE inference per frame.
+
+    Cadence modes:
+      "always"  - MediaPipe on every frame
+      "every_n" - MediaPipe every `stride` frames
+      "no_hand" - MediaPipe only while no hand is visible
+    Between full detections the face box is carried forward by an OpenCV
+    tracker; when the tracker loses the face a full detection runs instead.
+    """
+
+    MODES = ("always", "every_n", "no_hand")
+
+    def __init__(self, min_detection_confidence=0.5, min_face_height=0.10, mode="always", stride=1):
+        import mediapipe as mp  # heavy: imported on the startup thread
+        self.mp_face_detection = mp.solutions.face_detection
+        self.face_detection = self.mp_face_detection.FaceDetection(
+            min_detection_confidence=min_detection_confidence
+        )
+
+        # Minimum face height (fraction of the frame) to count as "present"
+        self.min_face_height = min_face_height
+
+        # Cadence
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown face detection mode: {mode}")
+        self.mode = mode
+        self.stride = max(1, int(stride))
+        self._tracker = None
+        self._last_result = None
+        self._frames_since_detection = 0
+
+        # MediaPipe graphs are not thread safe -> one inference at a time
+        self._lock = threading.Lock()
+        self._cached_seq = None
+        self._cached_result = None
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.full_detections = 0
+        self.tracked_frames = 0
+        self.tracker_losses = 0
+
+    def detect(self, frame_rgb, seq=None, hand_visible=False):
+        """
+        Returns {"seq", "face_present", "bbox", "source"} for an RGB frame.
+        bbox is normalized (x, y, w, h) of the biggest face, or None.
+        source is "detector", "tracker" or "carried".
+        seq=None disables the cache (one-off calls).
+        """
+        with self._lock:
+            if seq is not None and seq == self._cached_seq:
+                self.hits += 1
+                return self._cached_result
+
+            self.misses += 1
+            if self._should_run_full(hand_visible):
+                result = self._full_detection(frame_rgb, seq)
+            else:
+                result = self._track(frame_rgb, seq)
+
+            if seq is not None:
+                self._cached_seq = seq
+                self._cached_result = result
+            return result
+
+    def is_face_present(self, frame_rgb, seq=None, hand_visible=False):
+        return self.detect(frame_rgb, seq, hand_visible)["face_present"]
+
+    def _should_run_full(self, hand_visible):
+        if self._last_result is None or self.mode == "always":
+            return True
+        if self.mode == "no_hand":
+            return not hand_visible
+        return self._frames_since_detection >= self.stride
+
+    def _full_detection(self, frame_rgb, seq):
+        result = self._run_inference(frame_rgb, seq)
+        self.full_detections += 1
+        self._frames_since_detection = 0
+        self._last_result = result
+
+        # (Re)start the tracker on the detected face
+        self._tracker = None
+        if self.mode != "always" and result["bbox"] is not None:
+            h, w = frame_rgb.shape[:2]
+            bx, by, bw, bh = result["bbox"]
+            x1, y1 = max(0, int(bx * w)), max(0, int(by * h))
+            box = (x1, y1, min(int(bw * w), w - x1), min(int(bh * h), h - y1))
+            if box[2] > 0 and box[3] > 0:
+                tracker = _create_tracker()
+                if tracker is not None:
+                    try:
+                        tracker.init(frame_rgb, box)
+                        self._tracker = tracker
+                    except Exception:
+                        self._tracker = None
+        return result
+
+    def _track(self, frame_rgb, seq):
+        self._frames_since_detection += 1
+
+        # No face last time (or no tracker available) -> carry the last result
+        if self._tracker is None:
+            result = dict(self._last_result)
+            result["seq"] = seq
+            result["source"] = "carried"
+            return result
+
+        ok, box = self._tracker.update(frame_rgb)
+        if not ok:
+            # Tracker lost confidence -> full detection
+            self.tracker_losses += 1
+            return self._full_detection(frame_rgb, seq)
+
+        self.tracked_frames += 1
+        h, w = frame_rgb.shape[:2]
+        bx, by, bw, bh = box
+        bbox = (bx / w, by / h, bw / w, bh / h)
+        return {
+            "seq": seq,
+            "face_present": bbox[3] > self.min_face_height,
+            "bbox": bbox,
+            "source": "tracker"
+        }
+
+    def _run_inference(self, frame_rgb, seq):
+        results = self.face_detection.process(frame_rgb)
+
+        best_bbox = None
+        if results.detections:
+            for detection in results.detections:
+                # Relative bbox -> independent of the buffer resolution
+                bboxC = detection.location_data.relative_bounding_box
+                if best_bbox is None or bboxC.height > best_bbox[3]:
+                    best_bbox = (bboxC.xmin, bboxC.ymin, bboxC.width, bboxC.height)
+
+        return {
+            "seq": seq,
+            "face_present": best_bbox is not None and best_bbox[3] > self.min_face_height,
+            "bbox": best_bbox,
+            "source": "detector"
+        }
+
+    def get_stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "full_detections": self.full_detections,
+            "tracked_frames": self.tracked_frames,
+            "tracker_losses": self.tracker_losses
+        }
@@ -0,0 +1,58 @@
+# src/vision/frame_source.py
+import cv2
+import glob
+import os
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class ImageSequenceSource:
+    """
+    cv2.VideoCapture look-alike over a folder / glob of images
+    (read() -> (success, frame)), used to replay recorded input headless.
+    """
+
+    def __init__(self, path, loop=False):
+        if os.path.isdir(path):
+            files = [os.path.join(path, f) for f in os.listdir(path)]
+            files = [f for f in files if f.lower().endswith(IMAGE_EXTENSIONS)]
+        else:
+            files = glob.glob(path)
+        self.files = sorted(files)
+        self.loop = loop
+        self.index = 0
+
+        if not self.files:
+            print(f"ImageSequenceSource WARNING: no images found at {path}")
+
+    def isOpened(self):
+        return bool(self.files)
+
+    def read(self):
+        if self.index >= len(self.files):
+            if not self.loop or not self.files:
+                return False, None
+            self.index = 0
+        frame = cv2.imread(self.files[self.index])
+        self.index += 1
+        return frame is not None, frame
+
+    def set(self, prop, value):
+        return False
+
+    def release(self):
+        self.files = []
+
+
+def open_source(source):
+    """
+    Opens a frame source:
+      int / "0"        -> webcam
+      folder or glob   -> ImageSequenceSource
+      anything else    -> video file (cv2.VideoCapture)
+    """
+    if isinstance(source, int) or (isinstance(source, str) and source.isdigit()):
+        return cv2.VideoCapture(int(source))
+    if os.path.isdir(source) or any(ch in source for ch in "*?["):
+        return ImageSequenceSource(source)
+    return cv2.VideoCapture(source)
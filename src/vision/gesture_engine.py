@@ -1,21 +1,18 @@
 # src/vision/gesture_engine.py
 import cv2
-import mediapipe as mp
 import math
 import time
 import numpy as np
 
 class GestureEngine:
     def __init__(self):
-        # MediaPipe initializations
+        # MediaPipe initializations (import here: the kiosk builds the engine
+        # on the startup thread while the splash is on screen)
+        import mediapipe as mp
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            model_complexity=0,       # <--- CRITICAL OPTIMIZATION (0=Lite, 1=Full)
-            min_detection_confidence=0.5, # Lowered slightly for speed
-            min_tracking_confidence=0.5
-        )
+        self.model_complexity = 0     # <--- CRITICAL OPTIMIZATION (0=Lite, 1=Full)
+        self._pending_complexity = None
+        self.hands = self._create_hands(self.model_complexity)
         self.mp_draw = mp.solutions.drawing_utils
         
         # State variables
@@ -32,12 +29,42 @@ class GestureEngine:
         # --- OPTIMIZARE 2: Parametri Swipe ---
         self.SWIPE_FRAMES = 7      # Analizam doar ultimele 7 cadre (mai rapid)
         self.SWIPE_DIST_THRESH = 0.12 # Trebuie sa misti doar 12% din ecran (mai usor)
+
+        # Pinch distance in pixels, tuned on a 640px wide camera frame.
+        # Scaled with the width of the buffer actually processed.
+        self.PINCH_DIST_THRESH = 40
+        self.PINCH_REF_WIDTH = 640
         
+    def _create_hands(self, model_complexity):
+        return self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=1,
+            model_complexity=model_complexity,
+            min_detection_confidence=0.5, # Lowered slightly for speed
+            min_tracking_confidence=0.5
+        )
+
+    def request_model_complexity(self, model_complexity):
+        """
+        Asks for a different Hands model. The graph is rebuilt on the thread
+        that runs inference, right before the next frame (thread safe).
+        """
+        if model_complexity != self.model_complexity:
+            self._pending_complexity = model_complexity
+
     def process_frame(self, frame):
-        # ... (Rest of the code remains exactly the same) ...
-        # Just copy the process_frame, _detect_swipe, and draw_debug_ui methods 
-        # from your original file here.
+        """Entry point for BGR frames (converts once, then process_rgb)."""
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return self.process_rgb(frame_rgb)
+
+    def process_rgb(self, frame_rgb):
+        """Runs hand tracking on an already mirrored RGB buffer (shared with face detection)."""
+        if self._pending_complexity is not None:
+            self.hands.close()
+            self.model_complexity = self._pending_complexity
+            self._pending_complexity = None
+            self.hands = self._create_hands(self.model_complexity)
+
         results = self.hands.process(frame_rgb)
         
         data = {
@@ -52,7 +79,7 @@ class GestureEngine:
                 data["cursor_detected"] = True
                 data["landmarks"] = hand_landmarks
                 
-                h, w, c = frame.shape
+                h, w, c = frame_rgb.shape
                 index_tip = hand_landmarks.landmark[8]
                 
                 # 2. SMOOTHING LOGIC
@@ -75,7 +102,7 @@ class GestureEngine:
                     (index_tip.y - thumb_tip.y) * h
                 )
                 
-                if distance < 40:
+                if distance < self.PINCH_DIST_THRESH * (w / self.PINCH_REF_WIDTH):
                     data["gesture"] = "CLICK"
                 
                 self._detect_swipe(smooth_x, data)
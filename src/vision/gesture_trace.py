@@ -0,0 +1,66 @@
+# src/vision/gesture_trace.py
+import json
+
+
+class GestureTraceRecorder:
+    """
+    Records GestureEngine output to a compact JSON-lines trace:
+      header: {"version": 1, "landmarks": bool}
+      events: {"t": sec since start, "x", "y", "g": gesture, "c": 0/1 [, "lm": [[x, y, z], ...]]}
+    """
+
+    VERSION = 1
+
+    def __init__(self, path, include_landmarks=False):
+        self.path = path
+        self.include_landmarks = include_landmarks
+        self._file = open(path, "w")
+        self._file.write(json.dumps({"version": self.VERSION, "landmarks": include_landmarks}) + "\n")
+        self._t0 = None
+        self.count = 0
+
+    def record(self, timestamp, gesture_data):
+        if self._t0 is None:
+            self._t0 = timestamp
+
+        event = {
+            "t": round(timestamp - self._t0, 4),
+            "x": round(gesture_data["x"], 4),
+            "y": round(gesture_data["y"], 4),
+            "g": gesture_data["gesture"],
+            "c": 1 if gesture_data["cursor_detected"] else 0
+        }
+        if self.include_landmarks and gesture_data["landmarks"] is not None:
+            landmarks = gesture_data["landmarks"]
+            # MediaPipe NormalizedLandmarkList or an already replayed list
+            points = getattr(landmarks, "landmark", landmarks)
+            event["lm"] = [[round(p.x, 4), round(p.y, 4), round(p.z, 4)] if hasattr(p, "x") else p for p in points]
+
+        self._file.write(json.dumps(event, separators=(",", ":")) + "\n")
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            print(f"GestureTrace: {self.count} events saved to {self.path}")
+
+
+def load_trace(path):
+    """Returns (header, events) where every event is (t, gesture_data)."""
+    events = []
+    with open(path) as f:
+        header = json.loads(f.readline())
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            e = json.loads(line)
+            events.append((e["t"], {
+                "cursor_detected": bool(e["c"]),
+                "x": e["x"],
+                "y": e["y"],
+                "gesture": e["g"],
+                "landmarks": e.get("lm")
+            }))
+    return header, events
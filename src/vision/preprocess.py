@@ -0,0 +1,42 @@
+# src/vision/preprocess.py
+import cv2
+
+from src.core.buffers import get_buffers
+
+
+class FramePreprocessor:
+    """
+    Per-frame preprocessing stage for the vision models.
+    Produces ONE downscaled, mirrored RGB buffer that hands and face detection
+    both read, instead of each model converting the full-size frame itself.
+    """
+
+    def __init__(self, size):
+        self.size = size  # (w, h)
+        self.buffers = get_buffers()
+
+    def prepare(self, frame, seq, timestamp):
+        # Downscale first: flip + color conversion then run on the small image.
+        # Both buffers are reused: the models are done with `rgb` before the next prepare().
+        w, h = self.size
+        small = self.buffers.get("vision.small", (h, w, 3))
+        rgb = self.buffers.get("vision.rgb", (h, w, 3))
+        cv2.resize(frame, self.size, dst=small, interpolation=cv2.INTER_AREA)
+        cv2.flip(small, 1, dst=small)
+        cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb)
+
+        return {
+            "seq": seq,
+            "timestamp": timestamp,
+            "rgb": rgb,
+            "size": self.size
+        }
+
+    @staticmethod
+    def to_display(x_norm, y_norm, display_w, display_h):
+        """
+        Maps normalized inference coordinates onto the display frame.
+        Both buffers are the same mirrored full-frame view (no crop / letterbox),
+        so only the scale changes.
+        """
+        return int(x_norm * display_w), int(y_norm * display_h)
@@ -0,0 +1,115 @@
+# src/vision/scheduler.py
+import threading
+
+
+class ModelScheduler:
+    """
+    Decides which vision models run on each inference frame.
+
+    Every screen declares its needs as VISION_NEEDS = {"hands": N, "face": M}:
+    the model runs every N-th inference frame, 0 = not needed on this screen.
+    On top of that the scheduler holds a per-frame CPU budget: if all due
+    models would not fit, the least needed one is deferred to the next frame
+    (never more than MAX_DEFER frames in a row).
+    """
+
+    MODELS = ("hands", "face")
+    DEFAULT_NEEDS = {"hands": 1, "face": 1}
+    MAX_DEFER = 3
+
+    def __init__(self, budget_ms=None):
+        self.budget_ms = budget_ms  # None = no budget
+        self.needs = dict(self.DEFAULT_NEEDS)
+        self.stride_multiplier = 1
+
+        self._lock = threading.Lock()
+        self._frames_since = {m: 0 for m in self.MODELS}
+        self._deferred = {m: 0 for m in self.MODELS}
+        self._cost_ms = {m: 0.0 for m in self.MODELS}  # EMA of inference time
+
+        # Stats
+        self.runs = {m: 0 for m in self.MODELS}
+        self.skips = {m: 0 for m in self.MODELS}
+        self.budget_deferrals = 0
+
+    @staticmethod
+    def needs_for(screen):
+        """Vision needs of a screen (dynamic get_vision_needs() wins over VISION_NEEDS)."""
+        getter = getattr(screen, "get_vision_needs", None)
+        if getter is not None:
+            return getter()
+        return getattr(screen, "VISION_NEEDS", ModelScheduler.DEFAULT_NEEDS)
+
+    def set_needs(self, needs):
+        if needs == self.needs:
+            return
+        with self._lock:
+            for model in self.MODELS:
+                # A model that just became needed runs on the next frame
+                if not self.needs.get(model) and needs.get(model):
+                    self._frames_since[model] = needs[model]
+            self.needs = dict(needs)
+
+    def set_stride_multiplier(self, multiplier):
+        """Global slow-down of every model (used by the quality governor)."""
+        self.stride_multiplier = max(1, int(multiplier))
+
+    def plan(self):
+        """Returns {"hands": bool, "face": bool} for the next inference frame."""
+        with self._lock:
+            due = []
+            for model in self.MODELS:
+                stride = self.needs.get(model, 0)
+                if not stride:
+                    continue
+                self._frames_since[model] += 1
+                if self._frames_since[model] >= stride * self.stride_multiplier:
+                    due.append(model)
+
+            # Most needed first (smaller stride), hands win ties
+            due.sort(key=lambda m: (self.needs[m], self.MODELS.index(m)))
+
+            if self.budget_ms is not None and len(due) > 1:
+                total = 0.0
+                kept = []
+                for model in due:
+                    cost = self._cost_ms[model]
+                    starved = self._deferred[model] >= self.MAX_DEFER
+                    if not kept or starved or total + cost <= self.budget_ms:
+                        kept.append(model)
+                        total += cost
+                    else:
+                        # Stays due -> runs on the next frame
+                        self._deferred[model] += 1
+                        self.budget_deferrals += 1
+                due = kept
+
+            plan = {}
+            for model in self.MODELS:
+                run = model in due
+                plan[model] = run
+                if run:
+                    self._frames_since[model] = 0
+                    self._deferred[model] = 0
+                    self.runs[model] += 1
+                else:
+                    self.skips[model] += 1
+            return plan
+
+    def record(self, model, elapsed_ms):
+        """Feeds back the measured inference time of a model."""
+        cost = self._cost_ms[model]
+        self._cost_ms[model] = elapsed_ms if cost == 0.0 else cost * 0.9 + elapsed_ms * 0.1
+
+    def cost_ms(self, model):
+        """Smoothed inference time of a model (0.0 until it has run)."""
+        return self._cost_ms[model]
+
+    def get_stats(self):
+        return {
+            "needs": dict(self.needs),
+            "runs": dict(self.runs),
+            "skips": dict(self.skips),
+            "cost_ms": dict(self._cost_ms),
+            "budget_deferrals": self.budget_deferrals
+        }
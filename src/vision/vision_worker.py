@@ -0,0 +1,161 @@
+# src/vision/vision_worker.py
+import time
+import threading
+from src import config
+from src.core import clock
+from src.vision.preprocess import FramePreprocessor
+
+EMPTY_GESTURE = {"cursor_detected": False, "x": 0, "y": 0, "gesture": None, "landmarks": None}
+EMPTY_FACE = {"seq": None, "face_present": False, "bbox": None, "source": None}
+
+
+class VisionWorker:
+    """
+    Inference stage running on its own thread.
+    Pulls the newest frame from the CameraThread, runs hands + face detection
+    and publishes the latest result (with frame id and timestamps).
+    The render loop only reads the newest completed result, so a slow
+    inference pass never blocks drawing.
+    """
+
+    # Gestures that are events (happen once) and must not be lost or repeated
+    # when the render loop runs faster / slower than inference.
+    EDGE_GESTURES = ("SWIPE_LEFT", "SWIPE_RIGHT")
+
+    def __init__(self, camera, engine, face_detector, scheduler=None, perf=None):
+        self.camera = camera
+        self.engine = engine
+        self.face_detector = face_detector
+        self.scheduler = scheduler
+        self.perf = perf
+
+        # Last real model outputs, carried forward on frames a model is skipped
+        self._last_gesture = EMPTY_GESTURE
+        self._last_face = EMPTY_FACE
+        self.preprocessor = FramePreprocessor(config.INFERENCE_SIZE)
+
+        self._lock = threading.Lock()
+        self._result = None
+        self._pending_gesture = None
+        self._last_read_id = -1
+
+        # Stats
+        self.results_published = 0
+        self.last_inference_time = 0.0
+
+        self.running = False
+        self._thread = None
+
+    def start(self):
+        if self.running:
+            return self
+        self.running = True
+        self._thread = threading.Thread(target=self._loop, name="VisionWorker")
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def _loop(self):
+        last_seq = 0
+        while self.running:
+            success, frame, frame_time, seq = self.camera.read(last_seq)
+            if not success:
+                if self.camera.failed:
+                    self.running = False
+                continue
+            last_seq = seq
+            self.process(frame, seq, frame_time)
+
+    def process(self, frame, seq, frame_time):
+        """Runs every model on one camera frame and publishes the result."""
+        start = time.perf_counter()
+
+        if self.scheduler is not None:
+            plan = self.scheduler.plan()
+            needs = self.scheduler.needs
+        else:
+            plan = {"hands": True, "face": True}
+            needs = {"hands": 1, "face": 1}
+
+        # One small mirrored RGB buffer for all models
+        prepared = self.preprocessor.prepare(frame, seq, frame_time)
+
+        if plan["hands"]:
+            t0 = time.perf_counter()
+            gesture_data = self.engine.process_rgb(prepared["rgb"])
+            self._record("hands", t0)
+            self._last_gesture = gesture_data
+        elif needs.get("hands"):
+            # Skipped this frame: keep the cursor, never repeat a gesture
+            gesture_data = dict(self._last_gesture)
+            gesture_data["gesture"] = None
+        else:
+            gesture_data = EMPTY_GESTURE
+
+        if plan["face"]:
+            t0 = time.perf_counter()
+            face = self.face_detector.detect(prepared["rgb"], seq, hand_visible=gesture_data["cursor_detected"])
+            self._record("face", t0)
+            self._last_face = face
+        elif needs.get("face"):
+            face = self._last_face
+        else:
+            face = EMPTY_FACE
+
+        done = time.perf_counter()
+        result = {
+            "frame_id": seq,
+            "capture_time": frame_time,
+            "done_time": clock.now(),
+            "gesture_data": gesture_data,
+            "face_present": face["face_present"],
+            "face_bbox": face["bbox"],
+            "models_run": plan
+        }
+
+        with self._lock:
+            if gesture_data["gesture"] in self.EDGE_GESTURES:
+                # The swipe with the cursor of ITS frame (the hand may be gone by the next read)
+                self._pending_gesture = gesture_data
+            self._result = result
+            self.results_published += 1
+            self.last_inference_time = done - start
+        return result
+
+    def _record(self, model, start):
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        if self.scheduler is not None:
+            self.scheduler.record(model, elapsed_ms)
+        if self.perf is not None:
+            self.perf.record(model, elapsed_ms)
+
+    def get_latest(self):
+        """
+        Returns the newest completed result (or None before the first one).
+        Edge gestures (swipes) are delivered exactly once, with the cursor
+        (x, y, cursor_detected) of the frame they were detected on; a result
+        that was already read is returned again without its swipe.
+        """
+        with self._lock:
+            if self._result is None:
+                return None
+
+            result = dict(self._result)
+            gesture_data = dict(result["gesture_data"])
+            result["is_new"] = result["frame_id"] != self._last_read_id
+            self._last_read_id = result["frame_id"]
+
+            if gesture_data["gesture"] in self.EDGE_GESTURES:
+                gesture_data["gesture"] = None
+            if self._pending_gesture is not None:
+                for key in ("gesture", "x", "y", "cursor_detected"):
+                    gesture_data[key] = self._pending_gesture[key]
+                self._pending_gesture = None
+
+            result["gesture_data"] = gesture_data
+            return result
+
+    def stop(self):
+        self.running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
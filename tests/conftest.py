@@ -0,0 +1,5 @@
+# Tests import the app as `src.*` (run from the repo root: python -m pytest)
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
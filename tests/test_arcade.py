@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from src import config
+from src.core import clock
+from src.ui.screens.arcade import ArcadeComponent
+
+
+@pytest.fixture
+def sim_clock():
+    manual = clock.ManualClock(start=1000.0)
+    previous = clock.get_clock()
+    clock.set_clock(manual)
+    yield manual
+    clock.set_clock(previous)
+
+
+@pytest.fixture
+def arcade(sim_clock):
+    game = ArcadeComponent()
+    game.update(0.5, 0.5)
+    return game
+
+
+def frame():
+    return np.zeros((360, 640, 3), dtype=np.uint8)
+
+
+def test_simulation_advances_every_rendered_frame(sim_clock, arcade):
+    # Vision at 15 Hz, display at 60 Hz: every draw moves the items
+    out = frame()
+    times = []
+    for i in range(60):
+        sim_clock.t += 1.0 / 60
+        if i % 4 == 0:
+            arcade.update(0.5, 0.5)
+        arcade.draw(out)
+        times.append(arcade.sim_time)
+    assert len(set(times)) == 60
+    assert times[-1] == pytest.approx(1.0, abs=1.5 / config.ARCADE_TICK_HZ)
+
+
+def test_hand_dropout_pauses_without_catch_up(sim_clock, arcade):
+    out = frame()
+    sim_clock.t += 0.1
+    arcade.draw(out)
+    paused_at = arcade.sim_time
+
+    arcade.update(None, None)
+    sim_clock.t += 2.0
+    arcade.draw(out)
+    assert arcade.sim_time == paused_at
+
+    arcade.update(0.5, 0.5)
+    sim_clock.t += 1.0 / config.ARCADE_TICK_HZ
+    arcade.draw(out)
+    assert arcade.sim_time == pytest.approx(paused_at + 1.0 / config.ARCADE_TICK_HZ)
+
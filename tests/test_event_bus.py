@@ -0,0 +1,123 @@
+import gc
+
+from src.core import event_bus
+from src.core.event_bus import EventBus, Event, GameFinished, GestureEvent, TransitionEvent
+
+
+class Listener:
+    def __init__(self):
+        self.seen = []
+
+    def on_event(self, event):
+        self.seen.append(event)
+
+
+def test_dispatch_delivers_by_type_and_wildcard():
+    bus = EventBus()
+    games, everything = Listener(), Listener()
+    bus.subscribe(GameFinished, games.on_event)
+    bus.subscribe(Event, everything.on_event)
+
+    finished = GameFinished("ARCADE", 7)
+    swipe = GestureEvent("SWIPE_LEFT", 0.2, 0.5)
+    bus.publish(finished)
+    bus.publish(swipe)
+
+    assert bus.dispatch() == 2
+    assert games.seen == [finished]
+    assert everything.seen == [finished, swipe]
+
+
+def test_nothing_runs_before_dispatch():
+    bus = EventBus()
+    listener = Listener()
+    bus.subscribe(TransitionEvent, listener.on_event)
+    bus.publish(TransitionEvent("MENU"))
+    assert listener.seen == []
+    assert bus.get_stats()["queued"] == 1
+
+
+def test_handler_of_collected_owner_is_dropped():
+    bus = EventBus()
+    listener = Listener()
+    bus.subscribe(TransitionEvent, listener.on_event)
+    assert bus.get_stats()["handlers"] == 1
+
+    del listener
+    gc.collect()
+    bus.publish(TransitionEvent("MENU"))
+    assert bus.dispatch() == 1  # no error, nobody called
+    assert bus.get_stats()["handlers"] == 0
+
+
+def test_plain_functions_are_held_strongly():
+    bus = EventBus()
+    seen = []
+    bus.subscribe(TransitionEvent, seen.append)
+    gc.collect()
+    bus.publish(TransitionEvent("INFO"))
+    bus.dispatch()
+    assert [e.target for e in seen] == ["INFO"]
+
+
+def test_unsubscribe():
+    bus = EventBus()
+    listener = Listener()
+    bus.subscribe(TransitionEvent, listener.on_event)
+    bus.unsubscribe(TransitionEvent, listener.on_event)
+    bus.publish(TransitionEvent("MENU"))
+    bus.dispatch()
+    assert listener.seen == []
+
+
+def test_events_published_during_dispatch_wait_for_next_call():
+    bus = EventBus()
+    order = []
+
+    def on_finished(event):
+        order.append(event.game)
+        bus.publish(TransitionEvent("JOCURI"))
+
+    bus.subscribe(GameFinished, on_finished)
+    bus.subscribe(TransitionEvent, lambda e: order.append(e.target))
+    bus.publish(GameFinished("QUIZ"))
+    bus.publish(GameFinished("MAZE"))
+
+    assert bus.dispatch() == 2
+    assert order == ["QUIZ", "MAZE"]  # the transitions are queued, not run re-entrantly
+    assert bus.dispatch() == 2
+    assert order == ["QUIZ", "MAZE", "JOCURI", "JOCURI"]
+
+
+def test_dispatch_max_events_keeps_the_rest_in_order():
+    bus = EventBus()
+    seen = []
+    bus.subscribe(TransitionEvent, lambda e: seen.append(e.target))
+    for target in ("MENU", "INFO", "JOCURI"):
+        bus.publish(TransitionEvent(target))
+    assert bus.dispatch(max_events=2) == 2
+    assert seen == ["MENU", "INFO"]
+    bus.dispatch()
+    assert seen == ["MENU", "INFO", "JOCURI"]
+
+
+def test_set_bus_isolates_module_level_publish():
+    previous = event_bus.get_bus()
+    private = EventBus()
+    seen_private, seen_previous = [], []
+    private.subscribe(TransitionEvent, seen_private.append)
+    previous.subscribe(TransitionEvent, seen_previous.append)
+    queued_before = previous.get_stats()["queued"]
+    try:
+        event_bus.set_bus(private)
+        event_bus.publish(TransitionEvent("MENU"))
+        assert event_bus.get_bus() is private
+        private.dispatch()
+    finally:
+        event_bus.set_bus(previous)
+
+    assert [e.target for e in seen_private] == ["MENU"]
+    assert previous.get_stats()["queued"] == queued_before
+    previous.dispatch()
+    assert seen_previous == []
+    previous.unsubscribe(TransitionEvent, seen_previous.append)
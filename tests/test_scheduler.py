@@ -0,0 +1,78 @@
+from src.vision.scheduler import ModelScheduler
+
+
+def plans(scheduler, frames):
+    return [scheduler.plan() for _ in range(frames)]
+
+
+def test_strides_follow_screen_needs():
+    scheduler = ModelScheduler()
+    scheduler.set_needs({"hands": 1, "face": 3})
+    runs = plans(scheduler, 9)
+    assert all(p["hands"] for p in runs)
+    assert [p["face"] for p in runs].count(True) == 3
+
+
+def test_unneeded_model_never_runs():
+    scheduler = ModelScheduler()
+    scheduler.set_needs({"hands": 0, "face": 1})
+    assert not any(p["hands"] for p in plans(scheduler, 5))
+    assert scheduler.skips["hands"] == 5
+
+
+def test_newly_needed_model_runs_on_next_frame():
+    scheduler = ModelScheduler()
+    scheduler.set_needs({"hands": 0, "face": 1})
+    plans(scheduler, 2)
+    scheduler.set_needs({"hands": 4, "face": 1})
+    assert scheduler.plan()["hands"]
+
+
+def test_stride_multiplier_slows_every_model():
+    scheduler = ModelScheduler()
+    scheduler.set_needs({"hands": 1, "face": 1})
+    scheduler.set_stride_multiplier(2)
+    runs = plans(scheduler, 6)
+    assert [p["hands"] for p in runs].count(True) == 3
+
+
+def test_no_budget_runs_everything_due():
+    scheduler = ModelScheduler(budget_ms=None)
+    scheduler.record("hands", 50.0)
+    scheduler.record("face", 50.0)
+    assert scheduler.plan() == {"hands": True, "face": True}
+
+
+def test_over_budget_defers_least_needed_model():
+    scheduler = ModelScheduler(budget_ms=30.0)
+    scheduler.set_needs({"hands": 1, "face": 1})
+    scheduler.record("hands", 20.0)
+    scheduler.record("face", 15.0)
+    plan = scheduler.plan()
+    assert plan == {"hands": True, "face": False}  # hands win the tie
+    assert scheduler.budget_deferrals == 1
+
+
+def test_within_budget_runs_both():
+    scheduler = ModelScheduler(budget_ms=30.0)
+    scheduler.record("hands", 12.0)
+    scheduler.record("face", 10.0)
+    assert scheduler.plan() == {"hands": True, "face": True}
+
+
+def test_deferred_model_runs_after_max_defer_frames():
+    scheduler = ModelScheduler(budget_ms=30.0)
+    scheduler.set_needs({"hands": 1, "face": 1})
+    scheduler.record("hands", 25.0)
+    scheduler.record("face", 25.0)
+    face = [p["face"] for p in plans(scheduler, 2 * (ModelScheduler.MAX_DEFER + 1))]
+    # MAX_DEFER deferrals in a row, then it is forced through (even over budget)
+    assert face == ([False] * ModelScheduler.MAX_DEFER + [True]) * 2
+    assert scheduler.budget_deferrals == 2 * ModelScheduler.MAX_DEFER
+
+
+def test_record_is_an_ema():
+    scheduler = ModelScheduler()
+    scheduler.record("hands", 10.0)
+    scheduler.record("hands", 20.0)
+    assert scheduler.cost_ms("hands") == 10.0 * 0.9 + 20.0 * 0.1
@@ -0,0 +1,93 @@
+import cv2
+import pytest
+
+from src.ui.text_layout import TextLayoutEngine
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+TEXT = ("Programul de studii pregateste ingineri in automatica si informatica aplicata, "
+        "cu laboratoare de robotica, sisteme inteligente si retele industriale.")
+
+
+def width(s, scale, thickness=2):
+    return cv2.getTextSize(s, FONT, scale, thickness)[0][0]
+
+
+def greedy_wrap(text, scale, max_width, thickness=2):
+    """The word-by-word loop the engine replaced (reference)."""
+    lines, current = [], []
+    for word in text.split(' '):
+        candidate = " ".join(current + [word])
+        if current and width(candidate, scale, thickness) > max_width:
+            lines.append(" ".join(current))
+            current = [word]
+        else:
+            current.append(word)
+    if current:
+        lines.append(" ".join(current))
+    return tuple(lines)
+
+
+@pytest.mark.parametrize("scale", [0.6, 0.8, 1.1])
+@pytest.mark.parametrize("max_width", [200, 450, 900])
+def test_wrap_matches_greedy_reference(scale, max_width):
+    engine = TextLayoutEngine(max_entries=16)
+    lines = engine.wrap(TEXT, FONT, scale, 2, max_width)
+    assert lines == greedy_wrap(TEXT, scale, max_width)
+    for line in lines:
+        if " " in line:
+            assert width(line, scale) <= max_width
+
+
+def test_word_wider_than_the_box_gets_its_own_line():
+    engine = TextLayoutEngine(max_entries=16)
+    lines = engine.wrap("a Supercalifragilistic b", FONT, 1.0, 2, 60)
+    assert lines == ("a", "Supercalifragilistic", "b")
+
+
+def test_wrap_paragraphs_splits_on_newlines():
+    engine = TextLayoutEngine(max_entries=16)
+    lines = engine.wrap_paragraphs("Titlu\n  Primul rand\n", FONT, 0.7, 2, 1000)
+    assert lines == ("Titlu", "Primul rand")
+
+
+def test_lookups_are_memoized_and_bounded():
+    engine = TextLayoutEngine(max_entries=2)
+    first = engine.wrap(TEXT, FONT, 0.8, 2, 400)
+    assert engine.wrap(TEXT, FONT, 0.8, 2, 400) is first
+    assert engine.stats == {"hits": 1, "misses": 1}
+
+    engine.wrap(TEXT, FONT, 0.8, 2, 500)
+    engine.wrap(TEXT, FONT, 0.8, 2, 600)
+    assert engine.get_stats()["entries"] == 2
+    engine.wrap(TEXT, FONT, 0.8, 2, 400)  # evicted (least recently used)
+    assert engine.stats["misses"] == 4
+
+
+def linear_fit(text, max_w, max_h, scales, line_gap=10, thickness=2):
+    """Largest scale that fits, trying every candidate from the top (reference)."""
+    for scale in scales:
+        lines = greedy_wrap(text, scale, max_w, thickness)
+        (_, h_line), baseline = cv2.getTextSize("Tg", FONT, scale, thickness)
+        fits = all(width(line, scale, thickness) <= max_w for line in lines)
+        if fits and len(lines) * (h_line + baseline + line_gap) <= max_h:
+            return scale
+    return None
+
+
+@pytest.mark.parametrize("box", [(900, 300), (600, 200), (400, 400), (1200, 120)])
+def test_fit_picks_the_largest_fitting_scale(box):
+    engine = TextLayoutEngine(max_entries=16)
+    max_w, max_h = box
+    layout = engine.fit(TEXT, FONT, 2, max_w, max_h)
+    scales = [round(1.5 - i * 0.1, 3) for i in range(11)]
+    assert layout.scale == linear_fit(TEXT, max_w, max_h, scales)
+    assert layout.lines == greedy_wrap(TEXT, layout.scale, max_w)
+    assert len(layout.lines) * layout.line_height <= max_h
+
+
+def test_fit_falls_back_to_one_line_at_min_scale():
+    engine = TextLayoutEngine(max_entries=16)
+    layout = engine.fit(TEXT, FONT, 2, 100, 20, min_scale=0.5)
+    assert layout.scale == 0.5
+    assert layout.lines == (TEXT,)
+    assert layout.widths == (width(TEXT, 0.5),)